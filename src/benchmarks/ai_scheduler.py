@@ -0,0 +1,153 @@
+import asyncio
+import random
+import time
+
+from control.ai_scheduler import AIRequestScheduler
+from control.types import AIRequestPriority
+
+GUILD_COUNT = 4
+NOTIFICATION_COUNT = 120
+INTERACTIVE_COUNT = 30
+DUPLICATE_SHARE = 0.2
+LATENCY = (0.02, 0.08)
+GLOBAL_LIMIT = 8
+GUILD_LIMIT = 3
+SEED = 1337
+
+
+class StubCompletions:
+
+    # stands in for AsyncOpenAI.chat.completions, tracks how many calls overlap
+    def __init__(self):
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.guild_in_flight: dict[int, int] = {}
+        self.max_guild_in_flight = 0
+
+    async def create(self, messages: list[dict[str, str]], model: str, **kwargs):
+        guild_id = kwargs.get("metadata", {}).get("guild_id")
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.guild_in_flight[guild_id] = self.guild_in_flight.get(guild_id, 0) + 1
+        self.max_guild_in_flight = max(
+            self.max_guild_in_flight, self.guild_in_flight[guild_id]
+        )
+        try:
+            await asyncio.sleep(random.uniform(*LATENCY))
+        finally:
+            self.in_flight -= 1
+            self.guild_in_flight[guild_id] -= 1
+        return messages[-1]["content"]
+
+
+class StubChat:
+
+    def __init__(self):
+        self.completions = StubCompletions()
+
+
+class StubAIClient:
+
+    def __init__(self):
+        self.chat = StubChat()
+
+
+def generate_requests() -> list[tuple[float, int, AIRequestPriority, str]]:
+    random.seed(SEED)
+    requests = []
+    for index in range(NOTIFICATION_COUNT):
+        guild_id = index % GUILD_COUNT
+        requests.append(
+            (0, guild_id, AIRequestPriority.BACKGROUND, f"notify {guild_id} {index}")
+        )
+    for index in range(INTERACTIVE_COUNT):
+        guild_id = random.randrange(GUILD_COUNT)
+        prompt = f"reply {guild_id} {index}"
+        if index > 0 and random.random() < DUPLICATE_SHARE:
+            # same prompt sent again while the first one is still pending
+            prompt = requests[-1][3]
+            guild_id = requests[-1][1]
+        delay = random.uniform(0, 0.3)
+        requests.append((delay, guild_id, AIRequestPriority.INTERACTIVE, prompt))
+    return requests
+
+
+async def send_request(
+    scheduler: AIRequestScheduler,
+    delay: float,
+    guild_id: int,
+    priority: AIRequestPriority,
+    prompt: str,
+) -> tuple[AIRequestPriority, float, str]:
+    await asyncio.sleep(delay)
+    start = time.perf_counter()
+    response = await scheduler.create(
+        guild_id,
+        priority,
+        messages=[{"role": "user", "content": prompt}],
+        model="stub",
+        metadata={"guild_id": guild_id},
+    )
+    return priority, time.perf_counter() - start, response
+
+
+async def replay_serial(requests: list[tuple[float, int, AIRequestPriority, str]]):
+    client = StubAIClient()
+    start = time.perf_counter()
+    for _, guild_id, _, prompt in requests:
+        await client.chat.completions.create(
+            messages=[{"role": "user", "content": prompt}],
+            model="stub",
+            metadata={"guild_id": guild_id},
+        )
+    return time.perf_counter() - start
+
+
+async def replay_scheduled(requests: list[tuple[float, int, AIRequestPriority, str]]):
+    client = StubAIClient()
+    scheduler = AIRequestScheduler(lambda: client, GLOBAL_LIMIT, GUILD_LIMIT)
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *[send_request(scheduler, *request) for request in requests]
+    )
+    duration = time.perf_counter() - start
+    return duration, results, scheduler, client.chat.completions
+
+
+def main():
+    requests = generate_requests()
+    print(
+        f"Replaying {NOTIFICATION_COUNT} notification and {INTERACTIVE_COUNT} "
+        f"interactive prompts across {GUILD_COUNT} guilds."
+    )
+
+    serial_time = asyncio.run(replay_serial(requests))
+    scheduled_time, results, scheduler, stub = asyncio.run(replay_scheduled(requests))
+
+    mismatches = sum(
+        response != request[3]
+        for request, (_, _, response) in zip(requests, results, strict=True)
+    )
+
+    print(
+        f"serial {serial_time:.2f}s, scheduled {scheduled_time:.2f}s, "
+        f"speedup {serial_time / scheduled_time:.1f}x"
+    )
+    print(
+        f"upstream calls: {stub.calls}, max in flight: {stub.max_in_flight}/"
+        f"{GLOBAL_LIMIT}, max per guild: {stub.max_guild_in_flight}/{GUILD_LIMIT}, "
+        f"mismatched responses: {mismatches}"
+    )
+    for priority in AIRequestPriority:
+        latencies = [latency for entry, latency, _ in results if entry == priority]
+        print(
+            f"{priority.name.lower()} end to end: "
+            f"mean {sum(latencies) / len(latencies):.3f}s, max {max(latencies):.3f}s"
+        )
+    print(scheduler.metrics.get_summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import random
+import time
+from collections import Counter
+
+import combat.gear.bases as gear_bases
+import combat.skills.skills as skill_bases
+from combat.enemies import BoobaSlime
+from combat.enemies.enemy import Enemy
+from combat.gear.droppable import DroppableBase
+from combat.gear.types import Base, GearBaseType
+from combat.skills.types import SkillType
+from control.combat.combat_gear_manager import CombatGearManager
+
+DROP_COUNT = 100000
+ITEM_LEVELS = [1, 3, 6, 12]
+SEED = 1337
+
+
+def get_base_class(base_type: GearBaseType | SkillType) -> type[DroppableBase]:
+    if isinstance(base_type, GearBaseType):
+        return getattr(gear_bases, base_type.value)
+    return getattr(skill_bases, base_type.value)
+
+
+def legacy_random_base(
+    item_level: int, enemy: Enemy = None, exclude_skills: bool = False
+) -> DroppableBase:
+    # previous implementation, instantiates every base on every roll
+    max_level = item_level
+    min_level = max(1, int(item_level * CombatGearManager.ITEM_LEVEL_MIN_DROP))
+    drop_item_level = random.randint(min_level, max_level)
+
+    base_types = [base_type for base_type in GearBaseType]
+    if not exclude_skills:
+        base_types += [base_type for base_type in SkillType]
+
+    bases = []
+    for base_type in base_types:
+        base = get_base_class(base_type)()
+        if not base.droppable:
+            continue
+        if drop_item_level >= base.min_level and drop_item_level <= base.max_level:
+            bases.append(base)
+
+    if len(bases) <= 0:
+        return None
+
+    if enemy is not None:
+        for base_type in enemy.gear_loot_table + enemy.skill_loot_table:
+            bases.append(get_base_class(base_type)())
+
+    skill_weight = sum(b.weight for b in bases if b.base_type == Base.SKILL)
+    gear_weight = sum(b.weight for b in bases if b.base_type == Base.GEAR)
+
+    skill_mod = 0
+    if not exclude_skills:
+        skill_mod = (
+            CombatGearManager.SKILL_DROP_CHANCE
+            * (skill_weight + gear_weight)
+            / skill_weight
+        )
+
+    weights = []
+    for base in bases:
+        weight = base.weight
+        match base.base_type:
+            case Base.SKILL:
+                weight *= skill_mod
+            case Base.GEAR:
+                weight *= 1 - skill_mod
+        weights.append(weight)
+
+    sum_weights = sum(weights)
+    chances = [v / sum_weights for v in weights]
+    return random.choices(bases, weights=chances)[0]
+
+
+def indexed_random_base(
+    item_level: int, enemy: Enemy = None, exclude_skills: bool = False
+) -> DroppableBase:
+    # mirrors CombatGearManager.get_random_base without building the service
+    max_level = item_level
+    min_level = max(1, int(item_level * CombatGearManager.ITEM_LEVEL_MIN_DROP))
+    drop_item_level = random.randint(min_level, max_level)
+
+    loot_table = ()
+    if enemy is not None:
+        loot_table = tuple(enemy.gear_loot_table + enemy.skill_loot_table)
+
+    return CombatGearManager.BASE_INDEX.get_random_base(
+        drop_item_level, loot_table, exclude_skills
+    )
+
+
+def roll_indexed(item_level: int, enemy: Enemy) -> Counter:
+    drops = Counter()
+    for _ in range(DROP_COUNT):
+        base = indexed_random_base(item_level, enemy=enemy)
+        drops[base.type] += 1
+    return drops
+
+
+def roll_legacy(item_level: int, enemy: Enemy) -> Counter:
+    drops = Counter()
+    for _ in range(DROP_COUNT):
+        base = legacy_random_base(item_level, enemy=enemy)
+        drops[base.type] += 1
+    return drops
+
+
+def main():
+    enemy = BoobaSlime()
+
+    print(f"Rolling {DROP_COUNT} drops per item level.")
+    for item_level in ITEM_LEVELS:
+        random.seed(SEED)
+        start = time.perf_counter()
+        legacy_drops = roll_legacy(item_level, enemy)
+        legacy_time = time.perf_counter() - start
+
+        random.seed(SEED)
+        start = time.perf_counter()
+        indexed_drops = roll_indexed(item_level, enemy)
+        indexed_time = time.perf_counter() - start
+
+        deviation = max(
+            abs(legacy_drops[key] - indexed_drops[key]) / DROP_COUNT
+            for key in legacy_drops.keys() | indexed_drops.keys()
+        )
+
+        print(
+            f"lvl {item_level:>2}: legacy {legacy_time:.3f}s, "
+            f"indexed {indexed_time:.3f}s, "
+            f"speedup {legacy_time / indexed_time:.1f}x, "
+            f"max deviation {deviation:.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import collections
+import datetime
+import itertools
+import random
+import time
+
+from datalayer.police_list import PoliceList
+
+USER_COUNT = 5000
+MESSAGE_COUNT = 200000
+SPAMMER_SHARE = 0.05
+MESSAGE_LIMIT = 5
+MESSAGE_LIMIT_INTERVAL = 10
+IDLE_TIMEOUT = 600
+SEED = 1337
+
+
+class LegacyPoliceListNode:
+
+    # previous implementation, rescans the queue for every offset
+    def __init__(self, author_id: int):
+        self.author_id = author_id
+        self.spam_message_queue = collections.deque(maxlen=50)
+
+    def __threshold_check(
+        self, queue: collections.deque, interval: int, limit: int, offset: int = 0
+    ) -> bool:
+        if len(queue) < (limit + offset):
+            return False
+
+        min_time = datetime.datetime.max
+        max_time = datetime.datetime.min
+
+        slice_start = len(queue) - (limit + offset)
+        slice_end = len(queue) - offset
+
+        slice_result = list(itertools.islice(queue, slice_start, slice_end))
+
+        for timestamp in slice_result:
+            min_time = min([min_time, timestamp.replace(tzinfo=None)])
+            max_time = max([max_time, timestamp.replace(tzinfo=None)])
+
+        difference = max_time - min_time
+        return difference.total_seconds() < interval
+
+    def track_spam_message(self, message_timestamp: datetime.datetime) -> None:
+        self.spam_message_queue.append(message_timestamp)
+
+    def spam_check(self, interval: int, limit: int, offset: int = 0) -> bool:
+        return self.__threshold_check(self.spam_message_queue, interval, limit, offset)
+
+    def check_spam_score_increase(self, interval: int, limit: int) -> bool:
+        offset = 0
+        while self.spam_check(interval, limit, offset):
+            offset += 1
+
+        return offset == 1 or (offset - 1) % limit == 0
+
+
+def generate_messages() -> list[tuple[int, datetime.datetime]]:
+    random.seed(SEED)
+    spammers = list(range(int(USER_COUNT * SPAMMER_SHARE)))
+    timestamp = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+
+    messages = []
+    while len(messages) < MESSAGE_COUNT:
+        timestamp += datetime.timedelta(milliseconds=random.randint(1, 50))
+        if random.random() < 0.5:
+            # spammers post short bursts of several messages a second
+            author_id = random.choice(spammers)
+            for _ in range(random.randint(1, 12)):
+                timestamp += datetime.timedelta(milliseconds=random.randint(1, 300))
+                messages.append((author_id, timestamp))
+        else:
+            messages.append((random.randrange(USER_COUNT), timestamp))
+
+    return messages[:MESSAGE_COUNT]
+
+
+def replay_legacy(messages: list[tuple[int, datetime.datetime]]) -> list[bool]:
+    users: dict[int, LegacyPoliceListNode] = {}
+    decisions = []
+    for author_id, timestamp in messages:
+        if author_id not in users:
+            users[author_id] = LegacyPoliceListNode(author_id)
+        user_node = users[author_id]
+        user_node.track_spam_message(timestamp)
+        decisions.append(
+            user_node.spam_check(MESSAGE_LIMIT_INTERVAL, MESSAGE_LIMIT)
+            and user_node.check_spam_score_increase(
+                MESSAGE_LIMIT_INTERVAL, MESSAGE_LIMIT
+            )
+        )
+    return decisions
+
+
+def replay_windowed(
+    messages: list[tuple[int, datetime.datetime]],
+) -> tuple[list[bool], PoliceList]:
+    user_list = PoliceList(IDLE_TIMEOUT)
+    decisions = []
+    for author_id, timestamp in messages:
+        if not user_list.has_user(author_id):
+            user_list.add_user(author_id)
+        user_node = user_list.get_user(author_id)
+        user_list.track_spam_message(author_id, timestamp)
+        user_list.evict_idle_users(timestamp)
+        decisions.append(
+            user_node.spam_check(MESSAGE_LIMIT_INTERVAL, MESSAGE_LIMIT)
+            and user_node.check_spam_score_increase(
+                MESSAGE_LIMIT_INTERVAL, MESSAGE_LIMIT
+            )
+        )
+    return decisions, user_list
+
+
+def main():
+    messages = generate_messages()
+    duration = (messages[-1][1] - messages[0][1]).total_seconds()
+    print(
+        f"Replaying {len(messages)} messages from {USER_COUNT} users "
+        f"over {duration:.0f}s."
+    )
+
+    start = time.perf_counter()
+    legacy_decisions = replay_legacy(messages)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    windowed_decisions, user_list = replay_windowed(messages)
+    windowed_time = time.perf_counter() - start
+
+    # the legacy queue caps streaks at 50 messages, longer bursts may differ
+    mismatches = sum(
+        legacy != windowed
+        for legacy, windowed in zip(legacy_decisions, windowed_decisions, strict=True)
+    )
+
+    print(
+        f"legacy {legacy_time:.3f}s ({len(messages) / legacy_time:.0f} msg/s), "
+        f"windowed {windowed_time:.3f}s ({len(messages) / windowed_time:.0f} msg/s), "
+        f"speedup {legacy_time / windowed_time:.1f}x"
+    )
+    print(
+        f"spam score increases: {sum(windowed_decisions)}, "
+        f"mismatches: {mismatches}, "
+        f"tracked users after eviction: {len(user_list.users)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
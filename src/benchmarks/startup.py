@@ -0,0 +1,99 @@
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from bot import CrunchyBot
+from control.startup_profiler import StartupProfiler
+from datalayer.database import Database
+
+RUNS = 5
+DEFERRED_MODULES = ["openai", "tiktoken", "PIL", "requests"]
+
+IMPORT_SCRIPT = f"""
+import importlib
+import sys
+import time
+
+start = time.perf_counter()
+from bot import CrunchyBot
+
+for extension in CrunchyBot.EXTENSIONS:
+    importlib.import_module(extension)
+boot = time.perf_counter() - start
+
+loaded = [name for name in {DEFERRED_MODULES!r} if name in sys.modules]
+
+start = time.perf_counter()
+for name in {DEFERRED_MODULES!r}:
+    importlib.import_module(name)
+deferred = time.perf_counter() - start
+
+print(boot, deferred, len(sys.modules), ",".join(loaded))
+"""
+
+
+class StubLogger:
+
+    def log(self, *args, **kwargs):
+        pass
+
+
+def measure_imports() -> tuple[list[float], list[float], int, str]:
+    boot_times = []
+    deferred_times = []
+    for _ in range(RUNS):
+        # a fresh interpreter per run, otherwise everything is already cached
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.split()
+        boot_times.append(float(output[0]))
+        deferred_times.append(float(output[1]))
+        module_count = int(output[2])
+        loaded = output[3] if len(output) > 3 else ""
+    return boot_times, deferred_times, module_count, loaded
+
+
+async def measure_database(db_file: str) -> StartupProfiler:
+    profiler = StartupProfiler()
+    logger = StubLogger()
+    database = Database(
+        None, logger, db_file, reader_count=CrunchyBot.DB_READER_CONNECTIONS
+    )
+    with profiler.phase("database connect"):
+        await database.connect()
+    with profiler.phase("database create tables"):
+        await database.create_tables()
+    with profiler.phase("database migrate"):
+        await database.migrate()
+    await database.close()
+    return profiler
+
+
+def main():
+    boot_times, deferred_times, module_count, loaded = measure_imports()
+    print(
+        f"cold import of bot and {len(CrunchyBot.EXTENSIONS)} extensions over {RUNS} runs: "
+        f"median {statistics.median(boot_times) * 1000:.0f}ms, "
+        f"min {min(boot_times) * 1000:.0f}ms, {module_count} modules"
+    )
+    print(
+        f"deferred to first use ({', '.join(DEFERRED_MODULES)}): "
+        f"median {statistics.median(deferred_times) * 1000:.0f}ms, "
+        f"imported at boot: {loaded or 'none'}"
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_file = os.path.join(directory, "database.sqlite")
+        for label in ["fresh database", "existing database"]:
+            profiler = asyncio.run(measure_database(db_file))
+            print(f"{label}: {profiler.get_summary()}")
+
+
+if __name__ == "__main__":
+    main()
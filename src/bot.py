@@ -1,8 +1,11 @@
+import importlib
 from typing import Any
 
 import discord
 from control.controller import Controller
 from control.logger import BotLogger
+from control.settings_manager import SettingsManager
+from control.startup_profiler import StartupProfiler
 from datalayer.database import Database
 from discord.ext import commands
 
@@ -12,28 +15,72 @@ class CrunchyBot(commands.Bot):
     LOG_FILE = "./log/marabot.log"
     TENOR_TOKEN_FILE = "tenor.txt"
     DB_FILE = "database.sqlite"
+    DB_READER_CONNECTIONS = 4
+
+    EXTENSIONS = [
+        "cogs.police",
+        "cogs.jail",
+        "cogs.interactions",
+        "cogs.statistics",
+        "cogs.quotes",
+        "cogs.beans.shop",
+        "cogs.beans.gamba",
+        "cogs.beans.beans",
+        "cogs.bully",
+        "cogs.chat",
+        "cogs.combat",
+    ]
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
+        self.startup_profiler = StartupProfiler()
 
     async def setup_hook(self) -> None:
-        self.logger = BotLogger(self, self.LOG_FILE)
-        self.database = Database(self, self.logger, self.DB_FILE)
-        self.controller = Controller(self, self.logger, self.database)
-
-        await self.database.create_tables()
-
-        await self.load_extension("cogs.police")
-        await self.load_extension("cogs.jail")
-        await self.load_extension("cogs.interactions")
-        await self.load_extension("cogs.statistics")
-        await self.load_extension("cogs.quotes")
-        await self.load_extension("cogs.beans.shop")
-        await self.load_extension("cogs.beans.gamba")
-        await self.load_extension("cogs.beans.beans")
-        await self.load_extension("cogs.bully")
-        await self.load_extension("cogs.chat")
-        await self.load_extension("cogs.combat")
+        profiler = self.startup_profiler
+
+        with profiler.phase("logger"):
+            self.logger = BotLogger(self, self.LOG_FILE)
+        with profiler.phase("database init"):
+            self.database = Database(
+                self, self.logger, self.DB_FILE, reader_count=self.DB_READER_CONNECTIONS
+            )
+            self.controller = Controller(self, self.logger, self.database)
+
+        with profiler.phase("database connect"):
+            await self.database.connect()
+        with profiler.phase("database create tables"):
+            await self.database.create_tables()
+        with profiler.phase("database migrate"):
+            await self.database.migrate()
+
+        with profiler.phase("settings"):
+            settings_manager: SettingsManager = self.controller.get_service(
+                SettingsManager
+            )
+            await settings_manager.load_settings()
+
+        for extension in self.EXTENSIONS:
+            # importing first splits module import time from cog setup time
+            with profiler.phase(f"import {extension}"):
+                importlib.import_module(extension)
+            with profiler.phase(f"load {extension}"):
+                await self.load_extension(extension)
+
+        self.logger.log(
+            "init",
+            f"Setup finished after {profiler.get_elapsed():.2f}s.",
+        )
+
+    async def on_ready(self) -> None:
+        if self.startup_profiler.finished:
+            return
+        self.startup_profiler.finished = True
+        self.logger.log("init", self.startup_profiler.get_summary())
+
+    async def close(self) -> None:
+        await super().close()
+        if hasattr(self, "database"):
+            await self.database.close()
 
     async def on_guild_join(self, guild):
         self.logger.log(guild.id, "new guild registered.")
@@ -1,7 +1,6 @@
 import json
 from typing import Any
 
-import requests
 from discord.ext import commands
 
 
@@ -95,6 +94,8 @@ class Tenor:
         params["client_key"] = "MaraBot"
         params["media_filter"] = "gif"
 
+        import requests
+
         response = requests.get(
             "https://tenor.googleapis.com/v2/search", params=params, timeout=60
         )
@@ -346,6 +346,39 @@ class BeansBasics(BeansGroup):
         output = "Action complete."
         await self.bot.command_response(self.__cog_name__, interaction, output)
 
+    @app_commands.command(
+        name="balance_ledger",
+        description="Verify or rebuild the stored beans balances from the beans history.",
+    )
+    @app_commands.describe(action="Verify only reports mismatches, rebuild recalculates.")
+    @app_commands.check(__has_permission)
+    @app_commands.guild_only()
+    async def balance_ledger(
+        self,
+        interaction: discord.Interaction,
+        action: typing.Literal["verify", "rebuild"],
+    ) -> None:
+        await interaction.response.defer(ephemeral=True)
+        guild_id = interaction.guild_id
+
+        if action == "rebuild":
+            await self.database.rebuild_beans_balances(guild_id)
+
+        mismatches = await self.database.verify_beans_balances(guild_id)
+
+        if len(mismatches) == 0:
+            output = "Beans balances match the beans history."
+        else:
+            output = "Beans balances differ from the beans history:\n"
+            for season, members in mismatches.items():
+                output += f"**{season.value}**: {len(members)} member(s)\n"
+                for member_id, (expected, actual) in list(members.items())[:10]:
+                    output += f"<@{member_id}>: expected 🅱️{expected}, stored 🅱️{actual}\n"
+
+        await self.bot.command_response(
+            self.__cog_name__, interaction, output, args=[action]
+        )
+
     @app_commands.command(
         name="settings",
         description="Overview of all beans related settings and their current value.",
@@ -1,9 +1,11 @@
+import asyncio
 import datetime
 
 import discord
 from bot import CrunchyBot
 from control.ai_manager import AIManager
-from control.types import AIVersion
+from control.garden_manager import GardenManager
+from control.types import AIRequestPriority, AIVersion
 from discord import app_commands
 from discord.ext import commands, tasks
 from events.garden_event import GardenEvent
@@ -21,6 +23,7 @@ class Garden(BeansGroup):
     def __init__(self, bot: CrunchyBot) -> None:
         super().__init__(bot)
         self.ai_manager: AIManager = self.controller.get_service(AIManager)
+        self.garden_manager: GardenManager = self.controller.get_service(GardenManager)
 
     @staticmethod
     async def __has_permission(interaction: discord.Interaction) -> bool:
@@ -84,7 +87,8 @@ class Garden(BeansGroup):
 
         for guild in self.bot.guilds:
 
-            gardens = await self.database.get_guild_gardens(guild.id)
+            recipients: list[discord.User] = []
+            gardens = await self.garden_manager.get_due_gardens(guild.id)
             for garden in gardens:
                 plots = garden.notification_pending_plots()
                 if len(plots) > 0:
@@ -100,29 +104,56 @@ class Garden(BeansGroup):
                         )
                         await self.controller.dispatch_event(event)
                     if user is not None:
-                        self.logger.log(
-                            "sys",
-                            f"Sending garden notification to {user.display_name}",
-                            cog=self.__cog_name__,
-                        )
-                        # message = (
-                        #     f"Hey there, some of your plants on {guild.name} are ready to be harvested.\n"
-                        #     "Make sure to drop by and visit your */beans garden* to not miss out on your rewards!"
-                        # )
-
-                        prompt = (
-                            f"Please create a short notification message adressed to a user named {user.display_name}. "
-                            f"Inform them about their beans garden on server {guild.name} having some plants that are ready for harvest. "
-                            "Also mention that they should come visit their garden soon to take care of them so they wont miss out on the rewards. "
-                        )
+                        recipients.append(user)
+
+            if len(recipients) > 0:
+                await self.__send_garden_notifications(guild, recipients)
+
+    async def __send_garden_notification(
+        self, guild: discord.Guild, user: discord.User
+    ):
+        self.logger.log(
+            "sys",
+            f"Sending garden notification to {user.display_name}",
+            cog=self.__cog_name__,
+        )
+        # message = (
+        #     f"Hey there, some of your plants on {guild.name} are ready to be harvested.\n"
+        #     "Make sure to drop by and visit your */beans garden* to not miss out on your rewards!"
+        # )
+
+        prompt = (
+            f"Please create a short notification message adressed to a user named {user.display_name}. "
+            f"Inform them about their beans garden on server {guild.name} having some plants that are ready for harvest. "
+            "Also mention that they should come visit their garden soon to take care of them so they wont miss out on the rewards. "
+        )
 
-                        message = await self.ai_manager.prompt(
-                            name=user.display_name,
-                            text_prompt=prompt,
-                            ai_version=AIVersion.GPT4,
-                        )
+        message = await self.ai_manager.prompt(
+            name=user.display_name,
+            text_prompt=prompt,
+            ai_version=AIVersion.GPT4,
+            guild_id=guild.id,
+            priority=AIRequestPriority.BACKGROUND,
+        )
+
+        await user.send(message)
 
-                        await user.send(message)
+    async def __send_garden_notifications(
+        self, guild: discord.Guild, recipients: list[discord.User]
+    ):
+        # prompts are fanned out at once, the ai scheduler keeps them
+        # behind interactive requests and within the guild limit
+        results = await asyncio.gather(
+            *[self.__send_garden_notification(guild, user) for user in recipients],
+            return_exceptions=True,
+        )
+        for user, result in zip(recipients, results, strict=True):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    guild.id,
+                    f"Garden notification to {user.display_name} failed: {result}",
+                    self.__cog_name__,
+                )
 
     @app_commands.command(name="garden", description="Plant beans in your garden.")
     @app_commands.guild_only()
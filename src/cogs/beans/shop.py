@@ -108,17 +108,14 @@ class Shop(commands.Cog):
     async def shop_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
-        items = [
-            await self.item_manager.get_item(interaction.guild_id, enum)
-            for enum in ItemType
-        ]
+        catalog = await self.item_manager.get_item_catalog(interaction.guild_id)
 
         choices = [
             app_commands.Choice(
                 name=item.name,
                 value=item.type,
             )
-            for item in items
+            for item in catalog.items.values()
             if current.lower() in item.name.lower()
         ][:25]
         return choices
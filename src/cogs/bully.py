@@ -156,25 +156,25 @@ class Bully(commands.Cog):
 
         match item_type:
             case ItemType.HIGH_AS_FRICK:
-                generated_content = await self.ai_manager.stonerfy(content)
+                generated_content = await self.ai_manager.stonerfy(content, guild_id)
             case ItemType.EGIRL_DEBUFF:
-                generated_content = await self.ai_manager.uwufy(content)
+                generated_content = await self.ai_manager.uwufy(content, guild_id)
             case ItemType.RELIGION_DEBUFF:
-                generated_content = await self.ai_manager.religify(content)
+                generated_content = await self.ai_manager.religify(content, guild_id)
             case ItemType.ALCOHOL_DEBUFF:
-                generated_content = await self.ai_manager.alcoholify(content)
+                generated_content = await self.ai_manager.alcoholify(content, guild_id)
             case ItemType.WEEB_DEBUFF:
-                generated_content = await self.ai_manager.weebify(content)
+                generated_content = await self.ai_manager.weebify(content, guild_id)
             case ItemType.BRIT_DEBUFF:
-                generated_content = await self.ai_manager.britify(content)
+                generated_content = await self.ai_manager.britify(content, guild_id)
             case ItemType.MEOW_DEBUFF:
-                generated_content = await self.ai_manager.meowify(content)
+                generated_content = await self.ai_manager.meowify(content, guild_id)
             case ItemType.NERD_DEBUFF:
-                generated_content = await self.ai_manager.nerdify(content)
+                generated_content = await self.ai_manager.nerdify(content, guild_id)
             case ItemType.TRUMP_DEBUFF:
-                generated_content = await self.ai_manager.trumpify(content)
+                generated_content = await self.ai_manager.trumpify(content, guild_id)
             case ItemType.MACHO_DEBUFF:
-                generated_content = await self.ai_manager.machofy(content)
+                generated_content = await self.ai_manager.machofy(content, guild_id)
 
         generated_content = (
             generated_content + f"\n||original message: {original_message}||"
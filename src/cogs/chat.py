@@ -63,6 +63,12 @@ class Chat(commands.Cog):
                 "sys", f"Cleaned up {count} old ai chat logs.", cog=self.__cog_name__
             )
 
+        self.logger.debug(
+            "sys",
+            f"AI request metrics: {self.ai_manager.scheduler.metrics.get_summary()}",
+            cog=self.__cog_name__,
+        )
+
     async def __karma_giving(
         self,
         interaction: discord.Interaction,
@@ -331,7 +331,7 @@ class Combat(commands.Cog):
     async def enemy_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
-        enemies = [await self.factory.get_enemy(enum) for enum in EnemyType]
+        enemies = await self.factory.get_enemies()
 
         choices = [
             app_commands.Choice(
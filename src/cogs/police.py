@@ -256,6 +256,7 @@ class Police(commands.Cog):
         user_node = user_list.get_user(author_id)
 
         user_list.track_spam_message(author_id, message.created_at)
+        user_list.evict_idle_users(message.created_at)
 
         if user_node.spam_check(
             message_limit_interval, message_limit
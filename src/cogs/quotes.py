@@ -1,3 +1,5 @@
+import asyncio
+
 import discord
 from bot import CrunchyBot
 from control.controller import Controller
@@ -9,7 +11,6 @@ from datalayer.quote import Quote
 from discord import app_commands
 from discord.ext import commands
 from events.quote_event import QuoteEvent
-from view.image_generator import ImageGenerator
 
 
 class Quotes(commands.Cog):
@@ -23,6 +24,7 @@ class Quotes(commands.Cog):
         self.settings_manager: SettingsManager = self.controller.get_service(
             SettingsManager
         )
+        self.image_generator_task: asyncio.Future | None = None
 
         self.ctx_menu = app_commands.ContextMenu(
             name="Quote",
@@ -62,8 +64,42 @@ class Quotes(commands.Cog):
             args=[interaction.user.display_name, message.author.display_name],
         )
 
+    def __create_image_generator(self):
+        from view.image_generator import ImageGenerator
+
+        return ImageGenerator(self.bot)
+
+    def __start_image_generator(self) -> asyncio.Future:
+        # PIL and the quote assets are loaded in a worker thread, decoding the
+        # backgrounds on the event loop would stall every other command
+        if self.image_generator_task is None:
+            loop = asyncio.get_running_loop()
+            self.image_generator_task = asyncio.ensure_future(
+                loop.run_in_executor(None, self.__create_image_generator)
+            )
+        return self.image_generator_task
+
+    async def get_image_generator(self):
+        try:
+            return await self.__start_image_generator()
+        except Exception:
+            # let the next request retry instead of failing forever
+            self.image_generator_task = None
+            raise
+
+    async def cog_unload(self) -> None:
+        task = self.image_generator_task
+        if task is None:
+            return
+        if not task.done():
+            task.cancel()
+            return
+        if not task.cancelled() and task.exception() is None:
+            task.result().executor.shutdown(wait=False)
+
     @commands.Cog.listener()
     async def on_ready(self):
+        self.__start_image_generator()
         self.logger.log(
             "init", str(self.__cog_name__) + " loaded.", cog=self.__cog_name__
         )
@@ -80,7 +116,6 @@ class Quotes(commands.Cog):
     ):
         await interaction.response.defer()
 
-        image_generator = ImageGenerator(self.bot)
         if user is not None:
             quote = await self.database.get_random_quote_by_user(
                 interaction.guild_id, user.id
@@ -88,7 +123,8 @@ class Quotes(commands.Cog):
         else:
             quote = await self.database.get_random_quote(interaction.guild_id)
 
-        image = image_generator.from_quote(quote)
+        image_generator = await self.get_image_generator()
+        image = await image_generator.from_quote(quote)
 
         result_image = discord.File(image, "img.png")
 
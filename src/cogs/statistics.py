@@ -59,6 +59,14 @@ class Statistics(commands.Cog):
             cog=self.__cog_name__,
         )
 
+        for metrics in self.controller.get_slowest_listeners():
+            self.logger.debug(
+                "sys",
+                f"Listener {metrics.name}: {metrics.calls} calls, {metrics.failures} failed, "
+                f"avg {metrics.get_average_time() * 1000:.1f}ms, max {metrics.max_time * 1000:.1f}ms",
+                cog=self.__cog_name__,
+            )
+
     @commands.command()
     @commands.guild_only()
     async def sync(
@@ -0,0 +1,253 @@
+import random
+
+from combat.actors import Opponent
+from combat.enemies.enemy import Enemy
+from combat.equipment import CharacterEquipment
+from combat.gear.types import CharacterAttribute, GearModifierType
+from combat.skills.skill import Skill
+from combat.skills.types import SkillEffect, SkillInstance
+from config import Config
+
+
+class SkillRoll:
+
+    def __init__(
+        self,
+        weapon_min_roll: float,
+        weapon_max_roll: float,
+        skill_base: float,
+        modifier: float,
+        encounter_scaling: float,
+        crit_rate: float,
+        critical_modifier: float,
+        attack_count: int,
+    ):
+        self.weapon_min_roll = weapon_min_roll
+        self.weapon_max_roll = weapon_max_roll
+        self.skill_base = skill_base
+        self.modifier = modifier
+        self.encounter_scaling = encounter_scaling
+        self.crit_rate = crit_rate
+        self.critical_modifier = critical_modifier
+        self.attack_count = attack_count
+
+    def get_instances(
+        self, force_min: bool = False, force_max: bool = False
+    ) -> list[SkillInstance]:
+        skill_instances = []
+        for _ in range(self.attack_count):
+
+            if force_min:
+                weapon_roll = self.weapon_min_roll
+            elif force_max:
+                weapon_roll = self.weapon_max_roll
+            else:
+                weapon_roll = random.randint(
+                    int(self.weapon_min_roll), int(self.weapon_max_roll)
+                )
+
+            crit_roll = random.random()
+            critical_hit = False
+            critical_modifier = 1
+            if crit_roll < self.crit_rate:
+                critical_hit = True
+                critical_modifier = self.critical_modifier
+
+            skill_instance = SkillInstance(
+                weapon_roll=weapon_roll,
+                skill_base=self.skill_base,
+                modifier=self.modifier,
+                critical_modifier=critical_modifier,
+                encounter_scaling=self.encounter_scaling,
+                is_crit=critical_hit,
+            )
+            skill_instances.append(skill_instance)
+
+        return skill_instances
+
+
+class DamageReduction:
+
+    def __init__(self, modifier: float, flat_reduction: int):
+        self.modifier = modifier
+        self.flat_reduction = flat_reduction
+
+    def apply(self, incoming_damage: int) -> int:
+        return int(max(0, ((incoming_damage * self.modifier) - self.flat_reduction)))
+
+
+class CombatFormulas:
+
+    @staticmethod
+    def get_character_skill_roll(
+        equipment: CharacterEquipment,
+        base_dmg_type: SkillEffect,
+        skill: Skill,
+        combatant_count: int = 1,
+    ) -> SkillRoll:
+        weapon_min_roll = equipment.weapon.modifiers[GearModifierType.WEAPON_DAMAGE_MIN]
+        weapon_max_roll = equipment.weapon.modifiers[GearModifierType.WEAPON_DAMAGE_MAX]
+
+        modifier = 1
+
+        encounter_scaling = 1
+        if combatant_count > 1:
+            encounter_scaling = (
+                1 / combatant_count * Config.CHARACTER_ENCOUNTER_SCALING_FACOTR
+            )
+
+        match skill.base_skill.skill_effect:
+            case SkillEffect.PHYSICAL_DAMAGE:
+                modifier += equipment.attributes[
+                    CharacterAttribute.PHYS_DAMAGE_INCREASE
+                ]
+                if base_dmg_type != skill.base_skill.skill_effect:
+                    modifier *= Config.SKILL_TYPE_PENALTY
+            case SkillEffect.MAGICAL_DAMAGE:
+                modifier += equipment.attributes[
+                    CharacterAttribute.MAGIC_DAMAGE_INCREASE
+                ]
+                if base_dmg_type != skill.base_skill.skill_effect:
+                    modifier *= Config.SKILL_TYPE_PENALTY
+            case SkillEffect.HEALING:
+                encounter_scaling = 1
+                weapon_lvl = equipment.weapon.level
+                base_roll = Config.OPPONENT_DAMAGE_BASE[weapon_lvl]
+                weapon_min_roll = base_roll * (1 - Config.OPPONENT_DAMAGE_VARIANCE)
+                weapon_max_roll = base_roll * (1 + Config.OPPONENT_DAMAGE_VARIANCE)
+                modifier += equipment.attributes[CharacterAttribute.HEALING_BONUS]
+
+        return SkillRoll(
+            weapon_min_roll=weapon_min_roll,
+            weapon_max_roll=weapon_max_roll,
+            skill_base=skill.base_skill.base_value,
+            modifier=modifier,
+            encounter_scaling=encounter_scaling,
+            crit_rate=equipment.attributes[CharacterAttribute.CRIT_RATE],
+            critical_modifier=equipment.attributes[CharacterAttribute.CRIT_DAMAGE],
+            attack_count=skill.base_skill.hits,
+        )
+
+    @staticmethod
+    def get_opponent_skill_roll(
+        opponent: Opponent,
+        skill: Skill,
+        combatant_count: int = 1,
+    ) -> SkillRoll:
+        skill_scaling = skill.base_skill.base_value / opponent.average_skill_multi
+
+        effective_level = opponent.level
+        if opponent.enemy.is_boss:
+            effective_level += 1
+
+        base_damage = (
+            Config.OPPONENT_DAMAGE_BASE[effective_level] / opponent.enemy.damage_scaling
+        )
+
+        weapon_min_roll = int(base_damage * (1 - Config.OPPONENT_DAMAGE_VARIANCE))
+        weapon_max_roll = int(base_damage * (1 + Config.OPPONENT_DAMAGE_VARIANCE))
+
+        modifier = pow(
+            Config.OPPONENT_LEVEL_SCALING_FACTOR,
+            (opponent.level - opponent.enemy.min_level),
+        )
+
+        match skill.base_skill.skill_effect:
+            case SkillEffect.PHYSICAL_DAMAGE:
+                modifier += opponent.enemy.attributes[
+                    CharacterAttribute.PHYS_DAMAGE_INCREASE
+                ]
+            case SkillEffect.MAGICAL_DAMAGE:
+                modifier += opponent.enemy.attributes[
+                    CharacterAttribute.MAGIC_DAMAGE_INCREASE
+                ]
+            case SkillEffect.HEALING:
+                modifier += opponent.enemy.attributes[CharacterAttribute.HEALING_BONUS]
+
+        encounter_scaling = opponent.enemy.min_encounter_scale
+        raw_attack_count = skill.base_skill.hits
+        attack_count = raw_attack_count
+
+        if (
+            combatant_count > opponent.enemy.min_encounter_scale
+            and not skill.base_skill.aoe
+        ):
+            encounter_scale = combatant_count - (opponent.enemy.min_encounter_scale - 1)
+            attack_count_scaling = max(1, encounter_scale * 0.75)
+            attack_count = int(raw_attack_count * attack_count_scaling)
+            encounter_scaling += (
+                encounter_scale
+                * Config.OPPONENT_ENCOUNTER_SCALING_FACTOR
+                * raw_attack_count
+                / attack_count
+            ) - 1
+
+        return SkillRoll(
+            weapon_min_roll=weapon_min_roll,
+            weapon_max_roll=weapon_max_roll,
+            skill_base=skill_scaling,
+            modifier=modifier,
+            encounter_scaling=encounter_scaling,
+            crit_rate=opponent.enemy.attributes[CharacterAttribute.CRIT_RATE],
+            critical_modifier=opponent.enemy.attributes[CharacterAttribute.CRIT_DAMAGE],
+            attack_count=attack_count,
+        )
+
+    @staticmethod
+    def get_character_damage_reduction(
+        equipment: CharacterEquipment, skill_effect: SkillEffect
+    ) -> DamageReduction:
+        modifier = 1
+        flat_reduction = 0
+
+        match skill_effect:
+            case SkillEffect.PHYSICAL_DAMAGE:
+                modifier -= equipment.attributes[CharacterAttribute.DAMAGE_REDUCTION]
+                flat_reduction = int(
+                    equipment.gear_modifiers[GearModifierType.ARMOR] / 4
+                )
+            case (
+                SkillEffect.NEUTRAL_DAMAGE
+                | SkillEffect.MAGICAL_DAMAGE
+                | SkillEffect.STATUS_EFFECT_DAMAGE
+            ):
+                modifier -= equipment.attributes[CharacterAttribute.DAMAGE_REDUCTION]
+            case SkillEffect.HEALING:
+                pass
+
+        return DamageReduction(modifier, flat_reduction)
+
+    @staticmethod
+    def get_opponent_damage_reduction(
+        enemy: Enemy, skill_effect: SkillEffect
+    ) -> DamageReduction:
+        modifier = 1
+
+        match skill_effect:
+            case (
+                SkillEffect.PHYSICAL_DAMAGE
+                | SkillEffect.NEUTRAL_DAMAGE
+                | SkillEffect.MAGICAL_DAMAGE
+                | SkillEffect.STATUS_EFFECT_DAMAGE
+            ):
+                modifier -= enemy.attributes[CharacterAttribute.DAMAGE_REDUCTION]
+            case SkillEffect.HEALING:
+                pass
+
+        return DamageReduction(modifier, 0)
+
+    @staticmethod
+    def get_enemy_health(enemy: Enemy, encounter_level: int) -> float:
+        effective_encounter_level = encounter_level
+        if enemy.is_boss:
+            effective_encounter_level += 1
+
+        enemy_health = (
+            enemy.health
+            * Config.ENEMY_HEALTH_SCALING[effective_encounter_level]
+            * Config.AVERAGE_PLAYER_POTENCY
+        )
+        enemy_health *= pow(
+            Config.ENEMY_HEALTH_LVL_FALLOFF, (encounter_level - enemy.min_level)
+        )
+        return enemy_health
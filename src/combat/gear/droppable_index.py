@@ -0,0 +1,179 @@
+import bisect
+import itertools
+import random
+
+import combat.gear.bases as gear_bases
+import combat.skills.skills as skill_bases
+from combat.gear.droppable import DroppableBase
+from combat.gear.types import Base, GearBaseType
+from combat.skills.types import SkillType
+
+
+class DroppableEntry:
+
+    def __init__(
+        self,
+        base_class: type[DroppableBase],
+        base_type: Base,
+        weight: float,
+        min_level: int,
+        max_level: int,
+        droppable: bool,
+    ):
+        self.base_class = base_class
+        self.base_type = base_type
+        self.weight = weight
+        self.min_level = min_level
+        self.max_level = max_level
+        self.droppable = droppable
+
+
+class DroppableTable:
+
+    def __init__(
+        self,
+        entries: list[DroppableEntry],
+        skill_drop_chance: float,
+        exclude_skills: bool,
+    ):
+        self.entries = entries
+
+        skill_weight = sum(
+            entry.weight for entry in entries if entry.base_type == Base.SKILL
+        )
+        gear_weight = sum(
+            entry.weight for entry in entries if entry.base_type == Base.GEAR
+        )
+
+        skill_mod = 0
+        if not exclude_skills and skill_weight > 0:
+            skill_mod = skill_drop_chance * (skill_weight + gear_weight) / skill_weight
+
+        weights = []
+        for entry in entries:
+            weight = entry.weight
+            match entry.base_type:
+                case Base.SKILL:
+                    weight *= skill_mod
+                case Base.GEAR:
+                    weight *= 1 - skill_mod
+            weights.append(weight)
+
+        self.weights = weights
+        self.cum_weights = list(itertools.accumulate(weights))
+        self.total = self.cum_weights[-1]
+
+    def sample(self) -> DroppableEntry:
+        # same lookup random.choices does, without rebuilding the weight vector
+        index = bisect.bisect(
+            self.cum_weights, random.random() * self.total, 0, len(self.entries) - 1
+        )
+        return self.entries[index]
+
+
+class DroppableBaseIndex:
+
+    def __init__(self, skill_drop_chance: float):
+        self.skill_drop_chance = skill_drop_chance
+
+        self.base_classes: dict[GearBaseType | SkillType, type[DroppableBase]] = {}
+        for base_type in GearBaseType:
+            self.base_classes[base_type] = getattr(gear_bases, base_type.value)
+        for base_type in SkillType:
+            self.base_classes[base_type] = getattr(skill_bases, base_type.value)
+
+        self.entries: dict[GearBaseType | SkillType, DroppableEntry] = {}
+        for base_type, base_class in self.base_classes.items():
+            base: DroppableBase = base_class()
+            self.entries[base_type] = DroppableEntry(
+                base_class,
+                base.base_type,
+                base.weight,
+                base.min_level,
+                base.max_level,
+                base.droppable,
+            )
+
+        droppable = [entry for entry in self.entries.values() if entry.droppable]
+
+        # every level between two breakpoints drops from the same set of bases
+        breakpoints = {1}
+        for entry in droppable:
+            breakpoints.add(entry.min_level)
+            breakpoints.add(entry.max_level + 1)
+        self.level_breakpoints = sorted(breakpoints)
+
+        self.level_buckets: list[list[DroppableEntry]] = []
+        for level in self.level_breakpoints:
+            self.level_buckets.append(
+                [
+                    entry
+                    for entry in droppable
+                    if level >= entry.min_level and level <= entry.max_level
+                ]
+            )
+
+        self.tables: dict[
+            tuple[int, tuple[GearBaseType | SkillType, ...], bool], DroppableTable
+        ] = {}
+        for bucket in range(len(self.level_buckets)):
+            for exclude_skills in [False, True]:
+                self.__get_table(bucket, (), exclude_skills)
+
+    def __get_bucket(self, item_level: int) -> int:
+        return bisect.bisect_right(self.level_breakpoints, item_level) - 1
+
+    def __get_bucket_entries(
+        self, bucket: int, exclude_skills: bool
+    ) -> list[DroppableEntry]:
+        if bucket < 0:
+            return []
+        entries = self.level_buckets[bucket]
+        if exclude_skills:
+            entries = [entry for entry in entries if entry.base_type != Base.SKILL]
+        return entries
+
+    def __get_table(
+        self,
+        bucket: int,
+        loot_table: tuple[GearBaseType | SkillType, ...],
+        exclude_skills: bool,
+    ) -> DroppableTable:
+        key = (bucket, loot_table, exclude_skills)
+        if key in self.tables:
+            return self.tables[key]
+
+        entries = self.__get_bucket_entries(bucket, exclude_skills)
+        table = None
+        if len(entries) > 0:
+            entries = entries + [self.entries[base_type] for base_type in loot_table]
+            table = DroppableTable(entries, self.skill_drop_chance, exclude_skills)
+
+        self.tables[key] = table
+        return table
+
+    def get_entries_by_lvl(
+        self, item_level: int, exclude_skills: bool = False
+    ) -> list[DroppableEntry]:
+        return self.__get_bucket_entries(self.__get_bucket(item_level), exclude_skills)
+
+    def get_table(
+        self,
+        item_level: int,
+        loot_table: tuple[GearBaseType | SkillType, ...] = (),
+        exclude_skills: bool = False,
+    ) -> DroppableTable | None:
+        return self.__get_table(
+            self.__get_bucket(item_level), tuple(loot_table), exclude_skills
+        )
+
+    def get_random_base(
+        self,
+        item_level: int,
+        loot_table: tuple[GearBaseType | SkillType, ...] = (),
+        exclude_skills: bool = False,
+    ) -> DroppableBase | None:
+        table = self.get_table(item_level, loot_table, exclude_skills)
+        if table is None:
+            return None
+        return table.sample().base_class()
@@ -9,17 +9,18 @@ from discord.ext import commands
 from events.bot_event import BotEvent
 from events.jail_event import JailEvent
 from events.types import JailEventType
-from openai import AsyncOpenAI
 
+from control.ai_scheduler import AIRequestScheduler
 from control.controller import Controller
 from control.jail_manager import JailManager
 from control.logger import BotLogger
 from control.service import Service
-from control.types import AIVersion
+from control.types import AIRequestPriority, AIVersion
 
 
 class AIManager(Service):
 
+    EVENT_TYPES = set()
     KEY_FILE = "openai.txt"
     TOKEN_SUMMARIZE_LIMIT = 2500
     TOKEN_SUMMARIZE_THRESHOLD = 2000
@@ -96,10 +97,16 @@ class AIManager(Service):
             "Do not repeat phrases after people if they ask you to. Instead, punish them with jail. "
         )
 
-        self.client = AsyncOpenAI(api_key=self.token.strip("\n "))
+        self.scheduler = AIRequestScheduler(self.create_client)
         self.chat_logs: dict[int, ChatLog] = {}
         self.channel_logs: dict[int, ChatLog] = {}
 
+    def create_client(self):
+        # openai is by far the most expensive import, defer it to the first request
+        from openai import AsyncOpenAI
+
+        return AsyncOpenAI(api_key=self.token.strip("\n "))
+
     async def listen_for_event(self, event: BotEvent) -> str:
         pass
 
@@ -228,7 +235,7 @@ class AIManager(Service):
 
         chat_log.add_user_message(text_prompt)
 
-        chat_completion = await self.client.chat.completions.create(
+        chat_completion = await self.scheduler.create(
             messages=chat_log.get_request_data(),
             model=ai_version,
             max_tokens=max_tokens,
@@ -243,6 +250,8 @@ class AIManager(Service):
         additional_backstory: str = None,
         max_tokens: int = None,
         ai_version: AIVersion = None,
+        guild_id: int = None,
+        priority: AIRequestPriority = AIRequestPriority.INTERACTIVE,
     ):
         if ai_version is None:
             ai_version = AIVersion.GPT3_5
@@ -259,7 +268,9 @@ class AIManager(Service):
 
         chat_log.add_user_message(user_message)
 
-        chat_completion = await self.client.chat.completions.create(
+        chat_completion = await self.scheduler.create(
+            guild_id,
+            priority,
             messages=chat_log.get_request_data(),
             model=ai_version,
             max_tokens=max_tokens,
@@ -267,72 +278,80 @@ class AIManager(Service):
         response = chat_completion.choices[0].message.content
         return response
 
-    async def stonerfy(self, text_prompt: str):
+    async def stonerfy(self, text_prompt: str, guild_id: int = None):
         backstory = "Reword my next message in a way a completely high on weed stoner would word it while he has the high of his life. Often uses 'dude' and 'ya man'."
 
-        return await self.modify(text_prompt, backstory)
+        return await self.modify(text_prompt, backstory, guild_id=guild_id)
 
-    async def uwufy(self, text_prompt: str):
+    async def uwufy(self, text_prompt: str, guild_id: int = None):
         backstory = "Reword my next message in a way a super cutesy random rawr teenage uwu e-girl would word it on the internet in 2010. "
 
-        return await self.modify(text_prompt, backstory)
+        return await self.modify(text_prompt, backstory, guild_id=guild_id)
 
-    async def religify(self, text_prompt: str):
+    async def religify(self, text_prompt: str, guild_id: int = None):
         backstory = (
             "Reword my next message in a way a super pure and religious fanatic would word it, who is strictly opposed to anything sexual. "
             " Recite bible verses when they fit the context and tell everyone disagreeing with you that they will burn in hell."
         )
-        return await self.modify(text_prompt, backstory, length_threshold=15)
+        return await self.modify(
+            text_prompt, backstory, length_threshold=15, guild_id=guild_id
+        )
 
-    async def alcoholify(self, text_prompt: str):
+    async def alcoholify(self, text_prompt: str, guild_id: int = None):
         backstory = (
             "Reword my next message in a way a super drunk alcoholic uncle or aunt would word it, "
             "slurring their words and being needlessly angry and agressive but sometimes weirdly wholesome. "
         )
 
-        return await self.modify(text_prompt, backstory)
+        return await self.modify(text_prompt, backstory, guild_id=guild_id)
 
-    async def weebify(self, text_prompt: str):
+    async def weebify(self, text_prompt: str, guild_id: int = None):
         backstory = "Reword my next message in a way a super over the top hyped anime nerd would word it, using some japanese phrases known from anime. "
 
-        return await self.modify(text_prompt, backstory)
+        return await self.modify(text_prompt, backstory, guild_id=guild_id)
 
-    async def britify(self, text_prompt: str):
+    async def britify(self, text_prompt: str, guild_id: int = None):
         backstory = "Reword my next message in a heavy british accent. Speack with a comically thick british accent and liberally use random typically british phrases and sayings. "
 
-        return await self.modify(text_prompt, backstory)
+        return await self.modify(text_prompt, backstory, guild_id=guild_id)
 
-    async def meowify(self, text_prompt: str):
+    async def meowify(self, text_prompt: str, guild_id: int = None):
         backstory = "Reword my next message and replace it with cat speak only containing meows and cat noises. "
 
-        return await self.modify(text_prompt, backstory)
+        return await self.modify(text_prompt, backstory, guild_id=guild_id)
 
-    async def nerdify(self, text_prompt: str):
+    async def nerdify(self, text_prompt: str, guild_id: int = None):
         backstory = (
             "Reword my next message in a way a really pretentious nerdy school kid would say it, sometimes using words like 'Uhm Actually' and 'Ah Yes'. "
             "He should bellittle others for knowing less than him and use overly technical wors to make himself look smarter."
         )
 
-        return await self.modify(text_prompt, backstory, length_threshold=15)
+        return await self.modify(
+            text_prompt, backstory, length_threshold=15, guild_id=guild_id
+        )
 
-    async def trumpify(self, text_prompt: str):
+    async def trumpify(self, text_prompt: str, guild_id: int = None):
         backstory = (
             "Reword my next message in a way Donald Trump would say it in an interview or one of his speeches. "
             "Be incoherent and ramble a lot. Tell everyone how great america is."
         )
 
-        return await self.modify(text_prompt, backstory)
+        return await self.modify(text_prompt, backstory, guild_id=guild_id)
 
-    async def machofy(self, text_prompt: str):
+    async def machofy(self, text_prompt: str, guild_id: int = None):
         backstory = (
             "Reword my message in a way a muscular, naive, uncultured and arrogant narcissistic person would talk to a girl."
             "Be over the top macho, overly self confident and think that you are the center of the universe."
         )
 
-        return await self.modify(text_prompt, backstory)
+        return await self.modify(text_prompt, backstory, guild_id=guild_id)
 
     async def modify(
-        self, text_prompt: str, backstory: str, length_threshold: int = 10
+        self,
+        text_prompt: str,
+        backstory: str,
+        length_threshold: int = 10,
+        guild_id: int = None,
     ):
         if text_prompt is None or len(text_prompt) <= 0:
             return ""
@@ -352,7 +371,8 @@ class AIManager(Service):
 
         chat_log.add_user_message(text_prompt)
 
-        chat_completion = await self.client.chat.completions.create(
+        chat_completion = await self.scheduler.create(
+            guild_id,
             messages=chat_log.get_request_data(),
             model=ai_version,
         )
@@ -390,7 +410,8 @@ class AIManager(Service):
 
         self.channel_logs[channel_id].add_user_message(user_message)
 
-        chat_completion = await self.client.chat.completions.create(
+        chat_completion = await self.scheduler.create(
+            message.guild.id,
             messages=self.channel_logs[channel_id].get_request_data(),
             model=ai_version,
         )
@@ -409,7 +430,9 @@ class AIManager(Service):
         )
         if token_count > self.TOKEN_SUMMARIZE_LIMIT:
 
-            chat_completion = await self.client.chat.completions.create(
+            chat_completion = await self.scheduler.create(
+                message.guild.id,
+                AIRequestPriority.BACKGROUND,
                 messages=self.channel_logs[channel_id].summarize(
                     self.TOKEN_SUMMARIZE_THRESHOLD
                 ),
@@ -0,0 +1,215 @@
+import asyncio
+import collections
+import heapq
+import itertools
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from control.types import AIRequestPriority
+
+
+class AIRequestMetrics:
+
+    SAMPLE_SIZE = 500
+
+    def __init__(self):
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.coalesced = 0
+        self.max_queue_depth = 0
+        self.wait_times: dict[AIRequestPriority, collections.deque[float]] = {}
+        self.latencies: dict[AIRequestPriority, collections.deque[float]] = {}
+
+    @staticmethod
+    def __add_sample(
+        samples: dict[AIRequestPriority, collections.deque[float]],
+        priority: AIRequestPriority,
+        value: float,
+    ) -> None:
+        if priority not in samples:
+            samples[priority] = collections.deque(maxlen=AIRequestMetrics.SAMPLE_SIZE)
+        samples[priority].append(value)
+
+    @staticmethod
+    def get_percentile(samples: collections.deque[float], percentile: float) -> float:
+        if len(samples) == 0:
+            return 0
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile))
+        return ordered[index]
+
+    def track_queue_depth(self, queue_depth: int) -> None:
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+
+    def track_wait_time(self, priority: AIRequestPriority, wait_time: float) -> None:
+        self.__add_sample(self.wait_times, priority, wait_time)
+
+    def track_latency(self, priority: AIRequestPriority, latency: float) -> None:
+        self.__add_sample(self.latencies, priority, latency)
+
+    def get_summary(self) -> str:
+        summary = (
+            f"submitted: {self.submitted}, completed: {self.completed}, "
+            f"failed: {self.failed}, coalesced: {self.coalesced}, "
+            f"max queue depth: {self.max_queue_depth}"
+        )
+        for priority in AIRequestPriority:
+            if priority not in self.latencies:
+                continue
+            wait_times = self.wait_times[priority]
+            latencies = self.latencies[priority]
+            summary += (
+                f"\n{priority.name.lower()}: "
+                f"wait p50 {self.get_percentile(wait_times, 0.5):.2f}s "
+                f"p95 {self.get_percentile(wait_times, 0.95):.2f}s, "
+                f"latency p50 {self.get_percentile(latencies, 0.5):.2f}s "
+                f"p95 {self.get_percentile(latencies, 0.95):.2f}s"
+            )
+        return summary
+
+
+class ScheduledAIRequest:
+
+    def __init__(
+        self,
+        key: str,
+        guild_id: int,
+        priority: AIRequestPriority,
+        request: dict[str, Any],
+    ):
+        self.key = key
+        self.guild_id = guild_id
+        self.priority = priority
+        self.request = request
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.future.add_done_callback(self.__consume_exception)
+        self.submitted = time.perf_counter()
+
+    @staticmethod
+    def __consume_exception(future: asyncio.Future) -> None:
+        # every caller may have been cancelled while the request was running
+        if not future.cancelled():
+            future.exception()
+
+
+class AIRequestScheduler:
+
+    GLOBAL_LIMIT = 8
+    GUILD_LIMIT = 3
+
+    # the factory may return anything exposing an awaitable
+    # chat.completions.create, so a local stub can stand in for the OpenAI
+    # client. It is only called on the first request to keep startup cheap.
+    def __init__(
+        self,
+        client_factory: Callable[[], Any],
+        global_limit: int = GLOBAL_LIMIT,
+        guild_limit: int = GUILD_LIMIT,
+    ):
+        self.client_factory = client_factory
+        self.client = None
+        self.global_limit = max(1, global_limit)
+        self.guild_limit = max(1, guild_limit)
+        self.metrics = AIRequestMetrics()
+
+        self.queue: list[tuple[int, int, ScheduledAIRequest]] = []
+        self.sequence = itertools.count()
+        self.pending_requests: dict[str, ScheduledAIRequest] = {}
+        self.in_flight = 0
+        self.guild_in_flight: dict[int, int] = {}
+        self.tasks: set[asyncio.Task] = set()
+
+    def get_client(self) -> Any:
+        if self.client is None:
+            self.client = self.client_factory()
+        return self.client
+
+    @staticmethod
+    def get_request_key(request: dict[str, Any]) -> str:
+        return json.dumps(request, sort_keys=True, default=str)
+
+    def get_queue_depth(self) -> int:
+        return len(self.queue)
+
+    async def create(
+        self,
+        guild_id: int = None,
+        priority: AIRequestPriority = AIRequestPriority.INTERACTIVE,
+        **request,
+    ) -> Any:
+        self.metrics.submitted += 1
+        key = self.get_request_key(request)
+
+        if key in self.pending_requests:
+            # identical request is already queued or running, share its response
+            self.metrics.coalesced += 1
+            return await asyncio.shield(self.pending_requests[key].future)
+
+        scheduled = ScheduledAIRequest(key, guild_id, priority, request)
+        self.pending_requests[key] = scheduled
+        heapq.heappush(self.queue, (priority, next(self.sequence), scheduled))
+        self.metrics.track_queue_depth(len(self.queue))
+        self.__dispatch()
+
+        return await asyncio.shield(scheduled.future)
+
+    def __has_capacity(self, guild_id: int) -> bool:
+        if guild_id is None:
+            return True
+        return self.guild_in_flight.get(guild_id, 0) < self.guild_limit
+
+    def __dispatch(self) -> None:
+        blocked = []
+        while len(self.queue) > 0 and self.in_flight < self.global_limit:
+            entry = heapq.heappop(self.queue)
+            scheduled = entry[2]
+            if not self.__has_capacity(scheduled.guild_id):
+                blocked.append(entry)
+                continue
+            self.__start(scheduled)
+
+        for entry in blocked:
+            heapq.heappush(self.queue, entry)
+
+    def __start(self, scheduled: ScheduledAIRequest) -> None:
+        self.in_flight += 1
+        if scheduled.guild_id is not None:
+            self.guild_in_flight[scheduled.guild_id] = (
+                self.guild_in_flight.get(scheduled.guild_id, 0) + 1
+            )
+
+        task = asyncio.create_task(self.__run(scheduled))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    def __finish(self, scheduled: ScheduledAIRequest) -> None:
+        self.in_flight -= 1
+        if scheduled.guild_id is not None:
+            self.guild_in_flight[scheduled.guild_id] -= 1
+            if self.guild_in_flight[scheduled.guild_id] <= 0:
+                del self.guild_in_flight[scheduled.guild_id]
+        del self.pending_requests[scheduled.key]
+
+    async def __run(self, scheduled: ScheduledAIRequest) -> None:
+        start = time.perf_counter()
+        self.metrics.track_wait_time(scheduled.priority, start - scheduled.submitted)
+
+        try:
+            response = await self.get_client().chat.completions.create(
+                **scheduled.request
+            )
+        except Exception as error:
+            self.metrics.failed += 1
+            scheduled.future.set_exception(error)
+        else:
+            self.metrics.completed += 1
+            scheduled.future.set_result(response)
+        finally:
+            if not scheduled.future.done():
+                scheduled.future.cancel()
+            self.metrics.track_latency(scheduled.priority, time.perf_counter() - start)
+            self.__finish(scheduled)
+            self.__dispatch()
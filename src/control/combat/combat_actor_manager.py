@@ -1,10 +1,13 @@
+import asyncio
+
 import discord
 from combat.actors import Actor, Character, Opponent
+from combat.combat_formulas import CombatFormulas
 from combat.enemies.enemy import Enemy
-from combat.gear.types import CharacterAttribute, GearModifierType
+from combat.equipment import CharacterEquipment
 from combat.skills.skill import Skill
 from combat.skills.status_effect import ActiveStatusEffect
-from combat.skills.types import SkillEffect, SkillType, StatusEffectType
+from combat.skills.types import SkillEffect, SkillType
 from config import Config
 from control.combat.object_factory import ObjectFactory
 from control.controller import Controller
@@ -21,6 +24,8 @@ from events.types import CombatEventType, EncounterEventType
 
 class CombatActorManager(Service):
 
+    EVENT_TYPES = set()
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -33,14 +38,42 @@ class CombatActorManager(Service):
         self.factory: ObjectFactory = self.controller.get_service(ObjectFactory)
         self.log_name = "Combat Skills"
 
+        # folded combat event state per encounter, so long fights don't replay
+        # their whole history on every lookup
+        self.health_cache: dict[tuple[int, int], tuple[int, int, float]] = {}
+        self.status_stack_cache: dict[int, tuple[int, dict[int, int]]] = {}
+
     async def listen_for_event(self, event: BotEvent):
         pass
 
-    async def get_actor_current_hp(
-        self, actor: Actor, combat_events: list[CombatEvent]
-    ):
-        health = actor.max_hp
+    def clear_encounter_cache(self, encounter_id: int):
+        self.health_cache = {
+            key: value
+            for key, value in self.health_cache.items()
+            if key[0] != encounter_id
+        }
+        self.status_stack_cache.pop(encounter_id, None)
+
+    def __get_new_combat_events(
+        self, last_event_id: int, combat_events: list[CombatEvent]
+    ) -> list[CombatEvent]:
+        # combat events are ordered newest first, returns None if the list
+        # doesn't continue from the last folded event
+        new_events = []
+        for event in combat_events:
+            if event.id is None:
+                return None
+            if event.id > last_event_id:
+                new_events.append(event)
+                continue
+            if event.id == last_event_id:
+                return new_events
+            return None
+        return None
 
+    async def __apply_health_events(
+        self, actor: Actor, health: float, combat_events: list[CombatEvent]
+    ) -> float:
         for event in reversed(combat_events):
             if event.target_id != actor.id:
                 continue
@@ -70,42 +103,110 @@ class CombatActorManager(Service):
 
             if health <= 0:
                 return 0
+        return health
+
+    async def get_actor_current_hp(
+        self, actor: Actor, combat_events: list[CombatEvent]
+    ):
+        if len(combat_events) == 0:
+            return int(actor.max_hp)
+
+        key = (combat_events[0].encounter_id, actor.id)
+        new_events = None
+        cached = self.health_cache.get(key)
+
+        if cached is not None:
+            max_hp, last_event_id, health = cached
+            if max_hp == actor.max_hp:
+                new_events = self.__get_new_combat_events(last_event_id, combat_events)
+
+        if new_events is None:
+            health = actor.max_hp
+            new_events = combat_events
+
+        if health > 0:
+            health = await self.__apply_health_events(actor, health, new_events)
+
+        if combat_events[0].id is not None:
+            self.health_cache[key] = (actor.max_hp, combat_events[0].id, health)
+
         return int(health)
 
+    def __get_status_stack_changes(
+        self, combat_events: list[CombatEvent]
+    ) -> dict[int, int]:
+        if len(combat_events) == 0:
+            return {}
+
+        encounter_id = combat_events[0].encounter_id
+        new_events = None
+        cached = self.status_stack_cache.get(encounter_id)
+
+        if cached is not None:
+            last_event_id, stack_changes = cached
+            new_events = self.__get_new_combat_events(last_event_id, combat_events)
+
+        if new_events is None:
+            stack_changes = {}
+            new_events = combat_events
+
+        stack_changes = dict(stack_changes)
+        for combat_event in new_events:
+            if combat_event.combat_event_type != CombatEventType.STATUS_EFFECT:
+                continue
+            status_id = combat_event.skill_id
+            stack_changes[status_id] = (
+                stack_changes.get(status_id, 0) + combat_event.skill_value
+            )
+
+        if combat_events[0].id is not None:
+            self.status_stack_cache[encounter_id] = (combat_events[0].id, stack_changes)
+
+        return stack_changes
+
     async def get_active_status_effects(
         self,
         id: int,
         status_effects: dict[int, list[StatusEffectEvent]],
         combat_events: list[CombatEvent],
     ) -> list[ActiveStatusEffect]:
-        active_status_effects: dict[StatusEffectType, list[ActiveStatusEffect]] = {}
         active_status_effects = []
 
         if id not in status_effects:
             return active_status_effects
 
         actor_status_effects = status_effects[id]
-        stacks = {event.id: event.stacks for event in actor_status_effects}
-
-        for combat_event in combat_events:
-            if combat_event.combat_event_type != CombatEventType.STATUS_EFFECT:
-                continue
-
-            status_id = combat_event.skill_id
-            if status_id not in stacks:
-                continue
-
-            stacks[status_id] += combat_event.skill_value
+        stack_changes = self.__get_status_stack_changes(combat_events)
 
         for event in actor_status_effects:
             status_effect = await self.factory.get_status_effect(event.status_type)
-            active_status_effect = ActiveStatusEffect(
-                status_effect, event, stacks[event.id]
-            )
+            stacks = event.stacks + stack_changes.get(event.id, 0)
+            active_status_effect = ActiveStatusEffect(status_effect, event, stacks)
             active_status_effects.append(active_status_effect)
 
         return active_status_effects
 
+    def get_opponent_skill_stacks_used(
+        self, combat_events: list[CombatEvent]
+    ) -> dict[SkillType, int]:
+        stacks_used = {}
+        for event in combat_events:
+            if event.combat_event_type in [
+                CombatEventType.ENEMY_END_TURN,
+                CombatEventType.MEMBER_END_TURN,
+            ]:
+                break
+
+            if not isinstance(event.skill_type, SkillType):
+                continue
+
+            if event.skill_type not in stacks_used:
+                stacks_used[event.skill_type] = 1
+            else:
+                stacks_used[event.skill_type] += 1
+
+        return stacks_used
+
     async def get_opponent(
         self,
         enemy: Enemy,
@@ -138,9 +239,7 @@ class CombatActorManager(Service):
             skills.append(skill)
 
         skill_cooldowns = self.get_skill_cooldowns(id, skills, combat_events)
-        skill_stacks_used = await self.database.get_opponent_skill_stacks_used(
-            encounter_id
-        )
+        skill_stacks_used = self.get_opponent_skill_stacks_used(combat_events)
         active_status_effects = await self.get_active_status_effects(
             id, status_effects, combat_events
         )
@@ -164,6 +263,21 @@ class CombatActorManager(Service):
         combat_events: list[CombatEvent] = None,
         status_effects: dict[int, StatusEffectEvent] = None,
     ) -> Character:
+        characters = await self.get_characters(
+            [member], encounter_events, combat_events, status_effects
+        )
+        return characters[0]
+
+    async def get_characters(
+        self,
+        members: list[discord.Member],
+        encounter_events: list[EncounterEvent] = None,
+        combat_events: list[CombatEvent] = None,
+        status_effects: dict[int, StatusEffectEvent] = None,
+    ) -> list[Character]:
+        if len(members) == 0:
+            return []
+
         if encounter_events is None:
             encounter_events = []
 
@@ -173,6 +287,40 @@ class CombatActorManager(Service):
         if status_effects is None:
             status_effects = {}
 
+        guild_id = members[0].guild.id
+        member_ids = [member.id for member in members]
+
+        equipment, equipped_skills, skill_stacks_used = await asyncio.gather(
+            self.database.get_user_equipment_by_members(guild_id, member_ids),
+            self.database.get_user_equipped_skills_by_members(guild_id, member_ids),
+            self.database.get_user_skill_stacks_used_by_members(guild_id, member_ids),
+        )
+
+        characters = []
+        for member in members:
+            character = await self.__build_character(
+                member,
+                equipment[member.id],
+                equipped_skills[member.id],
+                skill_stacks_used[member.id],
+                encounter_events,
+                combat_events,
+                status_effects,
+            )
+            characters.append(character)
+
+        return characters
+
+    async def __build_character(
+        self,
+        member: discord.Member,
+        equipment: CharacterEquipment,
+        equipped_skills: dict[int, Skill],
+        skill_stacks_used: dict[int, int],
+        encounter_events: list[EncounterEvent],
+        combat_events: list[CombatEvent],
+        status_effects: dict[int, StatusEffectEvent],
+    ) -> Character:
         defeated = False
         leaving = False
         is_out = False
@@ -196,8 +344,6 @@ class CombatActorManager(Service):
         if is_out:
             leaving = False
 
-        equipment = await self.database.get_user_equipment(member.guild.id, member.id)
-
         weapon_skills = equipment.weapon.base.skills
 
         skill_slots = {}
@@ -208,10 +354,6 @@ class CombatActorManager(Service):
             )
             skill_slots[slot] = skill
 
-        equipped_skills = await self.database.get_user_equipped_skills(
-            member.guild.id, member.id
-        )
-
         for index in range(4):
             if index not in skill_slots:
                 skill_slots[index] = equipped_skills[index]
@@ -219,9 +361,6 @@ class CombatActorManager(Service):
         skills = [skill for skill in skill_slots.values() if skill is not None]
 
         skill_cooldowns = self.get_skill_cooldowns(member.id, skills, combat_events)
-        skill_stacks_used = await self.database.get_user_skill_stacks_used(
-            member.guild.id, member.id
-        )
 
         active_status_effects = await self.get_active_status_effects(
             member.id, status_effects, combat_events
@@ -328,58 +467,15 @@ class CombatActorManager(Service):
     async def get_character_damage_after_defense(
         self, character: Character, skill_effect: SkillEffect, incoming_damage: int
     ) -> float:
-        modifier = 1
-        flat_reduction = 0
-
-        match skill_effect:
-            case SkillEffect.PHYSICAL_DAMAGE:
-                modifier -= character.equipment.attributes[
-                    CharacterAttribute.DAMAGE_REDUCTION
-                ]
-                flat_reduction = int(
-                    character.equipment.gear_modifiers[GearModifierType.ARMOR] / 4
-                )
-            case SkillEffect.NEUTRAL_DAMAGE:
-                modifier -= character.equipment.attributes[
-                    CharacterAttribute.DAMAGE_REDUCTION
-                ]
-            case SkillEffect.MAGICAL_DAMAGE:
-                modifier -= character.equipment.attributes[
-                    CharacterAttribute.DAMAGE_REDUCTION
-                ]
-            case SkillEffect.STATUS_EFFECT_DAMAGE:
-                modifier -= character.equipment.attributes[
-                    CharacterAttribute.DAMAGE_REDUCTION
-                ]
-            case SkillEffect.HEALING:
-                pass
-
-        return int(max(0, ((incoming_damage * modifier) - flat_reduction)))
+        damage_reduction = CombatFormulas.get_character_damage_reduction(
+            character.equipment, skill_effect
+        )
+        return damage_reduction.apply(incoming_damage)
 
     async def get_opponent_damage_after_defense(
         self, opponent: Opponent, skill_effect: SkillEffect, incoming_damage: int
     ) -> float:
-        modifier = 1
-        flat_reduction = 0
-
-        match skill_effect:
-            case SkillEffect.PHYSICAL_DAMAGE:
-                modifier -= opponent.enemy.attributes[
-                    CharacterAttribute.DAMAGE_REDUCTION
-                ]
-            case SkillEffect.NEUTRAL_DAMAGE:
-                modifier -= opponent.enemy.attributes[
-                    CharacterAttribute.DAMAGE_REDUCTION
-                ]
-            case SkillEffect.MAGICAL_DAMAGE:
-                modifier -= opponent.enemy.attributes[
-                    CharacterAttribute.DAMAGE_REDUCTION
-                ]
-            case SkillEffect.STATUS_EFFECT_DAMAGE:
-                modifier -= opponent.enemy.attributes[
-                    CharacterAttribute.DAMAGE_REDUCTION
-                ]
-            case SkillEffect.HEALING:
-                pass
-
-        return int(max(0, ((incoming_damage - flat_reduction) * modifier)))
+        damage_reduction = CombatFormulas.get_opponent_damage_reduction(
+            opponent.enemy, skill_effect
+        )
+        return damage_reduction.apply(incoming_damage)
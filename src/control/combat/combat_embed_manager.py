@@ -21,6 +21,8 @@ from events.bot_event import BotEvent
 
 class CombatEmbedManager(Service):
 
+    EVENT_TYPES = set()
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -13,6 +13,7 @@ from combat.gear import (
     DefaultWand,
 )
 from combat.gear.bases import *  # noqa: F403
+from combat.gear.droppable_index import DroppableBaseIndex
 from combat.gear.gear import DroppableBase, Gear, GearBase
 from combat.gear.types import (
     Base,
@@ -23,7 +24,6 @@ from combat.gear.types import (
 )
 from combat.skills.skill import BaseSkill, Skill
 from combat.skills.skills import *  # noqa: F403
-from combat.skills.types import SkillType
 from control.combat.combat_skill_manager import CombatSkillManager
 from control.controller import Controller
 from control.item_manager import ItemManager
@@ -38,6 +38,7 @@ from events.types import EncounterEventType
 
 class CombatGearManager(Service):
 
+    EVENT_TYPES = set()
     GENERATOR_VERSION = "0.0.2"
 
     ITEM_LEVEL_MIN_DROP = 0.6
@@ -135,6 +136,17 @@ class CombatGearManager(Service):
         GearModifierType.DEXTERITY,
     ]
 
+    GEAR_SCORE_ITEM_LEVEL_WEIGHT = 1
+    GEAR_SCORE_RARITY_WEIGHTS = {
+        Rarity.NORMAL: 1,
+        Rarity.MAGIC: 3,
+        Rarity.RARE: 5,
+        Rarity.LEGENDARY: 10,
+        Rarity.UNIQUE: 8,
+    }
+
+    BASE_INDEX = DroppableBaseIndex(SKILL_DROP_CHANCE)
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -156,27 +168,10 @@ class CombatGearManager(Service):
     async def get_bases_by_lvl(
         self, item_level: int, exclude_skills: bool = False
     ) -> list[DroppableBase]:
-        matching_bases = []
-
-        gear_base_types = [base_type for base_type in GearBaseType]
-
-        if not exclude_skills:
-            skill_base_types = [base_type for base_type in SkillType]
-            base_types = gear_base_types + skill_base_types
-        else:
-            base_types = gear_base_types
-
-        for base_type in base_types:
-            base_class = globals()[base_type]
-            base: DroppableBase = base_class()
-
-            if not base.droppable:
-                continue
-
-            if item_level >= base.min_level and item_level <= base.max_level:
-                matching_bases.append(base)
-
-        return matching_bases
+        return [
+            entry.base_class()
+            for entry in self.BASE_INDEX.get_entries_by_lvl(item_level, exclude_skills)
+        ]
 
     async def get_random_base(
         self, item_level: int, enemy: Enemy = None, exclude_skills: bool = False
@@ -186,52 +181,13 @@ class CombatGearManager(Service):
 
         drop_item_level = random.randint(min_level, max_level)
 
-        bases = await self.get_bases_by_lvl(drop_item_level, exclude_skills)
-
-        if len(bases) <= 0:
-            return None
-
+        loot_table = ()
         if enemy is not None:
-            skill_base_types = enemy.skill_loot_table
-            gear_base_types = enemy.gear_loot_table
-
-            table_base_types = gear_base_types + skill_base_types
-
-            for base_type in table_base_types:
-                base_class = globals()[base_type]
-                base: DroppableBase = base_class()
-                bases.append(base)
-
-        skill_weight = 0
-        gear_weight = 0
-
-        for base in bases:
-            match base.base_type:
-                case Base.SKILL:
-                    skill_weight += base.weight
-                case Base.GEAR:
-                    gear_weight += base.weight
-
-        skill_mod = 0
-        if not exclude_skills:
-            skill_mod = (
-                self.SKILL_DROP_CHANCE * (skill_weight + gear_weight) / skill_weight
-            )
-        # Forces chance of skill dropping to self.SKILL_DROP_CHANCE while keeping weights
-
-        weights = []
-        for base in bases:
-            weight = base.weight
-            match base.base_type:
-                case Base.SKILL:
-                    weight *= skill_mod
-                case Base.GEAR:
-                    weight *= 1 - skill_mod
-            weights.append(weight)
-
-        sum_weights = sum(weights)
-        chances = [v / sum_weights for v in weights]
-        return random.choices(bases, weights=chances)[0]
+            loot_table = tuple(enemy.gear_loot_table + enemy.skill_loot_table)
+
+        return self.BASE_INDEX.get_random_base(
+            drop_item_level, loot_table, exclude_skills
+        )
 
     async def get_random_rarity(self, item_level) -> Rarity:
         weights = {}
@@ -274,35 +230,40 @@ class CombatGearManager(Service):
 
         return modifiers
 
-    async def get_modifier_boundaries(
-        self, base: GearBase, item_level: int, modifier_type: GearModifierType
-    ):
+    @staticmethod
+    def calculate_modifier_boundaries(
+        base: GearBase, item_level: int, modifier_type: GearModifierType
+    ) -> tuple[float, float]:
         slot_scaling = (
-            self.SLOT_SCALING[base.slot]
-            if modifier_type not in self.NON_BASE_SCALING_MODIFIERS
+            CombatGearManager.SLOT_SCALING[base.slot]
+            if modifier_type not in CombatGearManager.NON_BASE_SCALING_MODIFIERS
             else 1
         )
+        modifier_base = CombatGearManager.MODIFIER_BASE[modifier_type]
+        modifier_range = CombatGearManager.MODIFIER_RANGE[modifier_type]
 
         base_value = (
             (
-                self.MODIFIER_BASE[modifier_type]
-                + self.MODIFIER_BASE[modifier_type]
-                * (self.MODIFIER_SCALING[modifier_type])
+                modifier_base
+                + modifier_base
+                * CombatGearManager.MODIFIER_SCALING[modifier_type]
                 * (item_level - 1)
-                * self.GEAR_LEVEL_SCALING
+                * CombatGearManager.GEAR_LEVEL_SCALING
             )
             * slot_scaling
             * base.scaling
         )
 
-        min_roll = max(
-            self.MODIFIER_BASE[modifier_type] * slot_scaling,
-            base_value * (1 - self.MODIFIER_RANGE[modifier_type]),
-        )
-        max_roll = base_value * (1 + self.MODIFIER_RANGE[modifier_type])
+        min_roll = max(modifier_base * slot_scaling, base_value * (1 - modifier_range))
+        max_roll = base_value * (1 + modifier_range)
 
         return min_roll, max_roll
 
+    async def get_modifier_boundaries(
+        self, base: GearBase, item_level: int, modifier_type: GearModifierType
+    ):
+        return self.calculate_modifier_boundaries(base, item_level, modifier_type)
+
     async def generate_drop(
         self,
         member_id: int,
@@ -480,19 +441,8 @@ class CombatGearManager(Service):
         ]
 
     async def get_gear_score(self, gear: Gear) -> float:
-        item_level_weight = 1
-        rarity_weight = 1
-
-        rarity_weight = {
-            Rarity.NORMAL: 1,
-            Rarity.MAGIC: 3,
-            Rarity.RARE: 5,
-            Rarity.LEGENDARY: 10,
-            Rarity.UNIQUE: 8,
-        }
-
-        gear_score = gear.level * item_level_weight
-        gear_score *= rarity_weight[gear.rarity]
+        gear_score = gear.level * self.GEAR_SCORE_ITEM_LEVEL_WEIGHT
+        gear_score *= self.GEAR_SCORE_RARITY_WEIGHTS[gear.rarity]
 
         return gear_score
 
@@ -1,8 +1,6 @@
-import random
-
 from combat.actors import Actor, Character, Opponent
+from combat.combat_formulas import CombatFormulas
 from combat.encounter import EncounterContext
-from combat.gear.types import CharacterAttribute, GearModifierType
 from combat.skills.skill import CharacterSkill, Skill, SkillType
 from combat.skills.skills import *  # noqa: F403
 from combat.skills.types import SkillEffect, SkillInstance, SkillTarget
@@ -18,6 +16,8 @@ from events.bot_event import BotEvent
 
 class CombatSkillManager(Service):
 
+    EVENT_TYPES = set()
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -147,77 +147,13 @@ class CombatSkillManager(Service):
         force_min: bool = False,
         force_max: bool = False,
     ) -> list[SkillInstance]:
-        skill_base_value = skill.base_skill.base_value
-        weapon_min_roll = character.equipment.weapon.modifiers[
-            GearModifierType.WEAPON_DAMAGE_MIN
-        ]
-        weapon_max_roll = character.equipment.weapon.modifiers[
-            GearModifierType.WEAPON_DAMAGE_MAX
-        ]
-
-        modifier = 1
-        base_dmg_type = character.skill_slots[0].base_skill.skill_effect
-
-        encounter_scaling = 1
-        if combatant_count > 1:
-            encounter_scaling = (
-                1 / combatant_count * Config.CHARACTER_ENCOUNTER_SCALING_FACOTR
-            )
-
-        match skill.base_skill.skill_effect:
-            case SkillEffect.PHYSICAL_DAMAGE:
-                modifier += character.equipment.attributes[
-                    CharacterAttribute.PHYS_DAMAGE_INCREASE
-                ]
-                if base_dmg_type != skill.base_skill.skill_effect:
-                    modifier *= Config.SKILL_TYPE_PENALTY
-            case SkillEffect.MAGICAL_DAMAGE:
-                modifier += character.equipment.attributes[
-                    CharacterAttribute.MAGIC_DAMAGE_INCREASE
-                ]
-                if base_dmg_type != skill.base_skill.skill_effect:
-                    modifier *= Config.SKILL_TYPE_PENALTY
-            case SkillEffect.HEALING:
-                encounter_scaling = 1
-                weapon_lvl = character.equipment.weapon.level
-                base_roll = Config.OPPONENT_DAMAGE_BASE[weapon_lvl]
-                weapon_min_roll = base_roll * (1 - Config.OPPONENT_DAMAGE_VARIANCE)
-                weapon_max_roll = base_roll * (1 + Config.OPPONENT_DAMAGE_VARIANCE)
-                modifier += character.equipment.attributes[
-                    CharacterAttribute.HEALING_BONUS
-                ]
-
-        attack_count = skill.base_skill.hits
-        skill_instances = []
-        for _ in range(attack_count):
-
-            if force_min:
-                weapon_roll = weapon_min_roll
-            elif force_max:
-                weapon_roll = weapon_max_roll
-            else:
-                weapon_roll = random.randint(int(weapon_min_roll), int(weapon_max_roll))
-
-            crit_roll = random.random()
-            critical_hit = False
-            critical_modifier = 1
-            if crit_roll < character.equipment.attributes[CharacterAttribute.CRIT_RATE]:
-                critical_hit = True
-                critical_modifier = character.equipment.attributes[
-                    CharacterAttribute.CRIT_DAMAGE
-                ]
-
-            skill_instance = SkillInstance(
-                weapon_roll=weapon_roll,
-                skill_base=skill_base_value,
-                modifier=modifier,
-                critical_modifier=critical_modifier,
-                encounter_scaling=encounter_scaling,
-                is_crit=critical_hit,
-            )
-            skill_instances.append(skill_instance)
-
-        return skill_instances
+        skill_roll = CombatFormulas.get_character_skill_roll(
+            character.equipment,
+            character.skill_slots[0].base_skill.skill_effect,
+            skill,
+            combatant_count,
+        )
+        return skill_roll.get_instances(force_min, force_max)
 
     async def get_opponent_skill_effect(
         self,
@@ -227,83 +163,7 @@ class CombatSkillManager(Service):
         force_min: bool = False,
         force_max: bool = False,
     ) -> list[SkillInstance]:
-
-        skill_base_value = skill.base_skill.base_value
-        skill_scaling = skill_base_value / opponent.average_skill_multi
-
-        effective_level = opponent.level
-        if opponent.enemy.is_boss:
-            effective_level += 1
-
-        base_damage = (
-            Config.OPPONENT_DAMAGE_BASE[effective_level] / opponent.enemy.damage_scaling
-        )
-
-        weapon_min_roll = int(base_damage * (1 - Config.OPPONENT_DAMAGE_VARIANCE))
-        weapon_max_roll = int(base_damage * (1 + Config.OPPONENT_DAMAGE_VARIANCE))
-
-        modifier = pow(
-            Config.OPPONENT_LEVEL_SCALING_FACTOR,
-            (opponent.level - opponent.enemy.min_level),
+        skill_roll = CombatFormulas.get_opponent_skill_roll(
+            opponent, skill, combatant_count
         )
-
-        match skill.base_skill.skill_effect:
-            case SkillEffect.PHYSICAL_DAMAGE:
-                modifier += opponent.enemy.attributes[
-                    CharacterAttribute.PHYS_DAMAGE_INCREASE
-                ]
-            case SkillEffect.MAGICAL_DAMAGE:
-                modifier += opponent.enemy.attributes[
-                    CharacterAttribute.MAGIC_DAMAGE_INCREASE
-                ]
-            case SkillEffect.HEALING:
-                modifier += opponent.enemy.attributes[CharacterAttribute.HEALING_BONUS]
-
-        encounter_scaling = opponent.enemy.min_encounter_scale
-        raw_attack_count = skill.base_skill.hits
-        attack_count = raw_attack_count
-
-        if (
-            combatant_count > opponent.enemy.min_encounter_scale
-            and not skill.base_skill.aoe
-        ):
-            encounter_scale = combatant_count - (opponent.enemy.min_encounter_scale - 1)
-            attack_count_scaling = max(1, encounter_scale * 0.75)
-            attack_count = int(raw_attack_count * attack_count_scaling)
-            encounter_scaling += (
-                encounter_scale
-                * Config.OPPONENT_ENCOUNTER_SCALING_FACTOR
-                * raw_attack_count
-                / attack_count
-            ) - 1
-
-        attacks = []
-        for _ in range(attack_count):
-
-            if force_min:
-                weapon_roll = weapon_min_roll
-            elif force_max:
-                weapon_roll = weapon_max_roll
-            else:
-                weapon_roll = random.randint(int(weapon_min_roll), int(weapon_max_roll))
-
-            crit_roll = random.random()
-            critical_hit = False
-            critical_modifier = 1
-            if crit_roll < opponent.enemy.attributes[CharacterAttribute.CRIT_RATE]:
-                critical_hit = True
-                critical_modifier = opponent.enemy.attributes[
-                    CharacterAttribute.CRIT_DAMAGE
-                ]
-
-            damage_instance = SkillInstance(
-                weapon_roll=weapon_roll,
-                skill_base=skill_scaling,
-                modifier=modifier,
-                critical_modifier=critical_modifier,
-                encounter_scaling=encounter_scaling,
-                is_crit=critical_hit,
-            )
-            attacks.append(damage_instance)
-
-        return attacks
+        return skill_roll.get_instances(force_min, force_max)
@@ -1,7 +1,8 @@
+import asyncio
 from collections.abc import AsyncGenerator
 
 import discord
-from combat.encounter import EncounterContext
+from combat.encounter import Encounter, EncounterContext
 from control.combat.combat_actor_manager import CombatActorManager
 from control.combat.combat_embed_manager import CombatEmbedManager
 from control.combat.object_factory import ObjectFactory
@@ -11,10 +12,133 @@ from control.service import Service
 from datalayer.database import Database
 from discord.ext import commands
 from events.bot_event import BotEvent
+from events.combat_event import CombatEvent
+from events.encounter_event import EncounterEvent
+from events.status_effect_event import StatusEffectEvent
+from events.types import EncounterEventType, EventType
+
+
+class EncounterCacheEntry:
+
+    def __init__(
+        self,
+        encounter: Encounter,
+        thread_id: int,
+        encounter_events: list[EncounterEvent],
+        combat_events: list[CombatEvent],
+        status_effects: dict[int, list[StatusEffectEvent]],
+    ):
+        self.encounter = encounter
+        self.thread_id = thread_id
+        self.encounter_events = encounter_events
+        self.combat_events = combat_events
+        self.status_effects = status_effects
+        self.load_count = 0
+
+        self.last_encounter_event_id = self.__get_last_id(encounter_events)
+        self.last_combat_event_id = self.__get_last_id(combat_events)
+        self.last_status_effect_id = self.__get_last_id(
+            [event for events in status_effects.values() for event in events]
+        )
+
+    def __get_last_id(self, events: list[BotEvent]) -> int:
+        return max([event.id for event in events], default=0)
+
+    def add_events(
+        self,
+        encounter_events: list[EncounterEvent],
+        combat_events: list[CombatEvent],
+        status_effects: dict[int, list[StatusEffectEvent]],
+    ):
+        # events at or below the last seen id are already cached, an overlapping
+        # update must not apply them twice
+        encounter_events = [
+            event
+            for event in encounter_events
+            if event.id > self.last_encounter_event_id
+        ]
+        combat_events = [
+            event for event in combat_events if event.id > self.last_combat_event_id
+        ]
+        status_effects = {
+            actor_id: [
+                event for event in events if event.id > self.last_status_effect_id
+            ]
+            for actor_id, events in status_effects.items()
+        }
+
+        # event lists are kept newest first, like they come out of the database
+        self.encounter_events = encounter_events + self.encounter_events
+        self.combat_events = combat_events + self.combat_events
+        for actor_id, events in status_effects.items():
+            if len(events) == 0:
+                continue
+            self.status_effects[actor_id] = (
+                self.status_effects.get(actor_id, []) + events
+            )
+
+        self.last_encounter_event_id = max(
+            self.last_encounter_event_id, self.__get_last_id(encounter_events)
+        )
+        self.last_combat_event_id = max(
+            self.last_combat_event_id, self.__get_last_id(combat_events)
+        )
+        self.last_status_effect_id = max(
+            self.last_status_effect_id,
+            self.__get_last_id(
+                [event for events in status_effects.values() for event in events]
+            ),
+        )
+
+    def has_duplicate_events(self) -> bool:
+        event_ids = [
+            [event.id for event in self.encounter_events],
+            [event.id for event in self.combat_events],
+            [event.id for events in self.status_effects.values() for event in events],
+        ]
+        return any(len(ids) != len(set(ids)) for ids in event_ids)
+
+    def get_participant_ids(self) -> list[int]:
+        return [
+            event.member_id
+            for event in reversed(self.encounter_events)
+            if event.encounter_event_type == EncounterEventType.MEMBER_ENGAGE
+        ]
+
+    def is_consistent_with(self, other: "EncounterCacheEntry") -> bool:
+        # events the other entry saw after our last update don't count as drift
+        return (
+            [event.id for event in self.encounter_events]
+            == [
+                event.id
+                for event in other.encounter_events
+                if event.id <= self.last_encounter_event_id
+            ]
+            and [event.id for event in self.combat_events]
+            == [
+                event.id
+                for event in other.combat_events
+                if event.id <= self.last_combat_event_id
+            ]
+            and self.__get_status_effect_ids(self.last_status_effect_id)
+            == other.__get_status_effect_ids(self.last_status_effect_id)
+        )
+
+    def __get_status_effect_ids(self, last_id: int) -> list[int]:
+        return sorted(
+            event.id
+            for events in self.status_effects.values()
+            for event in events
+            if event.id <= last_id
+        )
 
 
 class ContextLoader(Service):
 
+    EVENT_TYPES = {EventType.ENCOUNTER}
+    FULL_RELOAD_INTERVAL = 25
+    MAX_CACHED_ENCOUNTERS = 50
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -33,48 +157,131 @@ class ContextLoader(Service):
         self.factory: ObjectFactory = self.controller.get_service(ObjectFactory)
         self.log_name = "ContextLoader"
 
+        self.encounter_cache: dict[int, EncounterCacheEntry] = {}
+        self.encounter_locks: dict[int, asyncio.Lock] = {}
+
     async def listen_for_event(self, event: BotEvent):
-        pass
+        if event.type != EventType.ENCOUNTER:
+            return
 
-    async def load_encounter_context(self, encounter_id) -> EncounterContext:
-        encounter = await self.database.get_encounter_by_encounter_id(encounter_id)
-        encounter_events = await self.database.get_encounter_events_by_encounter_id(
-            encounter_id
-        )
-        combat_events = await self.database.get_combat_events_by_encounter_id(
-            encounter_id
-        )
-        status_effects = await self.database.get_status_effects_by_encounter(
-            encounter_id
-        )
-        thread_id = await self.database.get_encounter_thread(encounter_id)
-        thread = self.bot.get_channel(encounter.channel_id).get_thread(thread_id)
+        encounter_event: EncounterEvent = event
+        if encounter_event.encounter_event_type == EncounterEventType.END:
+            self.clear_encounter_cache(encounter_event.encounter_id)
 
-        enemy = await self.factory.get_enemy(encounter.enemy_type)
+    def clear_encounter_cache(self, encounter_id: int):
+        self.encounter_cache.pop(encounter_id, None)
+        self.actor_manager.clear_encounter_cache(encounter_id)
+        lock = self.encounter_locks.get(encounter_id)
+        if lock is not None and not lock.locked():
+            del self.encounter_locks[encounter_id]
 
-        opponent = await self.actor_manager.get_opponent(
-            enemy,
-            encounter.enemy_level,
-            encounter.max_hp,
+    async def __load_cache_entry(self, encounter_id: int) -> EncounterCacheEntry:
+        (
+            encounter,
             encounter_events,
             combat_events,
             status_effects,
+            thread_id,
+        ) = await asyncio.gather(
+            self.database.get_encounter_by_encounter_id(encounter_id),
+            self.database.get_encounter_events_by_encounter_id(encounter_id),
+            self.database.get_combat_events_by_encounter_id(encounter_id),
+            self.database.get_status_effects_by_encounter(encounter_id),
+            self.database.get_encounter_thread(encounter_id),
+        )
+        return EncounterCacheEntry(
+            encounter, thread_id, encounter_events, combat_events, status_effects
         )
 
-        combatant_ids = await self.database.get_encounter_participants_by_encounter_id(
-            encounter_id
+    async def __update_cache_entry(self, entry: EncounterCacheEntry):
+        encounter_id = entry.encounter.id
+        encounter_events, combat_events, status_effects = await asyncio.gather(
+            self.database.get_encounter_events_by_encounter_id(
+                encounter_id, entry.last_encounter_event_id
+            ),
+            self.database.get_combat_events_by_encounter_id(
+                encounter_id, entry.last_combat_event_id
+            ),
+            self.database.get_status_effects_by_encounter(
+                encounter_id, entry.last_status_effect_id
+            ),
         )
-        guild = self.bot.get_guild(encounter.guild_id)
-        members = [guild.get_member(id) for id in combatant_ids]
+        entry.add_events(encounter_events, combat_events, status_effects)
+
+    async def __get_cache_entry(self, encounter_id: int) -> EncounterCacheEntry:
+        # concurrent loads of one encounter would fetch the same new events twice
+        lock = self.encounter_locks.setdefault(encounter_id, asyncio.Lock())
+        async with lock:
+            return await self.__get_or_update_cache_entry(encounter_id)
 
-        combatants = []
+    async def __get_or_update_cache_entry(
+        self, encounter_id: int
+    ) -> EncounterCacheEntry:
+        entry = self.encounter_cache.get(encounter_id)
 
-        for member in members:
+        if entry is not None and entry.load_count < self.FULL_RELOAD_INTERVAL:
+            await self.__update_cache_entry(entry)
+            entry.load_count += 1
+            return entry
 
-            combatant = await self.actor_manager.get_character(
-                member, encounter_events, combat_events, status_effects
+        # every few loads the incremental state is checked against a full reload
+        if entry is not None:
+            await self.__update_cache_entry(entry)
+
+        reloaded = await self.__load_cache_entry(encounter_id)
+        if reloaded.encounter is None:
+            return reloaded
+
+        if entry is not None and (
+            entry.has_duplicate_events() or not entry.is_consistent_with(reloaded)
+        ):
+            self.logger.error(
+                reloaded.encounter.guild_id,
+                f"Encounter {encounter_id} context drifted from the database, reloaded it.",
+                self.log_name,
             )
-            combatants.append(combatant)
+            self.actor_manager.clear_encounter_cache(encounter_id)
+
+        self.encounter_cache.pop(encounter_id, None)
+        self.encounter_cache[encounter_id] = reloaded
+        while len(self.encounter_cache) > self.MAX_CACHED_ENCOUNTERS:
+            oldest_id = next(iter(self.encounter_cache))
+            self.clear_encounter_cache(oldest_id)
+
+        return reloaded
+
+    async def load_encounter_context(self, encounter_id) -> EncounterContext:
+        entry = await self.__get_cache_entry(encounter_id)
+
+        encounter = entry.encounter
+        # hand out copies so nothing downstream can modify the cached lists
+        encounter_events = list(entry.encounter_events)
+        combat_events = list(entry.combat_events)
+        status_effects = {
+            actor_id: list(events) for actor_id, events in entry.status_effects.items()
+        }
+        combatant_ids = entry.get_participant_ids()
+
+        thread = self.bot.get_channel(encounter.channel_id).get_thread(entry.thread_id)
+
+        enemy = await self.factory.get_enemy(encounter.enemy_type)
+
+        guild = self.bot.get_guild(encounter.guild_id)
+        members = [guild.get_member(id) for id in combatant_ids]
+
+        opponent, combatants = await asyncio.gather(
+            self.actor_manager.get_opponent(
+                enemy,
+                encounter.enemy_level,
+                encounter.max_hp,
+                encounter_events,
+                combat_events,
+                status_effects,
+            ),
+            self.actor_manager.get_characters(
+                members, encounter_events, combat_events, status_effects
+            ),
+        )
 
         return EncounterContext(
             encounter=encounter,
@@ -5,6 +5,7 @@ import random
 
 import discord
 from combat.actors import Actor, Character
+from combat.combat_formulas import CombatFormulas
 from combat.encounter import Encounter, EncounterContext, TurnData
 from combat.enemies import *  # noqa: F403
 from combat.enemies.types import EnemyType
@@ -51,6 +52,8 @@ from view.combat.leave_view import EncounterLeaveView
 
 class EncounterManager(Service):
 
+    EVENT_TYPES = {EventType.ENCOUNTER, EventType.COMBAT}
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -136,16 +139,8 @@ class EncounterManager(Service):
             ):
                 raise TypeError
         else:
-            enemies = [
-                await self.factory.get_enemy(enemy_type) for enemy_type in EnemyType
-            ]
-            possible_enemies = [
-                enemy
-                for enemy in enemies
-                if encounter_level >= enemy.min_level
-                and encounter_level <= enemy.max_level
-                and not enemy.is_boss
-            ]
+            enemies = await self.factory.get_enemies_by_level(encounter_level)
+            possible_enemies = [enemy for enemy in enemies if not enemy.is_boss]
 
             spawn_weights = [enemy.weighting for enemy in possible_enemies]
             spawn_weights = [1.0 / w for w in spawn_weights]
@@ -154,19 +149,8 @@ class EncounterManager(Service):
 
             enemy = random.choices(possible_enemies, weights=spawn_weights)[0]
 
-        effective_encounter_level = encounter_level
-        if enemy.is_boss:
-            effective_encounter_level += 1
-
         roll = random.uniform(0.95, 1.05)
-        enemy_health = (
-            enemy.health
-            * Config.ENEMY_HEALTH_SCALING[effective_encounter_level]
-            * Config.AVERAGE_PLAYER_POTENCY
-        )
-        enemy_health *= pow(
-            Config.ENEMY_HEALTH_LVL_FALLOFF, (encounter_level - enemy.min_level)
-        )
+        enemy_health = CombatFormulas.get_enemy_health(enemy, encounter_level)
         enemy_health *= roll
 
         return Encounter(guild_id, enemy.type, encounter_level, enemy_health)
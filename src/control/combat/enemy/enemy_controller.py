@@ -25,6 +25,8 @@ from events.bot_event import BotEvent
 
 class EnemyController(Service, ABC):
 
+    EVENT_TYPES = set()
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -4,7 +4,7 @@ from combat.enemies.types import EnemyType
 from combat.gear.bases import *  # noqa: F403
 from combat.gear.droppable import DroppableBase
 from combat.gear.types import Rarity
-from combat.skills.skill import Skill
+from combat.skills.skill import BaseSkill, Skill
 from combat.skills.skills import *  # noqa: F403
 from combat.skills.status_effect import (
     StatusEffect,
@@ -21,6 +21,8 @@ from events.bot_event import BotEvent
 
 class ObjectFactory(Service):
 
+    EVENT_TYPES = set()
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -32,38 +34,54 @@ class ObjectFactory(Service):
         self.controller = controller
         self.log_name = "Factory"
 
+        self.prototypes: dict[str, Enemy | BaseSkill | StatusEffect] = {}
+        self.enemies_by_level: dict[int, list[Enemy]] = None
+
     async def listen_for_event(self, event: BotEvent):
         pass
 
+    @staticmethod
+    def __create(object_type: str):
+        return globals()[object_type]()
+
+    def __get_prototype(self, object_type: str):
+        # shared instances, callers must not modify them
+        if object_type not in self.prototypes:
+            self.prototypes[object_type] = self.__create(object_type)
+        return self.prototypes[object_type]
+
     async def get_status_effect(self, status_type: StatusEffectType) -> StatusEffect:
-        status_effect = globals()[status_type]
-        return status_effect()
+        return self.__get_prototype(status_type)
 
     async def get_enemy(self, enemy_type: EnemyType) -> Enemy:
-        enemy = globals()[enemy_type]
-        instance = enemy()
-        return instance
+        return self.__get_prototype(enemy_type)
+
+    async def get_enemies(self) -> list[Enemy]:
+        return [self.__get_prototype(enemy_type) for enemy_type in EnemyType]
+
+    async def get_enemies_by_level(self, level: int) -> list[Enemy]:
+        if self.enemies_by_level is None:
+            self.enemies_by_level = {}
+            for enemy in await self.get_enemies():
+                for enemy_level in range(enemy.min_level, enemy.max_level + 1):
+                    self.enemies_by_level.setdefault(enemy_level, []).append(enemy)
+        return self.enemies_by_level.get(level, [])
 
     async def get_base(self, base_type) -> DroppableBase:
-        base_class = globals()[base_type]
-        instance = base_class()
-        return instance
+        # skill bases get scaled by their Skill, so every call gets a new instance
+        return self.__create(base_type)
 
     async def get_weapon_skill(
         self, skill_type: SkillType, rarity: Rarity, level: int
     ) -> Skill:
-        skill = globals()[skill_type]
-        instance = skill()
+        instance = self.__create(skill_type)
         weapon_skill = Skill(base_skill=instance, rarity=rarity, level=level)
         return weapon_skill
 
     async def get_enemy_skill(self, skill_type: SkillType) -> Skill:
-        skill = globals()[skill_type]
-        instance = skill()
+        instance = self.__create(skill_type)
         enemy_skill = Skill(base_skill=instance, rarity=Rarity.NORMAL, level=1)
         return enemy_skill
 
-    async def get_base_skill(self, skill_type: SkillType) -> Skill:
-        skill = globals()[skill_type]
-        instance = skill()
-        return instance
+    async def get_base_skill(self, skill_type: SkillType) -> BaseSkill:
+        return self.__get_prototype(skill_type)
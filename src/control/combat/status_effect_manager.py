@@ -36,6 +36,8 @@ from events.types import CombatEventType, EncounterEventType, EventType
 
 class CombatStatusEffectManager(Service):
 
+    EVENT_TYPES = {EventType.ENCOUNTER}
+
     def __init__(
         self,
         bot: commands.Bot,
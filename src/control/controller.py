@@ -1,10 +1,12 @@
 import asyncio
 import importlib
+import time
+from collections.abc import Awaitable, Callable
 
-import discord
 from datalayer.database import Database
 from discord.ext import commands
 from events.bot_event import BotEvent
+from events.types import EventType, UIEventType
 from events.ui_event import UIEvent
 from view.view_menu import ViewMenu
 
@@ -12,6 +14,29 @@ from control.logger import BotLogger
 from control.service import Service
 from control.types import ControllerModuleMap
 from control.view.view_controller import ViewController
+from control.view_registry import ViewRegistry
+
+
+class ListenerMetrics:
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.failures = 0
+        self.total_time = 0
+        self.max_time = 0
+
+    def track(self, duration: float, failed: bool) -> None:
+        self.calls += 1
+        if failed:
+            self.failures += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+
+    def get_average_time(self) -> float:
+        if self.calls == 0:
+            return 0
+        return self.total_time / self.calls
 
 
 class Controller:
@@ -28,7 +53,14 @@ class Controller:
 
         self.services: list[Service] = []
         self.view_controllers: list[ViewController] = []
-        self.views: list[ViewMenu] = []
+        self.views = ViewRegistry()
+
+        # event type -> listeners subscribed to it, EVENT_TYPES None subscribes to all
+        self.event_listeners: dict[EventType, list[Service]] = {}
+        self.global_event_listeners: list[Service] = []
+        self.ui_event_listeners: dict[UIEventType, list[ViewController]] = {}
+        self.global_ui_event_listeners: list[ViewController] = []
+        self.listener_metrics: dict[str, ListenerMetrics] = {}
 
     def register_view(self, view: ViewMenu):
         controller_type = view.controller_type.value
@@ -39,36 +71,65 @@ class Controller:
             ),
             controller_type,
         )
-        self.views.append(view)
+        self.views.add(view)
         self.add_view_controller(controller_class)
 
     def detach_view(self, view: ViewMenu):
-        if view in self.views:
-            self.views.remove(view)
+        self.views.remove(view)
 
     def detach_view_by_id(self, view_id: int):
-        for view in self.views:
-            if view.id == view_id:
-                self.views.remove(view)
-
-    async def execute_garbage_collection(self):
-        for view in self.views:
-            if view.message is None:
-                continue
-
-            try:
-                await asyncio.sleep(5)
-                await view.message.edit()
-            except (discord.NotFound, discord.HTTPException):
-                if view in self.views:
-                    self.views.remove(view)
+        self.views.remove_by_id(view_id)
+
+    async def execute_garbage_collection(self) -> int:
+        return self.views.evict_expired()
+
+    def __subscribe(self, listener: Service):
+        if listener.EVENT_TYPES is None:
+            self.global_event_listeners.append(listener)
+        else:
+            for event_type in listener.EVENT_TYPES:
+                self.event_listeners.setdefault(event_type, []).append(listener)
+
+        if not isinstance(listener, ViewController):
+            return
+
+        if listener.UI_EVENT_TYPES is None:
+            self.global_ui_event_listeners.append(listener)
+        else:
+            for event_type in listener.UI_EVENT_TYPES:
+                self.ui_event_listeners.setdefault(event_type, []).append(listener)
+
+    async def __run_listener(
+        self,
+        name: str,
+        listener_call: Callable[[BotEvent | UIEvent], Awaitable[None]],
+        event: BotEvent | UIEvent,
+    ):
+        start = time.perf_counter()
+        failed = False
+        try:
+            await listener_call(event)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            if name not in self.listener_metrics:
+                self.listener_metrics[name] = ListenerMetrics(name)
+            self.listener_metrics[name].track(time.perf_counter() - start, failed)
 
     async def dispatch_event(self, event: BotEvent):
+        listeners = self.global_event_listeners + self.event_listeners.get(
+            event.type, []
+        )
         tasks = []
-        for service in self.services:
-            tasks.append(asyncio.create_task(service.listen_for_event(event)))
-        for view_controller in self.view_controllers:
-            tasks.append(asyncio.create_task(view_controller.listen_for_event(event)))
+        for listener in listeners:
+            tasks.append(
+                asyncio.create_task(
+                    self.__run_listener(
+                        listener.__class__.__name__, listener.listen_for_event, event
+                    )
+                )
+            )
         result = await asyncio.gather(*tasks, return_exceptions=True)
 
         for res in result:
@@ -76,19 +137,47 @@ class Controller:
                 raise res
 
     async def dispatch_ui_event(self, event: UIEvent):
+        view_controllers = self.global_ui_event_listeners + self.ui_event_listeners.get(
+            event.type, []
+        )
         tasks = []
-        for view_controller in self.view_controllers:
+        for view_controller in view_controllers:
+            tasks.append(
+                asyncio.create_task(
+                    self.__run_listener(
+                        view_controller.__class__.__name__,
+                        view_controller.listen_for_ui_event,
+                        event,
+                    )
+                )
+            )
+        views = self.views
+        if event.view_id is not None:
+            # targeted events are ignored by every other view
+            view = self.views.get(event.view_id)
+            views = [] if view is None else [view]
+
+        for view in views:
             tasks.append(
-                asyncio.create_task(view_controller.listen_for_ui_event(event))
+                asyncio.create_task(
+                    self.__run_listener(
+                        view.__class__.__name__, view.listen_for_ui_event, event
+                    )
+                )
             )
-        for view in self.views:
-            tasks.append(asyncio.create_task(view.listen_for_ui_event(event)))
         result = await asyncio.gather(*tasks, return_exceptions=True)
 
         for res in result:
             if isinstance(res, Exception):
                 raise res
 
+    def get_slowest_listeners(self, count: int = 5) -> list[ListenerMetrics]:
+        return sorted(
+            self.listener_metrics.values(),
+            key=lambda metrics: metrics.total_time,
+            reverse=True,
+        )[:count]
+
     def get_service(self, service_class: type[Service]) -> Service:
         for service in self.services:
             if isinstance(service, service_class):
@@ -96,13 +185,11 @@ class Controller:
 
         new_service = service_class(self.bot, self.logger, self.database, self)
         self.services.append(new_service)
+        self.__subscribe(new_service)
         return new_service
 
     def get_view(self, id: int) -> ViewMenu:
-        for view in self.views:
-            if view.id == id:
-                return view
-        return None
+        return self.views.get(id)
 
     def add_view_controller(self, controller: type[ViewController]) -> ViewController:
         for view_controller in self.view_controllers:
@@ -111,3 +198,4 @@ class Controller:
 
         new_controller = controller(self.bot, self.logger, self.database, self)
         self.view_controllers.append(new_controller)
+        self.__subscribe(new_controller)
@@ -33,6 +33,10 @@ from control.settings_manager import SettingsManager
 
 class EventManager(Service):
 
+    # every event is logged
+    EVENT_TYPES = None
+    RANKING_LIMIT = 30
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -452,15 +456,17 @@ class EventManager(Service):
                     parsing_list.items(), key=lambda item: item[1], reverse=True
                 )
             case RankingType.BEANS:
-                parsing_list = await self.database.get_guild_beans_rankings(
-                    guild_id, season
-                )
                 # only subtract lootboxes until patch where beans got removed.
                 lootbox_purchases = await self.database.get_lootbox_purchases_by_guild(
                     guild_id,
                     datetime.datetime(year=2024, month=4, day=22, hour=14).timestamp(),
                     season,
                 )
+                # subtracting can only push buyers down, so the top n after
+                # deduction is always within the raw top n + number of buyers
+                parsing_list = await self.database.get_guild_beans_rankings(
+                    guild_id, season, self.RANKING_LIMIT + len(lootbox_purchases)
+                )
                 loot_box_item = await self.item_manager.get_item(
                     guild_id, ItemType.LOOTBOX
                 )
@@ -0,0 +1,84 @@
+import datetime
+
+from datalayer.database import Database
+from datalayer.garden import UserGarden
+from datalayer.types import PlotState
+from discord.ext import commands
+from events.bot_event import BotEvent
+from events.garden_event import GardenEvent
+from events.types import EventType, GardenEventType
+
+from control.controller import Controller
+from control.logger import BotLogger
+from control.service import Service
+
+
+class GardenManager(Service):
+
+    EVENT_TYPES = {EventType.GARDEN}
+
+    def __init__(
+        self,
+        bot: commands.Bot,
+        logger: BotLogger,
+        database: Database,
+        controller: Controller,
+    ):
+        super().__init__(bot, logger, database)
+        self.controller = controller
+        self.log_name = "Garden"
+
+        # guild -> garden -> earliest time a growing plot can become ready
+        self.ready_index: dict[int, dict[int, datetime.datetime | None]] = {}
+        self.dirty_gardens: dict[int, set[int]] = {}
+
+    async def listen_for_event(self, event: BotEvent):
+        match event.type:
+            case EventType.GARDEN:
+                garden_event: GardenEvent = event
+                if garden_event.garden_event_type == GardenEventType.NOTIFICATION:
+                    return
+                self.dirty_gardens.setdefault(garden_event.guild_id, set()).add(
+                    garden_event.garden_id
+                )
+
+    @staticmethod
+    def get_next_ready_datetime(garden: UserGarden) -> datetime.datetime | None:
+        # estimates assume ideal care from here on, so they never come too late
+        next_ready = None
+        for plot in garden.plots:
+            if plot.empty() or plot.get_status() == PlotState.READY:
+                continue
+            harvest = plot.get_estimated_harvest_datetime()
+            if harvest is None:
+                continue
+            if next_ready is None or harvest < next_ready:
+                next_ready = harvest
+        return next_ready
+
+    def __get_due_garden_ids(self, guild_id: int) -> set[int] | None:
+        if guild_id not in self.ready_index:
+            return None
+
+        now = datetime.datetime.now()
+        due_gardens = set(self.dirty_gardens.get(guild_id, set()))
+        for garden_id, next_ready in self.ready_index[guild_id].items():
+            if next_ready is not None and next_ready <= now:
+                due_gardens.add(garden_id)
+        return due_gardens
+
+    async def get_due_gardens(self, guild_id: int) -> list[UserGarden]:
+        due_gardens = self.__get_due_garden_ids(guild_id)
+        if due_gardens is not None and len(due_gardens) == 0:
+            return []
+
+        self.dirty_gardens.pop(guild_id, None)
+        gardens = await self.database.get_guild_gardens(guild_id)
+        if due_gardens is not None:
+            gardens = [garden for garden in gardens if garden.id in due_gardens]
+
+        guild_index = self.ready_index.setdefault(guild_id, {})
+        for garden in gardens:
+            guild_index[garden.id] = self.get_next_ready_datetime(garden)
+
+        return gardens
@@ -28,6 +28,8 @@ from control.settings_manager import SettingsManager
 
 class InteractionManager(Service):
 
+    EVENT_TYPES = set()
+
     def __init__(
         self,
         bot: commands.Bot,
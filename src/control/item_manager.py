@@ -16,10 +16,8 @@ from events.inventory_event import InventoryEvent
 from events.lootbox_event import LootBoxEvent
 from events.notification_event import NotificationEvent
 from events.types import BeansEventType, LootBoxEventType
-
-# needed for global access
-from items import *  # noqa: F403
 from items.item import Item
+from items.item_catalog import ItemCatalog
 from items.types import ItemState, ItemType
 from view.lootbox.view import LootBoxView
 from view.shop.confirm_view import ShopConfirmView
@@ -33,6 +31,8 @@ from control.settings_manager import SettingsManager
 
 class ItemManager(Service):
 
+    EVENT_TYPES = set()
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -46,42 +46,40 @@ class ItemManager(Service):
             SettingsManager
         )
         self.log_name = "Items"
+        self.item_catalogs: dict[int, ItemCatalog] = {}
 
     async def listen_for_event(self, event: BotEvent):
         pass
 
-    async def get_item(self, guild_id: int, item_type: ItemType) -> Item:
-
-        item = globals()[item_type]
-        instance = item(
-            await self.settings_manager.get_shop_item_price(guild_id, item_type)
+    async def get_item_catalog(self, guild_id: int) -> ItemCatalog:
+        version = self.settings_manager.get_module_version(
+            guild_id, SettingsManager.SHOP_SUBSETTINGS_KEY
         )
+        catalog = self.item_catalogs.get(guild_id)
+        if catalog is not None and catalog.version == version:
+            return catalog
 
-        return instance
+        prices = {
+            item_type: await self.settings_manager.get_shop_item_price(
+                guild_id, item_type
+            )
+            for item_type in ItemType
+        }
+        catalog = ItemCatalog(prices, version)
+        self.item_catalogs[guild_id] = catalog
+        return catalog
+
+    async def get_item(self, guild_id: int, item_type: ItemType) -> Item:
+        catalog = await self.get_item_catalog(guild_id)
+        return catalog.get_item(item_type)
 
     async def get_catalog_items(self, guild_id: int) -> list[Item]:
-        items = [x for x in ItemType]
-        output = []
-        for item_type in items:
-            item = await self.get_item(guild_id, item_type)
-            if not item.secret:
-                output.append(item)
-
-        output = sorted(
-            output,
-            key=lambda x: (x.permanent, x.shop_category.value, x.cost),
-        )
-        return output
+        catalog = await self.get_item_catalog(guild_id)
+        return catalog.get_catalog_items()
 
     async def get_shop_items(self, guild_id: int) -> list[Item]:
-        items = [x for x in ItemType]
-        output = []
-        for item_type in items:
-            item = await self.get_item(guild_id, item_type)
-            if not item.hide_in_shop:
-                output.append(item)
-
-        return output
+        catalog = await self.get_item_catalog(guild_id)
+        return catalog.get_shop_items()
 
     async def create_loot_box(
         self, guild_id: int, size: int = 1, force_type: LootboxType = None
@@ -318,11 +316,8 @@ class ItemManager(Service):
     async def get_user_inventory(self, guild_id: int, user_id: int) -> UserInventory:
         item_data = await self.database.get_item_counts_by_user(guild_id, user_id)
 
-        inventory_items: list[Item] = []
-
-        for item_type in item_data:
-            item = await self.get_item(guild_id, item_type)
-            inventory_items.append(item)
+        catalog = await self.get_item_catalog(guild_id)
+        inventory_items = [catalog.get_item(item_type) for item_type in item_data]
 
         inventory_items = sorted(
             inventory_items,
@@ -369,6 +364,11 @@ class ItemManager(Service):
     async def get_user_items_activated(
         self, guild_id: int, user_id: int, action: ItemTrigger
     ) -> list[Item]:
+        catalog = await self.get_item_catalog(guild_id)
+        triggered_types = catalog.get_triggered_types(action)
+        if len(triggered_types) == 0:
+            return []
+
         inventory_items = await self.database.get_item_counts_by_user(guild_id, user_id)
 
         item_states = await self.database.get_user_item_states(guild_id, user_id)
@@ -376,6 +376,8 @@ class ItemManager(Service):
         output = []
 
         for item_type, _ in inventory_items.items():
+            if item_type not in triggered_types:
+                continue
 
             if (
                 item_type in item_states
@@ -383,12 +385,7 @@ class ItemManager(Service):
             ):
                 continue
 
-            item = await self.get_item(guild_id, item_type)
-
-            if not item.activated(action):
-                continue
-
-            output.append(item)
+            output.append(catalog.get_item(item_type))
 
         return output
 
@@ -466,17 +463,21 @@ class ItemManager(Service):
     async def get_guild_items_activated(
         self, guild_id: int, trigger: ItemTrigger
     ) -> dict[int, list[Item]]:
+        catalog = await self.get_item_catalog(guild_id)
+        triggered_types = catalog.get_triggered_types(trigger)
+        if len(triggered_types) == 0:
+            return {}
+
         guild_item_counts = await self.database.get_item_counts_by_guild(guild_id)
         items: dict[int, list[Item]] = {}
 
         for user_id, item_counts in guild_item_counts.items():
             for item_type, count in item_counts.items():
-
-                item = await self.get_item(guild_id, item_type)
-
-                if count <= 0 or not item.activated(trigger):
+                if count <= 0 or item_type not in triggered_types:
                     continue
 
+                item = catalog.get_item(item_type)
+
                 if user_id not in items:
                     items[user_id] = [item]
                     continue
@@ -485,14 +486,16 @@ class ItemManager(Service):
         return items
 
     async def consume_trigger_items(self, guild: discord.Guild, trigger: ItemTrigger):
+        catalog = await self.get_item_catalog(guild.id)
+        triggered_types = catalog.get_triggered_types(trigger)
+        if len(triggered_types) == 0:
+            return
+
         guild_item_counts = await self.database.get_item_counts_by_guild(guild.id)
 
         for user_id, item_counts in guild_item_counts.items():
             for item_type, count in item_counts.items():
-
-                item = await self.get_item(guild.id, item_type)
-
-                if count <= 0 or not item.activated(trigger):
+                if count <= 0 or item_type not in triggered_types:
                     continue
 
                 amount = 1
@@ -1,4 +1,7 @@
+import asyncio
+import contextlib
 import datetime
+import heapq
 import random
 
 import discord
@@ -23,6 +26,9 @@ from control.settings_manager import SettingsManager
 
 class JailManager(Service):
 
+    EVENT_TYPES = {EventType.JAIL, EventType.INVENTORY}
+    RELEASE_RETRY_DELAY = 20
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -37,8 +43,19 @@ class JailManager(Service):
         )
         self.log_name = "Jail"
 
+        self.active_jails: dict[int, UserJail] = {}
+        self.jail_durations: dict[int, int] = {}
+        self.release_deadlines: dict[int, float] = {}
+        self.release_queue: list[tuple[float, int]] = []
+        self.release_schedule_changed = asyncio.Event()
+        self.release_schedule_loaded = False
+        self.release_task: asyncio.Task = None
+
     async def listen_for_event(self, event: BotEvent):
         match event.type:
+            case EventType.JAIL:
+                jail_event: JailEvent = event
+                await self.update_release_schedule(jail_event)
             case EventType.INVENTORY:
                 inventory_event: InventoryEvent = event
                 match inventory_event.item_type:
@@ -164,3 +181,158 @@ class JailManager(Service):
             release = timestamp_now + (duration * 60)
             jail_announcement = f"<@{victim}> was sentenced to Jail. They will be released <t:{release}:R>."
             await self.announce(guild, jail_announcement)
+
+    def __schedule_release(self, jail_id: int) -> None:
+        jail = self.active_jails[jail_id]
+        release_timestamp = jail.jailed_on + datetime.timedelta(
+            minutes=self.jail_durations[jail_id]
+        )
+        deadline = release_timestamp.timestamp()
+
+        # outdated heap entries are skipped once they reach the top
+        self.release_deadlines[jail_id] = deadline
+        heapq.heappush(self.release_queue, (deadline, jail_id))
+        self.release_schedule_changed.set()
+
+    def __retry_release(self, jail_id: int) -> None:
+        deadline = datetime.datetime.now().timestamp() + self.RELEASE_RETRY_DELAY
+        self.release_deadlines[jail_id] = deadline
+        heapq.heappush(self.release_queue, (deadline, jail_id))
+        self.release_schedule_changed.set()
+
+    def __unschedule_release(self, jail_id: int) -> None:
+        self.active_jails.pop(jail_id, None)
+        self.jail_durations.pop(jail_id, None)
+        self.release_deadlines.pop(jail_id, None)
+
+    async def update_release_schedule(self, event: JailEvent) -> None:
+        if not self.release_schedule_loaded or event.jail_id is None:
+            return
+
+        jail_id = event.jail_id
+        match event.jail_event_type:
+            case JailEventType.RELEASE:
+                self.__unschedule_release(jail_id)
+                return
+            case JailEventType.JAIL:
+                jail = await self.database.get_jail(jail_id)
+                if jail is None:
+                    return
+                self.active_jails[jail_id] = jail
+                self.jail_durations[jail_id] = event.duration
+            case _:
+                if jail_id not in self.active_jails:
+                    return
+                self.jail_durations[jail_id] += event.duration
+
+        self.__schedule_release(jail_id)
+
+    async def load_release_schedule(self) -> None:
+        self.release_schedule_loaded = True
+        active_jails = await self.database.get_active_jails()
+
+        for jail in active_jails:
+            if jail.id in self.active_jails:
+                continue
+            self.active_jails[jail.id] = jail
+            self.jail_durations[jail.id] = await self.get_jail_duration(jail)
+            self.__schedule_release(jail.id)
+
+    async def start_release_scheduler(self) -> None:
+        await self.load_release_schedule()
+
+        if self.release_task is None or self.release_task.done():
+            self.release_task = asyncio.create_task(self.__release_scheduler())
+
+    async def __release_scheduler(self) -> None:
+        while True:
+            self.release_schedule_changed.clear()
+
+            while (
+                len(self.release_queue) > 0
+                and self.release_deadlines.get(self.release_queue[0][1])
+                != self.release_queue[0][0]
+            ):
+                heapq.heappop(self.release_queue)
+
+            timeout = None
+            if len(self.release_queue) > 0:
+                deadline = self.release_queue[0][0]
+                timeout = max(0, deadline - datetime.datetime.now().timestamp())
+
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self.release_schedule_changed.wait(), timeout=timeout
+                )
+
+            try:
+                await self.release_due_jails()
+            except Exception as e:
+                self.logger.error("sys", f"Jail release failed: {e}", self.log_name)
+
+    async def release_due_jails(self) -> None:
+        now = datetime.datetime.now().timestamp()
+
+        while len(self.release_queue) > 0 and self.release_queue[0][0] <= now:
+            deadline, jail_id = heapq.heappop(self.release_queue)
+            if self.release_deadlines.get(jail_id) != deadline:
+                continue
+            jail = self.active_jails[jail_id]
+            try:
+                await self.release_expired_jail(jail)
+            except Exception as e:
+                self.logger.error(
+                    jail.guild_id,
+                    f"Releasing jail {jail_id} failed, retrying in {self.RELEASE_RETRY_DELAY}s: {e}",
+                    self.log_name,
+                )
+                # the jail stays active until its release event went through
+                if jail_id in self.active_jails:
+                    self.__retry_release(jail_id)
+
+    async def release_expired_jail(self, jail: UserJail) -> None:
+        guild_id = jail.guild_id
+
+        # the schedule is only a hint, the jail events stay authoritative
+        duration = await self.get_jail_duration(jail)
+        release_timestamp = jail.jailed_on + datetime.timedelta(minutes=duration)
+        if release_timestamp > datetime.datetime.now():
+            self.jail_durations[jail.id] = duration
+            self.__schedule_release(jail.id)
+            return
+
+        guild = self.bot.get_guild(guild_id)
+        member = guild.get_member(jail.member_id) if guild is not None else None
+
+        time_now = datetime.datetime.now()
+        event = JailEvent(
+            time_now, guild_id, JailEventType.RELEASE, self.bot.user.id, 0, jail.id
+        )
+
+        if member is None:
+            self.logger.log(
+                guild_id,
+                f"Member {jail.member_id} not found, jail {jail.id} was marked as released.",
+                self.log_name,
+            )
+            await self.controller.dispatch_event(event)
+            self.__unschedule_release(jail.id)
+            return
+
+        jail_role = await self.settings_manager.get_jail_role(guild_id)
+        role = member.get_role(jail_role)
+        if role is not None:
+            await member.remove_roles(role)
+
+        duration_text = BotUtil.strfdelta(duration, inputtype="minutes")
+        self.logger.log(
+            guild_id,
+            f"User {member.name} was released from jail after {duration_text}.",
+            self.log_name,
+        )
+
+        await self.controller.dispatch_event(event)
+        self.__unschedule_release(jail.id)
+        await self.announce(
+            guild, f"<@{member.id}> was released from jail after {duration_text}."
+        )
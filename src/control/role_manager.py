@@ -16,6 +16,7 @@ from control.settings_manager import SettingsManager
 
 class RoleManager(Service):
 
+    EVENT_TYPES = {EventType.INVENTORY}
     LOTTERY_ROLE_NAME = "Lottery"
     TIMEOUT_ROLE_NAME = "Timeout"
 
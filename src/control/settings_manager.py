@@ -1,3 +1,6 @@
+import json
+from typing import Any
+
 from datalayer.database import Database
 from datalayer.settings import GuildSettings, ModuleSettings
 from discord.ext import commands
@@ -11,6 +14,7 @@ from control.service import Service
 
 class SettingsManager(Service):
 
+    EVENT_TYPES = set()
     DEFAULT_KEY = "defaults"
 
     GENERAL_SUBSETTINGS_KEY = "general"
@@ -289,21 +293,67 @@ class SettingsManager(Service):
         self.settings.add_module(combat_settings)
         self.settings.add_module(karma_settings)
 
+        self.setting_cache: dict[tuple[int, str, str], Any] = {}
+        self.cache_loaded = False
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.module_versions: dict[tuple[int, str], int] = {}
+
     async def listen_for_event(self, event: BotEvent) -> None:
         pass
 
+    async def load_settings(self) -> None:
+        self.setting_cache = await self.database.get_settings()
+        self.cache_loaded = True
+        self.logger.log(
+            "init", f"Loaded {len(self.setting_cache)} guild settings.", cog="Settings"
+        )
+
+    def clear_setting_cache(self) -> None:
+        self.setting_cache = {}
+        self.cache_loaded = False
+
+    def get_cache_stats(self) -> tuple[int, int]:
+        return self.cache_hits, self.cache_misses
+
+    def get_module_version(self, guild: int, subsetting_key: str) -> int:
+        return self.module_versions.get((int(guild), str(subsetting_key)), 0)
+
     async def update_setting(
         self, guild: int, subsetting_key: str, key: str, value
     ) -> None:
         await self.database.update_setting(guild, subsetting_key, key, value)
+        # store the value the way it would come back from the database
+        self.setting_cache[(int(guild), str(subsetting_key), str(key))] = json.loads(
+            json.dumps(value)
+        )
+        version_key = (int(guild), str(subsetting_key))
+        self.module_versions[version_key] = self.module_versions.get(version_key, 0) + 1
 
     async def get_setting(self, guild: int, subsetting_key: str, key: str):
-        result = await self.database.get_setting(guild, subsetting_key, key)
+        cache_key = (int(guild), str(subsetting_key), str(key))
+
+        if cache_key in self.setting_cache:
+            self.cache_hits += 1
+            result = self.setting_cache[cache_key]
+        elif self.cache_loaded:
+            # every stored setting is cached after warmup, so this one was never set
+            self.cache_hits += 1
+            result = None
+        else:
+            self.cache_misses += 1
+            result = await self.database.get_setting(guild, subsetting_key, key)
+            if result is not None:
+                self.setting_cache[cache_key] = result
 
-        if result is not None:
-            return result
+        if result is None:
+            result = self.settings.get_default_setting(subsetting_key, key)
 
-        return self.settings.get_default_setting(subsetting_key, key)
+        # callers modify returned lists in place, so they must not get the
+        # cached or default object itself
+        if isinstance(result, list | dict):
+            return json.loads(json.dumps(result))
+        return result
 
     async def get_setting_title(self, cog: str, key: str):
         result = self.settings.get_module(cog)
@@ -0,0 +1,49 @@
+import contextlib
+import sys
+import time
+from collections.abc import Iterator
+
+
+class StartupPhase:
+
+    def __init__(self, name: str, duration: float, module_count: int):
+        self.name = name
+        self.duration = duration
+        self.module_count = module_count
+
+
+class StartupProfiler:
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases: list[StartupPhase] = []
+        self.finished = False
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        module_count = len(sys.modules)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append(
+                StartupPhase(
+                    name,
+                    time.perf_counter() - start,
+                    len(sys.modules) - module_count,
+                )
+            )
+
+    def get_elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+    def get_summary(self) -> str:
+        summary = f"Startup took {self.get_elapsed():.2f}s."
+        for phase in sorted(
+            self.phases, key=lambda phase: phase.duration, reverse=True
+        ):
+            summary += (
+                f"\n  {phase.name}: {phase.duration * 1000:.0f}ms"
+                f" ({phase.module_count} new modules)"
+            )
+        return summary
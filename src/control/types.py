@@ -23,6 +23,11 @@ class AIVersion(str, Enum):
     GPT4 = "gpt-4o"
 
 
+class AIRequestPriority(int, Enum):
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
 class ControllerModuleMap(str, Enum):
 
     @staticmethod
@@ -25,6 +25,15 @@ from control.view.view_controller import ViewController
 
 class CombatViewController(ViewController):
 
+    EVENT_TYPES = {EventType.ENCOUNTER}
+    UI_EVENT_TYPES = {
+        UIEventType.COMBAT_ENGAGE,
+        UIEventType.COMBAT_LEAVE,
+        UIEventType.COMBAT_USE_SKILL,
+        UIEventType.COMBAT_TIMEOUT,
+        UIEventType.COMBAT_INITIATE,
+    }
+
     def __init__(
         self,
         bot: commands.Bot,
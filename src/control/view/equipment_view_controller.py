@@ -32,6 +32,20 @@ from control.view.view_controller import ViewController
 
 class EquipmentViewController(ViewController):
 
+    EVENT_TYPES = {EventType.INVENTORY}
+    UI_EVENT_TYPES = {
+        UIEventType.GEAR_OPEN_SECELT,
+        UIEventType.GEAR_OPEN_OVERVIEW,
+        UIEventType.GEAR_EQUIP,
+        UIEventType.GEAR_LOCK,
+        UIEventType.GEAR_UNLOCK,
+        UIEventType.GEAR_DISMANTLE,
+        UIEventType.SKILL_EQUIP_VIEW,
+        UIEventType.SKILL_MANAGE_VIEW,
+        UIEventType.SKILLS_EQUIP,
+        UIEventType.FORGE_USE,
+    }
+
     def __init__(
         self,
         bot: commands.Bot,
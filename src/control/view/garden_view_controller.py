@@ -28,6 +28,16 @@ from control.view.view_controller import ViewController
 
 class GardenViewController(ViewController):
 
+    EVENT_TYPES = {EventType.BEANS, EventType.INVENTORY}
+    UI_EVENT_TYPES = {
+        UIEventType.GARDEN_SELECT_PLOT,
+        UIEventType.GARDEN_PLOT_BACK,
+        UIEventType.GARDEN_PLOT_WATER,
+        UIEventType.GARDEN_PLOT_PLANT,
+        UIEventType.GARDEN_PLOT_REMOVE,
+        UIEventType.GARDEN_PLOT_HARVEST,
+    }
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -75,6 +75,14 @@ class InventorySellAction(InventoryInteraction):
 
 class InventoryViewController(ViewController):
 
+    EVENT_TYPES = {EventType.BEANS, EventType.INVENTORY}
+    UI_EVENT_TYPES = {
+        UIEventType.INVENTORY_ITEM_ACTION,
+        UIEventType.INVENTORY_SELL,
+        UIEventType.SHOP_RESPONSE_CONFIRM_SUBMIT,
+        UIEventType.SHOP_RESPONSE_USER_SUBMIT,
+    }
+
     def __init__(
         self,
         bot: commands.Bot,
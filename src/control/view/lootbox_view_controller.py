@@ -33,6 +33,8 @@ class MimicProtectedException(Exception):
 
 class LootBoxViewController(ViewController):
 
+    UI_EVENT_TYPES = {UIEventType.CLAIM_LOOTBOX}
+
     def __init__(
         self,
         bot: commands.Bot,
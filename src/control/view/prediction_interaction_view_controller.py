@@ -21,6 +21,18 @@ from control.view.view_controller import ViewController
 
 class PredictionInteractionViewController(ViewController):
 
+    EVENT_TYPES = {EventType.PREDICTION}
+    UI_EVENT_TYPES = {
+        UIEventType.PREDICTION_INTERACTION_CONFIRM_OUTCOME,
+        UIEventType.PREDICTION_INTERACTION_DENY,
+        UIEventType.PREDICTION_INTERACTION_APPROVE,
+        UIEventType.PREDICTION_INTERACTION_LOCK,
+        UIEventType.PREDICTION_INTERACTION_UNLOCK,
+        UIEventType.PREDICTION_INTERACTION_EDIT,
+        UIEventType.PREDICTION_INTERACTION_REFUND,
+        UIEventType.PREDICTION_INTERACTION_RESUBMIT,
+    }
+
     def __init__(
         self,
         bot: commands.Bot,
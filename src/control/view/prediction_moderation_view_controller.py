@@ -24,6 +24,13 @@ from control.view.view_controller import ViewController
 
 class PredictionModerationViewController(ViewController):
 
+    EVENT_TYPES = {EventType.PREDICTION}
+    UI_EVENT_TYPES = {
+        UIEventType.PREDICTION_MODERATION_EDIT,
+        UIEventType.PREDICTION_MODERATION_CHANGED,
+        UIEventType.PREDICTION_INTERACTION_PARENT_CHANGED,
+    }
+
     def __init__(
         self,
         bot: commands.Bot,
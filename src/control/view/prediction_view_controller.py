@@ -24,6 +24,16 @@ from control.view.view_controller import ViewController
 
 class PredictionViewController(ViewController):
 
+    EVENT_TYPES = {EventType.PREDICTION, EventType.BEANS}
+    UI_EVENT_TYPES = {
+        UIEventType.PREDICTION_SELECT,
+        UIEventType.PREDICTION_CHANGED,
+        UIEventType.PREDICTION_INTERACTION_PARENT_CHANGED,
+        UIEventType.PREDICTION_PLACE_BET,
+        UIEventType.PREDICTION_OPEN_UI,
+        UIEventType.PREDICTION_PREDICTION_SUBMIT,
+    }
+
     def __init__(
         self,
         bot: commands.Bot,
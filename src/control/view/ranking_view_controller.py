@@ -15,6 +15,8 @@ from control.view.view_controller import ViewController
 
 class RankingViewController(ViewController):
 
+    UI_EVENT_TYPES = {UIEventType.UPDATE_RANKINGS}
+
     def __init__(
         self,
         bot: commands.Bot,
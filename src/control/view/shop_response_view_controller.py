@@ -26,6 +26,15 @@ from control.view.view_controller import ViewController
 
 class ShopResponseViewController(ViewController):
 
+    UI_EVENT_TYPES = {
+        UIEventType.REACTION_SELECTED,
+        UIEventType.SHOP_RESPONSE_CONFIRM_SUBMIT,
+        UIEventType.SHOP_RESPONSE_USER_SUBMIT,
+        UIEventType.SHOP_RESPONSE_COLOR_SUBMIT,
+        UIEventType.SHOP_RESPONSE_REACTION_SUBMIT,
+        UIEventType.SHOP_RESPONSE_PREDICTION_SUBMIT,
+    }
+
     def __init__(
         self,
         bot: commands.Bot,
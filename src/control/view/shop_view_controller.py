@@ -41,6 +41,13 @@ class ShopInteraction:
 
 class ShopViewController(ViewController):
 
+    EVENT_TYPES = {EventType.BEANS, EventType.INVENTORY}
+    UI_EVENT_TYPES = {
+        UIEventType.SHOP_BUY,
+        UIEventType.SHOP_CHANGED,
+        UIEventType.SHOW_INVENTORY,
+    }
+
     def __init__(
         self,
         bot: commands.Bot,
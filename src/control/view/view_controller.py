@@ -1,6 +1,7 @@
 from datalayer.database import Database
 from discord.ext import commands
 from events.bot_event import BotEvent
+from events.types import EventType, UIEventType
 from events.ui_event import UIEvent
 
 from control.logger import BotLogger
@@ -9,6 +10,9 @@ from control.service import Service
 
 class ViewController(Service):
 
+    EVENT_TYPES: set[EventType] | None = set()
+    UI_EVENT_TYPES: set[UIEventType] | None = set()
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -0,0 +1,93 @@
+import time
+from collections.abc import Iterator
+
+from view.view_menu import ViewMenu
+
+
+class ViewRegistry:
+
+    # followup messages can no longer be edited once the interaction token expires
+    INTERACTION_TOKEN_LIFETIME = 15 * 60
+
+    def __init__(self):
+        self.views: dict[int, ViewMenu] = {}
+        self.registered_at: dict[int, float] = {}
+        self.index_keys: dict[int, tuple[int, int]] = {}
+        self.member_index: dict[int, set[int]] = {}
+        self.guild_index: dict[int, set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.views)
+
+    def __iter__(self) -> Iterator[ViewMenu]:
+        # snapshot, views detach themselves while being iterated
+        return iter(list(self.views.values()))
+
+    def __contains__(self, view: ViewMenu) -> bool:
+        return self.views.get(view.id) is view
+
+    @staticmethod
+    def __add_to_index(index: dict[int, set[int]], key: int, view_id: int) -> None:
+        if key is None:
+            return
+        index.setdefault(key, set()).add(view_id)
+
+    @staticmethod
+    def __remove_from_index(index: dict[int, set[int]], key: int, view_id: int) -> None:
+        if key not in index:
+            return
+        index[key].discard(view_id)
+        if len(index[key]) == 0:
+            del index[key]
+
+    def add(self, view: ViewMenu) -> None:
+        if view.id in self.views:
+            self.remove_by_id(view.id)
+
+        member_id = view.member_id
+        guild_id = getattr(view, "guild_id", None)
+
+        self.views[view.id] = view
+        self.registered_at[view.id] = time.monotonic()
+        self.index_keys[view.id] = (member_id, guild_id)
+        self.__add_to_index(self.member_index, member_id, view.id)
+        self.__add_to_index(self.guild_index, guild_id, view.id)
+
+    def remove(self, view: ViewMenu) -> None:
+        if view in self:
+            self.remove_by_id(view.id)
+
+    def remove_by_id(self, view_id: int) -> None:
+        if view_id not in self.views:
+            return
+        del self.views[view_id]
+        del self.registered_at[view_id]
+        member_id, guild_id = self.index_keys.pop(view_id)
+        self.__remove_from_index(self.member_index, member_id, view_id)
+        self.__remove_from_index(self.guild_index, guild_id, view_id)
+
+    def get(self, view_id: int) -> ViewMenu:
+        return self.views.get(view_id)
+
+    def get_by_member(self, member_id: int) -> list[ViewMenu]:
+        return [self.views[view_id] for view_id in self.member_index.get(member_id, [])]
+
+    def get_by_guild(self, guild_id: int) -> list[ViewMenu]:
+        return [self.views[view_id] for view_id in self.guild_index.get(guild_id, [])]
+
+    def is_expired(self, view: ViewMenu, now: float) -> bool:
+        if view.is_finished():
+            return True
+
+        if view.message is None or not view.message.flags.ephemeral:
+            return False
+
+        age = now - self.registered_at[view.id]
+        return age > self.INTERACTION_TOKEN_LIFETIME
+
+    def evict_expired(self) -> int:
+        now = time.monotonic()
+        expired = [view.id for view in self if self.is_expired(view, now)]
+        for view_id in expired:
+            self.remove_by_id(view_id)
+        return len(expired)
@@ -1,6 +1,15 @@
+import collections
 import datetime
+import functools
 
-import tiktoken
+
+@functools.cache
+def get_encoding():
+    # loading the encoding is expensive, share one instance across all chat logs
+    # and only import tiktoken once the first message is counted
+    import tiktoken
+
+    return tiktoken.encoding_for_model("gpt-4-turbo")
 
 
 class ChatMessage:
@@ -13,6 +22,7 @@ class ChatMessage:
         self.role = role
         self.message = message
         self.timestamp = timestamp
+        self.token_count = len(get_encoding().encode(message))
 
 
 class ChatLog:
@@ -21,22 +31,16 @@ class ChatLog:
     CONTENT_KEY = "content"
 
     def __init__(self, system_message: str):
-        self.chat_log: list[ChatMessage] = []
+        self.chat_log: collections.deque[ChatMessage] = collections.deque()
+        self.message_token_count = 0
         self.backstory = system_message
         self.system_message = ChatMessage(
             ChatMessage.SYSTEM_ROLE, system_message, datetime.datetime.now()
         )
-        self.encoding = tiktoken.encoding_for_model("gpt-4-turbo")
         self.summary = ""
 
     def get_token_count(self) -> int:
-
-        total_tokens = len(self.encoding.encode(self.system_message.message))
-
-        for message in self.chat_log:
-            total_tokens += len(self.encoding.encode(message.message))
-
-        return total_tokens
+        return self.system_message.token_count + self.message_token_count
 
     def add_summary(self, message: str):
         self.summary += " " + message
@@ -51,13 +55,17 @@ class ChatLog:
             ChatMessage.SYSTEM_ROLE, system_message, datetime.datetime.now()
         )
 
+    def __append(self, message: ChatMessage):
+        self.chat_log.append(message)
+        self.message_token_count += message.token_count
+
     def add_user_message(self, message: str):
-        self.chat_log.append(
+        self.__append(
             ChatMessage(ChatMessage.USER_ROLE, message, datetime.datetime.now())
         )
 
     def add_assistant_message(self, message: str):
-        self.chat_log.append(
+        self.__append(
             ChatMessage(ChatMessage.ASSISTANT_ROLE, message, datetime.datetime.now())
         )
 
@@ -72,27 +80,21 @@ class ChatLog:
         data[self.CONTENT_KEY] = system_message
         messages.append(data)
 
-        summary_messages = ""
-
-        total_tokens = len(self.encoding.encode(self.system_message.message))
+        summary_messages = []
 
-        remaining_messages = []
-
-        for message in self.chat_log:
-            if (
-                total_tokens >= token_threshold
-                and message.role == ChatMessage.USER_ROLE
-            ):
-                remaining_messages.append(message)
-                continue
-            total_tokens += len(self.encoding.encode(message.message))
-            summary_messages += "<message>" + message.message + "</message>"
+        total_tokens = self.system_message.token_count
 
-        self.chat_log = remaining_messages
+        # oldest messages are summarized until the threshold is reached,
+        # the rest of the conversation is kept as is
+        while len(self.chat_log) > 0 and total_tokens < token_threshold:
+            message = self.chat_log.popleft()
+            self.message_token_count -= message.token_count
+            total_tokens += message.token_count
+            summary_messages.append("<message>" + message.message + "</message>")
 
         data = {}
         data[self.ROLE_KEY] = ChatMessage.USER_ROLE
-        data[self.CONTENT_KEY] = summary_messages
+        data[self.CONTENT_KEY] = "".join(summary_messages)
         messages.append(data)
 
         return messages
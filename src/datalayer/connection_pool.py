@@ -0,0 +1,158 @@
+import asyncio
+import contextlib
+import random
+import sqlite3
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+import aiosqlite
+
+
+class BusyRetryPolicy:
+
+    BUSY_ERROR_CODES = [sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED]
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 0.05,
+        max_delay: float = 2.0,
+        on_retry: Callable[[int, float, Exception], None] = None,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.on_retry = on_retry
+
+        self.retry_count = 0
+        self.failure_count = 0
+
+    def is_busy_error(self, error: Exception) -> bool:
+        if not isinstance(error, sqlite3.OperationalError):
+            return False
+        error_code = getattr(error, "sqlite_errorcode", None)
+        if error_code is not None:
+            return (error_code & 0xFF) in self.BUSY_ERROR_CODES
+        message = str(error).lower()
+        return "locked" in message or "busy" in message
+
+    def get_delay(self, attempt: int) -> float:
+        # full jitter so competing tasks don't retry in lockstep
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    async def run(self, operation: Callable[..., Awaitable[Any]], *args) -> Any:
+        attempt = 1
+        while True:
+            try:
+                return await operation(*args)
+            except sqlite3.OperationalError as error:
+                if not self.is_busy_error(error):
+                    raise
+                if attempt >= self.max_attempts:
+                    self.failure_count += 1
+                    raise
+
+                delay = self.get_delay(attempt)
+                self.retry_count += 1
+                if self.on_retry is not None:
+                    self.on_retry(attempt, delay, error)
+
+                await asyncio.sleep(delay)
+                attempt += 1
+
+
+class ConnectionPool:
+
+    DEFAULT_READER_COUNT = 4
+    DEFAULT_TIMEOUT = 5
+
+    PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+    }
+
+    def __init__(
+        self,
+        db_file: str,
+        reader_count: int = DEFAULT_READER_COUNT,
+        timeout: int = DEFAULT_TIMEOUT,
+    ):
+        self.db_file = db_file
+        self.reader_count = max(1, reader_count)
+        self.timeout = timeout
+
+        self.writer_connection: aiosqlite.Connection = None
+        self.reader_connections: list[aiosqlite.Connection] = []
+        self.idle_readers: asyncio.Queue[aiosqlite.Connection] = None
+
+        self.writer_lock = asyncio.Lock()
+        self.open_lock = asyncio.Lock()
+        self.is_open = False
+
+    async def __connect(self) -> aiosqlite.Connection:
+        connection = await aiosqlite.connect(self.db_file, timeout=self.timeout)
+        for pragma, value in self.PRAGMAS.items():
+            await connection.execute(f"PRAGMA {pragma} = {value};")
+        return connection
+
+    async def open(self) -> None:
+        async with self.open_lock:
+            if self.is_open:
+                return
+
+            self.writer_connection = await self.__connect()
+            self.idle_readers = asyncio.Queue()
+            for _ in range(self.reader_count):
+                connection = await self.__connect()
+                self.reader_connections.append(connection)
+                self.idle_readers.put_nowait(connection)
+
+            self.is_open = True
+
+    async def close(self) -> None:
+        async with self.open_lock:
+            if not self.is_open:
+                return
+            self.is_open = False
+
+            async with self.writer_lock:
+                await self.writer_connection.close()
+                self.writer_connection = None
+
+            # wait for readers still in use to be handed back before closing them
+            for _ in range(len(self.reader_connections)):
+                connection = await self.idle_readers.get()
+                await connection.close()
+
+            self.reader_connections = []
+            self.idle_readers = None
+
+    @contextlib.asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        if not self.is_open:
+            await self.open()
+
+        idle_readers = self.idle_readers
+        connection = await idle_readers.get()
+        try:
+            yield connection
+        finally:
+            idle_readers.put_nowait(connection)
+
+    @contextlib.asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        if not self.is_open:
+            await self.open()
+
+        async with self.writer_lock:
+            connection = self.writer_connection
+            try:
+                yield connection
+            except BaseException:
+                await connection.rollback()
+                raise
+            await connection.commit()
@@ -61,9 +61,12 @@ from items import BaseSeed
 from items.types import ItemState, ItemType
 from view.types import EmojiType
 
+from datalayer.connection_pool import BusyRetryPolicy, ConnectionPool
+from datalayer.event_queue import EventQueue
 from datalayer.garden import Plot, PlotModifiers, UserGarden
 from datalayer.jail import UserJail
 from datalayer.lootbox import LootBox
+from datalayer.migrations import Migration, MigrationRunner
 from datalayer.prediction import Prediction
 from datalayer.prediction_stats import PredictionStats
 from datalayer.quote import Quote
@@ -651,6 +654,88 @@ class Database:
         PRIMARY KEY ({STATUS_EFFECT_EVENT_ID_COL})
     );"""
 
+    BEANS_BALANCE_TABLE = "beansbalances"
+    BEANS_BALANCE_GUILD_ID_COL = "bnbl_guild_id"
+    BEANS_BALANCE_MEMBER_COL = "bnbl_member"
+    BEANS_BALANCE_SEASON_COL = "bnbl_season"
+    BEANS_BALANCE_VALUE_COL = "bnbl_balance"
+    CREATE_BEANS_BALANCE_TABLE = f"""
+    CREATE TABLE if not exists {BEANS_BALANCE_TABLE} (
+        {BEANS_BALANCE_GUILD_ID_COL} INTEGER,
+        {BEANS_BALANCE_MEMBER_COL} INTEGER,
+        {BEANS_BALANCE_SEASON_COL} TEXT,
+        {BEANS_BALANCE_VALUE_COL} INTEGER,
+        PRIMARY KEY ({BEANS_BALANCE_GUILD_ID_COL}, {BEANS_BALANCE_MEMBER_COL}, {BEANS_BALANCE_SEASON_COL})
+    );"""
+
+    BEANS_HIGH_SCORE_TABLE = "beanshighscores"
+    BEANS_HIGH_SCORE_GUILD_ID_COL = "bnhs_guild_id"
+    BEANS_HIGH_SCORE_MEMBER_COL = "bnhs_member"
+    BEANS_HIGH_SCORE_SEASON_COL = "bnhs_season"
+    BEANS_HIGH_SCORE_TOTAL_COL = "bnhs_total"
+    BEANS_HIGH_SCORE_VALUE_COL = "bnhs_high_score"
+    CREATE_BEANS_HIGH_SCORE_TABLE = f"""
+    CREATE TABLE if not exists {BEANS_HIGH_SCORE_TABLE} (
+        {BEANS_HIGH_SCORE_GUILD_ID_COL} INTEGER,
+        {BEANS_HIGH_SCORE_MEMBER_COL} INTEGER,
+        {BEANS_HIGH_SCORE_SEASON_COL} TEXT,
+        {BEANS_HIGH_SCORE_TOTAL_COL} INTEGER,
+        {BEANS_HIGH_SCORE_VALUE_COL} INTEGER,
+        PRIMARY KEY ({BEANS_HIGH_SCORE_GUILD_ID_COL}, {BEANS_HIGH_SCORE_MEMBER_COL}, {BEANS_HIGH_SCORE_SEASON_COL})
+    );"""
+    CREATE_BEANS_HIGH_SCORE_INDEX = f"""
+    CREATE INDEX IF NOT EXISTS idx_{BEANS_HIGH_SCORE_TABLE}_ranking
+    ON {BEANS_HIGH_SCORE_TABLE} ({BEANS_HIGH_SCORE_GUILD_ID_COL}, {BEANS_HIGH_SCORE_SEASON_COL}, {BEANS_HIGH_SCORE_VALUE_COL} DESC);"""
+
+    INVENTORY_COUNT_TABLE = "inventorycounts"
+    INVENTORY_COUNT_GUILD_ID_COL = "ivct_guild_id"
+    INVENTORY_COUNT_MEMBER_COL = "ivct_member"
+    INVENTORY_COUNT_ITEM_TYPE_COL = "ivct_item_type"
+    INVENTORY_COUNT_SEASON_COL = "ivct_season"
+    INVENTORY_COUNT_AMOUNT_COL = "ivct_amount"
+    CREATE_INVENTORY_COUNT_TABLE = f"""
+    CREATE TABLE if not exists {INVENTORY_COUNT_TABLE} (
+        {INVENTORY_COUNT_GUILD_ID_COL} INTEGER,
+        {INVENTORY_COUNT_MEMBER_COL} INTEGER,
+        {INVENTORY_COUNT_ITEM_TYPE_COL} TEXT,
+        {INVENTORY_COUNT_SEASON_COL} TEXT,
+        {INVENTORY_COUNT_AMOUNT_COL} INTEGER,
+        PRIMARY KEY ({INVENTORY_COUNT_GUILD_ID_COL}, {INVENTORY_COUNT_SEASON_COL}, {INVENTORY_COUNT_MEMBER_COL}, {INVENTORY_COUNT_ITEM_TYPE_COL})
+    );"""
+
+    EVENT_LOG_INDEXES = [
+        f"""CREATE INDEX IF NOT EXISTS idx_{EVENT_TABLE}_guild_timestamp
+        ON {EVENT_TABLE} ({EVENT_GUILD_ID_COL}, {EVENT_TIMESTAMP_COL});""",
+        f"""CREATE INDEX IF NOT EXISTS idx_{BEANS_EVENT_TABLE}_member
+        ON {BEANS_EVENT_TABLE} ({BEANS_EVENT_MEMBER_COL}, {BEANS_EVENT_TYPE_COL}, {BEANS_EVENT_VALUE_COL});""",
+        f"""CREATE INDEX IF NOT EXISTS idx_{INVENTORY_EVENT_TABLE}_member
+        ON {INVENTORY_EVENT_TABLE} ({INVENTORY_EVENT_MEMBER_COL}, {INVENTORY_EVENT_ITEM_TYPE_COL}, {INVENTORY_EVENT_AMOUNT_COL});""",
+        f"""CREATE INDEX IF NOT EXISTS idx_{INVENTORY_EVENT_TABLE}_item_type
+        ON {INVENTORY_EVENT_TABLE} ({INVENTORY_EVENT_ITEM_TYPE_COL}, {INVENTORY_EVENT_MEMBER_COL}, {INVENTORY_EVENT_AMOUNT_COL});""",
+        f"""CREATE INDEX IF NOT EXISTS idx_{PLOT_TABLE}_garden
+        ON {PLOT_TABLE} ({PLOT_GARDEN_ID});""",
+        f"""CREATE INDEX IF NOT EXISTS idx_{GARDEN_EVENT_TABLE}_garden
+        ON {GARDEN_EVENT_TABLE} ({GARDEN_EVENT_GARDEN_ID_COL}, {GARDEN_EVENT_PLOT_ID_COL}, {GARDEN_EVENT_TYPE_COL});""",
+        f"""CREATE INDEX IF NOT EXISTS idx_{ENCOUNTER_EVENT_TABLE}_encounter
+        ON {ENCOUNTER_EVENT_TABLE} ({ENCOUNTER_EVENT_ENCOUNTER_ID_COL}, {ENCOUNTER_EVENT_TYPE_COL}, {ENCOUNTER_EVENT_MEMBER_ID});""",
+        f"""CREATE INDEX IF NOT EXISTS idx_{ENCOUNTER_EVENT_TABLE}_type
+        ON {ENCOUNTER_EVENT_TABLE} ({ENCOUNTER_EVENT_TYPE_COL});""",
+        f"""CREATE INDEX IF NOT EXISTS idx_{COMBAT_EVENT_TABLE}_encounter
+        ON {COMBAT_EVENT_TABLE} ({COMBAT_EVENT_ENCOUNTER_ID_COL});""",
+        f"""CREATE INDEX IF NOT EXISTS idx_{COMBAT_EVENT_TABLE}_member
+        ON {COMBAT_EVENT_TABLE} ({COMBAT_EVENT_MEMBER_ID});""",
+        f"""CREATE INDEX IF NOT EXISTS idx_{STATUS_EFFECT_EVENT_TABLE}_encounter
+        ON {STATUS_EFFECT_EVENT_TABLE} ({STATUS_EFFECT_EVENT_ENCOUNTER_ID_COL});""",
+        f"""CREATE INDEX IF NOT EXISTS idx_{JAIL_EVENT_TABLE}_jail
+        ON {JAIL_EVENT_TABLE} ({JAIL_EVENT_JAILREFERENCE_COL});""",
+        f"""CREATE INDEX IF NOT EXISTS idx_{JAIL_TABLE}_guild
+        ON {JAIL_TABLE} ({JAIL_GUILD_ID_COL}, {JAIL_RELEASED_ON_COL});""",
+        f"""CREATE INDEX IF NOT EXISTS idx_{LOOTBOX_ITEM_TABLE}_lootbox
+        ON {LOOTBOX_ITEM_TABLE} ({LOOTBOX_ITEM_LOOTBOX_ID_COL});""",
+        f"""CREATE INDEX IF NOT EXISTS idx_{USER_GEAR_TABLE}_member
+        ON {USER_GEAR_TABLE} ({USER_GEAR_GUILD_ID_COL}, {USER_GEAR_MEMBER_ID_COL}, {USER_GEAR_BASE_TYPE_COL});""",
+    ]
+
     PERMANENT_ITEMS = [
         ItemType.REACTION_SPAM,
         ItemType.LOTTERY_TICKET,
@@ -664,6 +749,13 @@ class Database:
         ItemType.PERM_PROTECTION,
     ]
 
+    HIGH_SCORE_EXCLUDED_BEANS_EVENTS = [
+        BeansEventType.SHOP_PURCHASE,
+        BeansEventType.USER_TRANSFER,
+        BeansEventType.BALANCE_CHANGE,
+        BeansEventType.SHOP_BUYBACK,
+    ]
+
     SEASONS = {
         Season.ALL_TIME: (SeasonDate.BEGINNING, None),
         Season.SEASON_1: (SeasonDate.BEGINNING, SeasonDate.SEASON_1),
@@ -675,13 +767,40 @@ class Database:
         bot: commands.Bot,
         logger: BotLogger,
         db_file: str,
+        reader_count: int = ConnectionPool.DEFAULT_READER_COUNT,
     ):
         self.bot = bot
         self.logger = logger
         self.db_file = db_file
+        self.pool = ConnectionPool(db_file, reader_count=reader_count)
+        self.retry_policy = BusyRetryPolicy(on_retry=self.__log_busy_retry)
+        self.event_queue = EventQueue(logger, self.__write_events)
+
+    async def connect(self):
+        await self.pool.open()
+        async with (
+            self.pool.reader() as db,
+            db.execute("PRAGMA journal_mode;") as cursor,
+        ):
+            journal_mode = (await cursor.fetchone())[0]
+        self.logger.log(
+            "DB",
+            f"Opened connection pool with {self.pool.reader_count} reader(s) and 1 writer on {self.db_file} (journal mode: {journal_mode}).",
+        )
+
+    def __log_busy_retry(self, attempt: int, delay: float, error: Exception):
+        self.logger.log(
+            "DB",
+            f"Database busy ({error}), retry {attempt}/{self.retry_policy.max_attempts - 1} in {delay:.3f}s. Total retries: {self.retry_policy.retry_count}.",
+        )
+
+    async def close(self):
+        await self.event_queue.close()
+        await self.pool.close()
+        self.logger.log("DB", f"Closed connection pool on {self.db_file}.")
 
     async def create_tables(self):
-        async with aiosqlite.connect(self.db_file) as db:
+        async with self.pool.writer() as db:
             await db.execute(self.CREATE_SETTINGS_TABLE)
             await db.execute(self.CREATE_JAIL_TABLE)
             await db.execute(self.CREATE_EVENT_TABLE)
@@ -720,10 +839,42 @@ class Database:
             await db.execute(self.CREATE_USER_EQUIPPED_SKILLS_TABLE)
             await db.execute(self.CREATE_KARMA_EVENT_TABLE)
             await db.execute(self.CREATE_STATUS_EFFECT_EVENT_TABLE)
-            await db.commit()
-            self.logger.log(
-                "DB", f"Loaded DB version {aiosqlite.__version__} from {self.db_file}."
-            )
+        self.logger.log(
+            "DB", f"Loaded DB version {aiosqlite.__version__} from {self.db_file}."
+        )
+
+    def __get_migrations(self) -> list[Migration]:
+        return [
+            Migration(1, "event log indexes", self.EVENT_LOG_INDEXES),
+            Migration(
+                2,
+                "beans balance ledger",
+                [self.CREATE_BEANS_BALANCE_TABLE],
+                self.__rebuild_beans_balances,
+            ),
+            Migration(
+                3,
+                "beans high scores",
+                [
+                    self.CREATE_BEANS_HIGH_SCORE_TABLE,
+                    self.CREATE_BEANS_HIGH_SCORE_INDEX,
+                ],
+                self.__rebuild_beans_high_scores,
+            ),
+            Migration(
+                4,
+                "inventory counts",
+                [self.CREATE_INVENTORY_COUNT_TABLE],
+                self.__rebuild_inventory_counts,
+            ),
+        ]
+
+    async def migrate(self) -> int:
+        runner = MigrationRunner(self.logger, self.__get_migrations())
+        async with self.pool.writer() as db:
+            version = await runner.run(db)
+        self.logger.log("DB", f"Schema is at version {version}.")
+        return version
 
     def __get_season_interval(self, season: Season):
         start_timestamp = self.SEASONS[season][0].value
@@ -735,19 +886,45 @@ class Database:
 
         return start_timestamp, end_timestamp
 
-    async def __query_select(self, query: str, task=None):
-        async with aiosqlite.connect(self.db_file, timeout=20) as db:  # noqa: SIM117
+    def __get_seasons_by_timestamp(self, timestamp: int) -> list[Season]:
+        seasons = []
+        for season, (start, end) in self.SEASONS.items():
+            if timestamp <= start.value:
+                continue
+            if end is not None and timestamp > end.value:
+                continue
+            seasons.append(season)
+        return seasons
+
+    async def __execute_select(self, query: str, task=None):
+        async with self.pool.reader() as db:  # noqa: SIM117
             async with db.execute(query, task) as cursor:
                 rows = await cursor.fetchall()
                 headings = [x[0] for x in cursor.description]
                 return self.__parse_rows(rows, headings)
 
+    async def __execute_insert(self, query: str, task=None) -> int:
+        async with self.pool.writer() as db, db.execute(query, task) as cursor:
+            return cursor.lastrowid
+
+    async def __execute_transaction(self, commands: list[tuple[str, Any]]) -> int:
+        insert_id = None
+        async with self.pool.writer() as db:
+            for command, task in commands:
+                async with db.execute(command, task) as cursor:
+                    if insert_id is None:
+                        insert_id = cursor.lastrowid
+        return insert_id
+
+    async def __query_select(self, query: str, task=None):
+        return await self.retry_policy.run(self.__execute_select, query, task)
+
     async def __query_insert(self, query: str, task=None) -> int:
-        async with aiosqlite.connect(self.db_file, timeout=20) as db:
-            cursor = await db.execute(query, task)
-            insert_id = cursor.lastrowid
-            await db.commit()
-            return insert_id
+        return await self.retry_policy.run(self.__execute_insert, query, task)
+
+    async def __query_transaction(self, commands: list[tuple[str, Any]]) -> int:
+        # returns the insert id of the first command
+        return await self.retry_policy.run(self.__execute_transaction, commands)
 
     def __parse_rows(self, rows, headings):
         if rows is None:
@@ -781,6 +958,21 @@ class Database:
 
         return json.loads(rows[0][self.SETTINGS_VALUE_COL])
 
+    async def get_settings(self) -> dict[tuple[int, str, str], Any]:
+        command = f"SELECT * FROM {self.SETTINGS_TABLE};"
+        rows = await self.__query_select(command)
+        if not rows:
+            return {}
+
+        return {
+            (
+                row[self.SETTINGS_GUILD_ID_COL],
+                row[self.SETTINGS_MODULE_COL],
+                row[self.SETTINGS_KEY_COL],
+            ): json.loads(row[self.SETTINGS_VALUE_COL])
+            for row in rows
+        }
+
     async def update_setting(self, guild_id: int, module: str, key: str, value):
         value = json.dumps(value)
 
@@ -794,7 +986,7 @@ class Database:
 
         return await self.__query_insert(command, task)
 
-    async def __create_base_event(self, event: BotEvent) -> int:
+    def __get_base_event_command(self, event: BotEvent) -> tuple[str, Any]:
         command = f"""
                 INSERT INTO {self.EVENT_TABLE} (
                 {self.EVENT_TIMESTAMP_COL}, 
@@ -804,30 +996,17 @@ class Database:
             """
         task = (event.get_timestamp(), event.guild_id, event.type)
 
-        return await self.__query_insert(command, task)
-
-    async def __create_batch_base_event(self, event: BotEvent) -> int:
-        command = f"""
-                INSERT INTO {self.EVENT_TABLE} (
-                {self.EVENT_TIMESTAMP_COL}, 
-                {self.EVENT_GUILD_ID_COL}, 
-                {self.EVENT_TYPE_COL}) 
-                VALUES 
-            """
-        timestamp = event.get_timestamp()
+        return command, task
 
-        for i in range(event.amount):
-            last = i + 1 == event.amount
-            end = "," if not last else ";"
-            command += (
-                f"({timestamp}, {event.guild_id}, '{event.base_type.value}'){end}"
-            )
+    def __get_batch_base_event_rows(self, event: BotEvent) -> tuple[str, list[Any]]:
+        command, _ = self.__get_base_event_command(event)
+        task = (event.get_timestamp(), event.guild_id, event.base_type)
 
-        return await self.__query_insert(command)
+        return command, [task] * event.amount
 
-    async def __create_interaction_event(
+    def __get_interaction_event_commands(
         self, event_id: int, event: InteractionEvent
-    ) -> int:
+    ) -> list[tuple[str, Any]]:
         command = f"""
             INSERT INTO {self.INTERACTION_EVENT_TABLE} (
             {self.INTERACTION_EVENT_ID_COL},
@@ -843,9 +1022,11 @@ class Database:
             event.to_user_id,
         )
 
-        return await self.__query_insert(command, task)
+        return [(command, task)]
 
-    async def __create_timeout_event(self, event_id: int, event: TimeoutEvent) -> int:
+    def __get_timeout_event_commands(
+        self, event_id: int, event: TimeoutEvent
+    ) -> list[tuple[str, Any]]:
         command = f"""
             INSERT INTO {self.TIMEOUT_EVENT_TABLE} (
             {self.TIMEOUT_EVENT_ID_COL},
@@ -855,9 +1036,11 @@ class Database:
         """
         task = (event_id, event.member_id, event.duration)
 
-        return await self.__query_insert(command, task)
+        return [(command, task)]
 
-    async def __create_spam_event(self, event_id: int, event: SpamEvent) -> int:
+    def __get_spam_event_commands(
+        self, event_id: int, event: SpamEvent
+    ) -> list[tuple[str, Any]]:
         command = f"""
             INSERT INTO {self.SPAM_EVENT_TABLE} (
             {self.SPAM_EVENT_ID_COL},
@@ -866,9 +1049,11 @@ class Database:
         """
         task = (event_id, event.member_id)
 
-        return await self.__query_insert(command, task)
+        return [(command, task)]
 
-    async def __create_jail_event(self, event_id: int, event: JailEvent) -> int:
+    def __get_jail_event_commands(
+        self, event_id: int, event: JailEvent
+    ) -> list[tuple[str, Any]]:
         command = f"""
             INSERT INTO {self.JAIL_EVENT_TABLE} (
             {self.JAIL_EVENT_ID_COL},
@@ -886,9 +1071,11 @@ class Database:
             event.jail_id,
         )
 
-        return await self.__query_insert(command, task)
+        return [(command, task)]
 
-    async def __create_quote_event(self, event_id: int, event: QuoteEvent) -> int:
+    def __get_quote_event_commands(
+        self, event_id: int, event: QuoteEvent
+    ) -> list[tuple[str, Any]]:
         command = f"""
             INSERT INTO {self.QUOTE_EVENT_TABLE} (
             {self.QUOTE_EVENT_ID_COL},
@@ -897,9 +1084,11 @@ class Database:
         """
         task = (event_id, event.quote_id)
 
-        return await self.__query_insert(command, task)
+        return [(command, task)]
 
-    async def __create_beans_event(self, event_id: int, event: BeansEvent) -> int:
+    def __get_beans_event_commands(
+        self, event_id: int, event: BeansEvent
+    ) -> list[tuple[str, Any]]:
         command = f"""
             INSERT INTO {self.BEANS_EVENT_TABLE} (
             {self.BEANS_EVENT_ID_COL},
@@ -914,12 +1103,80 @@ class Database:
             event.beans_event_type,
             event.value,
         )
+        commands = [(command, task)]
+
+        balance_command = f"""
+            INSERT INTO {self.BEANS_BALANCE_TABLE} (
+            {self.BEANS_BALANCE_GUILD_ID_COL},
+            {self.BEANS_BALANCE_MEMBER_COL},
+            {self.BEANS_BALANCE_SEASON_COL},
+            {self.BEANS_BALANCE_VALUE_COL})
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT({self.BEANS_BALANCE_GUILD_ID_COL}, {self.BEANS_BALANCE_MEMBER_COL}, {self.BEANS_BALANCE_SEASON_COL})
+            DO UPDATE SET {self.BEANS_BALANCE_VALUE_COL}={self.BEANS_BALANCE_VALUE_COL} + excluded.{self.BEANS_BALANCE_VALUE_COL};
+        """
+        high_score_command = f"""
+            INSERT INTO {self.BEANS_HIGH_SCORE_TABLE} (
+            {self.BEANS_HIGH_SCORE_GUILD_ID_COL},
+            {self.BEANS_HIGH_SCORE_MEMBER_COL},
+            {self.BEANS_HIGH_SCORE_SEASON_COL},
+            {self.BEANS_HIGH_SCORE_TOTAL_COL},
+            {self.BEANS_HIGH_SCORE_VALUE_COL})
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT({self.BEANS_HIGH_SCORE_GUILD_ID_COL}, {self.BEANS_HIGH_SCORE_MEMBER_COL}, {self.BEANS_HIGH_SCORE_SEASON_COL})
+            DO UPDATE SET
+            {self.BEANS_HIGH_SCORE_TOTAL_COL}={self.BEANS_HIGH_SCORE_TOTAL_COL} + excluded.{self.BEANS_HIGH_SCORE_TOTAL_COL},
+            {self.BEANS_HIGH_SCORE_VALUE_COL}=MAX({self.BEANS_HIGH_SCORE_VALUE_COL}, {self.BEANS_HIGH_SCORE_TOTAL_COL} + excluded.{self.BEANS_HIGH_SCORE_TOTAL_COL});
+        """
+        counts_for_high_score = (
+            event.beans_event_type not in self.HIGH_SCORE_EXCLUDED_BEANS_EVENTS
+        )
 
-        return await self.__query_insert(command, task)
+        for season in self.__get_seasons_by_timestamp(event.get_timestamp()):
+            balance_task = (event.guild_id, event.member_id, season.value, event.value)
+            commands.append((balance_command, balance_task))
+            if counts_for_high_score:
+                high_score_task = (
+                    event.guild_id,
+                    event.member_id,
+                    season.value,
+                    event.value,
+                    event.value,
+                )
+                commands.append((high_score_command, high_score_task))
+
+        return commands
+
+    def __get_inventory_count_commands(
+        self, event: BotEvent, items: list[tuple[int, ItemType]]
+    ) -> list[tuple[str, Any]]:
+        command = f"""
+            INSERT INTO {self.INVENTORY_COUNT_TABLE} (
+            {self.INVENTORY_COUNT_GUILD_ID_COL},
+            {self.INVENTORY_COUNT_MEMBER_COL},
+            {self.INVENTORY_COUNT_ITEM_TYPE_COL},
+            {self.INVENTORY_COUNT_SEASON_COL},
+            {self.INVENTORY_COUNT_AMOUNT_COL})
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT({self.INVENTORY_COUNT_GUILD_ID_COL}, {self.INVENTORY_COUNT_SEASON_COL}, {self.INVENTORY_COUNT_MEMBER_COL}, {self.INVENTORY_COUNT_ITEM_TYPE_COL})
+            DO UPDATE SET {self.INVENTORY_COUNT_AMOUNT_COL}={self.INVENTORY_COUNT_AMOUNT_COL} + excluded.{self.INVENTORY_COUNT_AMOUNT_COL};
+        """
+        commands = []
+        for season in self.__get_seasons_by_timestamp(event.get_timestamp()):
+            for amount, item_type in items:
+                task = (
+                    event.guild_id,
+                    event.member_id,
+                    item_type,
+                    season.value,
+                    amount,
+                )
+                commands.append((command, task))
+        return commands
 
-    async def __create_inventory_event(
+    def __get_inventory_event_commands(
         self, event_id: int, event: InventoryEvent
-    ) -> int:
+    ) -> list[tuple[str, Any]]:
         command = f"""
             INSERT INTO {self.INVENTORY_EVENT_TABLE} (
             {self.INVENTORY_EVENT_ID_COL},
@@ -935,31 +1192,36 @@ class Database:
             event.amount,
         )
 
-        return await self.__query_insert(command, task)
+        commands = [(command, task)]
+        commands.extend(
+            self.__get_inventory_count_commands(
+                event, [(event.amount, event.item_type)]
+            )
+        )
 
-    async def __create_batch_inventory_event(
-        self, event_id: int, event: InventoryBatchEvent
-    ) -> int:
+        return commands
+
+    def __get_batch_inventory_event_rows(
+        self, event_ids: range, event: InventoryBatchEvent
+    ) -> tuple[str, list[Any]]:
         command = f"""
             INSERT INTO {self.INVENTORY_EVENT_TABLE} (
             {self.INVENTORY_EVENT_ID_COL},
             {self.INVENTORY_EVENT_MEMBER_COL},
             {self.INVENTORY_EVENT_ITEM_TYPE_COL},
             {self.INVENTORY_EVENT_AMOUNT_COL})
-            VALUES 
-            """
-
-        event_id = event_id - event.amount + 1
-        for index, (amount, item) in enumerate(event.items):
-            last = index + 1 == len(event.items)
-            end = "," if not last else ";"
-            command += f"({event_id}, {event.member_id}, '{item.value}', {amount}){end}"
-
-            event_id += 1
+            VALUES (?, ?, ?, ?);
+        """
+        tasks = [
+            (event_id, event.member_id, item.value, amount)
+            for event_id, (amount, item) in zip(event_ids, event.items, strict=True)
+        ]
 
-        return await self.__query_insert(command)
+        return command, tasks
 
-    async def __create_loot_box_event(self, event_id: int, event: LootBoxEvent) -> int:
+    def __get_loot_box_event_commands(
+        self, event_id: int, event: LootBoxEvent
+    ) -> list[tuple[str, Any]]:
         command = f"""
             INSERT INTO {self.LOOTBOX_EVENT_TABLE} (
             {self.LOOTBOX_EVENT_ID_COL},
@@ -975,9 +1237,11 @@ class Database:
             event.loot_box_event_type,
         )
 
-        return await self.__query_insert(command, task)
+        return [(command, task)]
 
-    async def __create_bat_event(self, event_id: int, event: BatEvent) -> int:
+    def __get_bat_event_commands(
+        self, event_id: int, event: BatEvent
+    ) -> list[tuple[str, Any]]:
         command = f"""
             INSERT INTO {self.BAT_EVENT_TABLE} (
             {self.BAT_EVENT_ID_COL},
@@ -988,11 +1252,11 @@ class Database:
         """
         task = (event_id, event.used_by_id, event.target_id, event.duration)
 
-        return await self.__query_insert(command, task)
+        return [(command, task)]
 
-    async def __create_prediction_event(
+    def __get_prediction_event_commands(
         self, event_id: int, event: PredictionEvent
-    ) -> int:
+    ) -> list[tuple[str, Any]]:
         command = f"""
             INSERT INTO {self.PREDICTION_EVENT_TABLE} (
             {self.PREDICTION_EVENT_ID_COL},
@@ -1012,9 +1276,11 @@ class Database:
             event.amount,
         )
 
-        return await self.__query_insert(command, task)
+        return [(command, task)]
 
-    async def __create_garden_event(self, event_id: int, event: GardenEvent) -> int:
+    def __get_garden_event_commands(
+        self, event_id: int, event: GardenEvent
+    ) -> list[tuple[str, Any]]:
         command = f"""
             INSERT INTO {self.GARDEN_EVENT_TABLE} (
             {self.GARDEN_EVENT_ID_COL},
@@ -1034,11 +1300,11 @@ class Database:
             event.payload,
         )
 
-        return await self.__query_insert(command, task)
+        return [(command, task)]
 
-    async def __create_encounter_event(
+    def __get_encounter_event_commands(
         self, event_id: int, event: EncounterEvent
-    ) -> int:
+    ) -> list[tuple[str, Any]]:
         command = f"""
             INSERT INTO {self.ENCOUNTER_EVENT_TABLE} (
             {self.ENCOUNTER_EVENT_ID_COL},
@@ -1054,9 +1320,11 @@ class Database:
             event.encounter_event_type,
         )
 
-        return await self.__query_insert(command, task)
+        return [(command, task)]
 
-    async def __create_combat_event(self, event_id: int, event: CombatEvent) -> int:
+    def __get_combat_event_commands(
+        self, event_id: int, event: CombatEvent
+    ) -> list[tuple[str, Any]]:
         command = f"""
             INSERT INTO {self.COMBAT_EVENT_TABLE} (
             {self.COMBAT_EVENT_ID_COL},
@@ -1080,9 +1348,11 @@ class Database:
             event.combat_event_type,
         )
 
-        return await self.__query_insert(command, task)
+        return [(command, task)]
 
-    async def __create_karma_event(self, event_id: int, event: KarmaEvent) -> int:
+    def __get_karma_event_commands(
+        self, event_id: int, event: KarmaEvent
+    ) -> list[tuple[str, Any]]:
         command = f"""
             INSERT INTO {self.KARMA_EVENT_TABLE} (
             {self.KARMA_EVENT_ID_COL},
@@ -1098,11 +1368,11 @@ class Database:
             event.amount,
         )
 
-        return await self.__query_insert(command, task)
+        return [(command, task)]
 
-    async def __create_status_effect_event(
+    def __get_status_effect_event_commands(
         self, event_id: int, event: StatusEffectEvent
-    ) -> int:
+    ) -> list[tuple[str, Any]]:
         command = f"""
             INSERT INTO {self.STATUS_EFFECT_EVENT_TABLE} (
             {self.STATUS_EFFECT_EVENT_ID_COL},
@@ -1124,51 +1394,103 @@ class Database:
             event.value,
         )
 
-        return await self.__query_insert(command, task)
-
-    async def log_event(self, event: BotEvent) -> int:
-        if event.type == EventType.INVENTORYBATCH:
-            event_id = await self.__create_batch_base_event(event)
-        else:
-            event_id = await self.__create_base_event(event)
-
-        if event_id is None:
-            self.logger.error("DB", "Event creation error, id was NoneType")
-            return None
+        return [(command, task)]
 
+    def __get_event_commands(
+        self, event_id: int, event: BotEvent
+    ) -> list[tuple[str, Any]]:
         match event.type:
             case EventType.INTERACTION:
-                return await self.__create_interaction_event(event_id, event)
+                return self.__get_interaction_event_commands(event_id, event)
             case EventType.JAIL:
-                return await self.__create_jail_event(event_id, event)
+                return self.__get_jail_event_commands(event_id, event)
             case EventType.TIMEOUT:
-                return await self.__create_timeout_event(event_id, event)
+                return self.__get_timeout_event_commands(event_id, event)
             case EventType.QUOTE:
-                return await self.__create_quote_event(event_id, event)
+                return self.__get_quote_event_commands(event_id, event)
             case EventType.SPAM:
-                return await self.__create_spam_event(event_id, event)
+                return self.__get_spam_event_commands(event_id, event)
             case EventType.BEANS:
-                return await self.__create_beans_event(event_id, event)
+                return self.__get_beans_event_commands(event_id, event)
             case EventType.INVENTORY:
-                return await self.__create_inventory_event(event_id, event)
-            case EventType.INVENTORYBATCH:
-                return await self.__create_batch_inventory_event(event_id, event)
+                return self.__get_inventory_event_commands(event_id, event)
             case EventType.LOOTBOX:
-                return await self.__create_loot_box_event(event_id, event)
+                return self.__get_loot_box_event_commands(event_id, event)
             case EventType.BAT:
-                return await self.__create_bat_event(event_id, event)
+                return self.__get_bat_event_commands(event_id, event)
             case EventType.PREDICTION:
-                return await self.__create_prediction_event(event_id, event)
+                return self.__get_prediction_event_commands(event_id, event)
             case EventType.GARDEN:
-                return await self.__create_garden_event(event_id, event)
+                return self.__get_garden_event_commands(event_id, event)
             case EventType.ENCOUNTER:
-                return await self.__create_encounter_event(event_id, event)
+                return self.__get_encounter_event_commands(event_id, event)
             case EventType.COMBAT:
-                return await self.__create_combat_event(event_id, event)
+                return self.__get_combat_event_commands(event_id, event)
             case EventType.STATUS_EFFECT:
-                return await self.__create_status_effect_event(event_id, event)
+                return self.__get_status_effect_event_commands(event_id, event)
             case EventType.KARMA:
-                return await self.__create_karma_event(event_id, event)
+                return self.__get_karma_event_commands(event_id, event)
+        return []
+
+    async def __insert_many(
+        self, db: aiosqlite.Connection, command: str, tasks: list[Any]
+    ) -> range:
+        if len(tasks) == 0:
+            return range(0)
+
+        async with db.executemany(command, tasks):
+            pass
+        async with db.execute("SELECT last_insert_rowid();") as cursor:
+            (last_id,) = await cursor.fetchone()
+
+        # rowids of a multi row insert are consecutive while we hold the writer
+        return range(last_id - len(tasks) + 1, last_id + 1)
+
+    async def __execute_batch_event(
+        self, db: aiosqlite.Connection, event: InventoryBatchEvent
+    ) -> int:
+        command, tasks = self.__get_batch_base_event_rows(event)
+        event_ids = await self.__insert_many(db, command, tasks)
+        if len(event_ids) == 0:
+            return None
+
+        command, tasks = self.__get_batch_inventory_event_rows(event_ids, event)
+        await self.__insert_many(db, command, tasks)
+
+        count_commands = self.__get_inventory_count_commands(
+            event, [(amount, item.value) for amount, item in event.items]
+        )
+        for command, task in count_commands:
+            await db.execute_insert(command, task)
+
+        return event_ids[-1]
+
+    async def __execute_events(self, events: list[BotEvent]) -> list[int]:
+        # base and type specific rows of every queued event share one transaction
+        event_ids = []
+        async with self.pool.writer() as db:
+            for event in events:
+                if event.type == EventType.INVENTORYBATCH:
+                    event_ids.append(await self.__execute_batch_event(db, event))
+                    continue
+
+                command, task = self.__get_base_event_command(event)
+                (event_id,) = await db.execute_insert(command, task)
+
+                insert_id = None
+                for command, task in self.__get_event_commands(event_id, event):
+                    (row_id,) = await db.execute_insert(command, task)
+                    if insert_id is None:
+                        insert_id = row_id
+
+                event_ids.append(insert_id if insert_id is not None else event_id)
+        return event_ids
+
+    async def __write_events(self, events: list[BotEvent]) -> list[int]:
+        return await self.retry_policy.run(self.__execute_events, events)
+
+    async def log_event(self, event: BotEvent) -> int:
+        return await self.event_queue.log(event)
 
     async def log_quote(self, quote: Quote) -> int:
         command = f"""
@@ -1238,7 +1560,7 @@ class Database:
 
         return await self.__query_insert(command, task)
 
-    async def log_lootbox(self, loot_box: LootBox) -> int:
+    async def __execute_lootbox(self, loot_box: LootBox) -> int:
         command = f"""
             INSERT INTO {self.LOOTBOX_TABLE} (
             {self.LOOTBOX_GUILD_COL},
@@ -1252,23 +1574,27 @@ class Database:
             loot_box.beans,
         )
 
-        lootbox_id = await self.__query_insert(command, task)
-
-        for item_type, amount in loot_box.items.items():
-
-            command = f"""
-                INSERT INTO {self.LOOTBOX_ITEM_TABLE} (
-                {self.LOOTBOX_ITEM_LOOTBOX_ID_COL},
-                {self.LOOTBOX_ITEM_TYPE_COL}, 
-                {self.LOOTBOX_ITEM_AMOUNT_COL})
-                VALUES (?, ?, ?);
-            """
+        item_command = f"""
+            INSERT INTO {self.LOOTBOX_ITEM_TABLE} (
+            {self.LOOTBOX_ITEM_LOOTBOX_ID_COL},
+            {self.LOOTBOX_ITEM_TYPE_COL}, 
+            {self.LOOTBOX_ITEM_AMOUNT_COL})
+            VALUES (?, ?, ?);
+        """
 
-            task = (lootbox_id, item_type.value, amount)
-            await self.__query_insert(command, task)
+        async with self.pool.writer() as db:
+            (lootbox_id,) = await db.execute_insert(command, task)
+            item_tasks = [
+                (lootbox_id, item_type.value, amount)
+                for item_type, amount in loot_box.items.items()
+            ]
+            await self.__insert_many(db, item_command, item_tasks)
 
         return lootbox_id
 
+    async def log_lootbox(self, loot_box: LootBox) -> int:
+        return await self.retry_policy.run(self.__execute_lootbox, loot_box)
+
     async def log_item_state(
         self,
         guild_id: int,
@@ -1622,10 +1948,10 @@ class Database:
         """
         rows = await self.__query_select(command)
 
-        if rows and len(rows) < 1:
+        if not rows or len(rows) < 1:
             return None
 
-        return UserJail.from_db_row(rows)
+        return UserJail.from_db_row(rows[0])
 
     async def get_jails_by_guild(self, guild_id: int) -> list[UserJail]:
         command = f"""
@@ -1930,47 +2256,124 @@ class Database:
     async def get_member_beans(
         self, guild_id: int, user_id: int, season: Season = Season.CURRENT
     ) -> int:
-        start_timestamp, end_timestamp = self.__get_season_interval(season)
         command = f"""
-            SELECT SUM({self.BEANS_EVENT_VALUE_COL}) FROM {self.BEANS_EVENT_TABLE} 
-            INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.BEANS_EVENT_TABLE}.{self.BEANS_EVENT_ID_COL}
-            WHERE {self.BEANS_EVENT_MEMBER_COL} = ?
-            AND {self.EVENT_GUILD_ID_COL} = ?
-            AND {self.EVENT_TIMESTAMP_COL} > ?
-            AND {self.EVENT_TIMESTAMP_COL} <= ?;
+            SELECT {self.BEANS_BALANCE_VALUE_COL} FROM {self.BEANS_BALANCE_TABLE}
+            WHERE {self.BEANS_BALANCE_GUILD_ID_COL} = ?
+            AND {self.BEANS_BALANCE_MEMBER_COL} = ?
+            AND {self.BEANS_BALANCE_SEASON_COL} = ?
+            LIMIT 1;
         """
-        task = (user_id, guild_id, start_timestamp, end_timestamp)
+        task = (guild_id, user_id, season.value)
 
         rows = await self.__query_select(command, task)
         if not rows or len(rows) < 1:
             return 0
-        output = rows[0][f"SUM({self.BEANS_EVENT_VALUE_COL})"]
+        output = rows[0][self.BEANS_BALANCE_VALUE_COL]
         return output if output is not None else 0
 
     async def get_guild_beans(
         self, guild_id: int, season: Season = Season.CURRENT
     ) -> dict[int, int]:
-        start_timestamp, end_timestamp = self.__get_season_interval(season)
         command = f"""
-            SELECT {self.BEANS_EVENT_MEMBER_COL}, SUM({self.BEANS_EVENT_VALUE_COL}) FROM {self.BEANS_EVENT_TABLE} 
-            INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.BEANS_EVENT_TABLE}.{self.BEANS_EVENT_ID_COL}
-            AND {self.EVENT_GUILD_ID_COL} = ?
-            AND {self.EVENT_TIMESTAMP_COL} > ?
-            AND {self.EVENT_TIMESTAMP_COL} <= ?
-            GROUP BY {self.BEANS_EVENT_MEMBER_COL};
+            SELECT {self.BEANS_BALANCE_MEMBER_COL}, {self.BEANS_BALANCE_VALUE_COL} FROM {self.BEANS_BALANCE_TABLE}
+            WHERE {self.BEANS_BALANCE_GUILD_ID_COL} = ?
+            AND {self.BEANS_BALANCE_SEASON_COL} = ?;
         """
-        task = (guild_id, start_timestamp, end_timestamp)
+        task = (guild_id, season.value)
         rows = await self.__query_select(command, task)
         if not rows or len(rows) < 1:
             return {}
 
         output = {
-            row[self.BEANS_EVENT_MEMBER_COL]: row[f"SUM({self.BEANS_EVENT_VALUE_COL})"]
+            row[self.BEANS_BALANCE_MEMBER_COL]: row[self.BEANS_BALANCE_VALUE_COL]
             for row in rows
         }
 
         return output
 
+    async def __rebuild_beans_balances(
+        self, db: aiosqlite.Connection, guild_id: int = None
+    ):
+        # without a guild id the ledger of every guild is rebuilt
+        guild_filter = ""
+        guild_task = ()
+        if guild_id is None:
+            await db.execute(f"DELETE FROM {self.BEANS_BALANCE_TABLE};")
+        else:
+            await db.execute(
+                f"DELETE FROM {self.BEANS_BALANCE_TABLE} WHERE {self.BEANS_BALANCE_GUILD_ID_COL} = ?;",
+                (guild_id,),
+            )
+            guild_filter = f"AND {self.EVENT_GUILD_ID_COL} = ?"
+            guild_task = (guild_id,)
+
+        for season in self.SEASONS:
+            start_timestamp, end_timestamp = self.__get_season_interval(season)
+            command = f"""
+                INSERT INTO {self.BEANS_BALANCE_TABLE} (
+                {self.BEANS_BALANCE_GUILD_ID_COL},
+                {self.BEANS_BALANCE_MEMBER_COL},
+                {self.BEANS_BALANCE_SEASON_COL},
+                {self.BEANS_BALANCE_VALUE_COL})
+                SELECT {self.EVENT_GUILD_ID_COL}, {self.BEANS_EVENT_MEMBER_COL}, ?, SUM({self.BEANS_EVENT_VALUE_COL})
+                FROM {self.BEANS_EVENT_TABLE}
+                INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.BEANS_EVENT_TABLE}.{self.BEANS_EVENT_ID_COL}
+                WHERE {self.EVENT_TIMESTAMP_COL} > ?
+                AND {self.EVENT_TIMESTAMP_COL} <= ?
+                {guild_filter}
+                GROUP BY {self.EVENT_GUILD_ID_COL}, {self.BEANS_EVENT_MEMBER_COL};
+            """
+            task = (season.value, start_timestamp, end_timestamp, *guild_task)
+            await db.execute(command, task)
+
+    async def rebuild_beans_balances(self, guild_id: int):
+        async def rebuild():
+            async with self.pool.writer() as db:
+                await self.__rebuild_beans_balances(db, guild_id)
+                await self.__rebuild_beans_high_scores(db, guild_id)
+
+        await self.retry_policy.run(rebuild)
+        self.logger.log(
+            "DB",
+            f"Rebuilt beans balance ledger and high scores of guild {guild_id} from the event log.",
+        )
+
+    async def verify_beans_balances(
+        self, guild_id: int
+    ) -> dict[Season, dict[int, tuple[int, int]]]:
+        mismatches = {}
+        for season in self.SEASONS:
+            start_timestamp, end_timestamp = self.__get_season_interval(season)
+            command = f"""
+                SELECT {self.BEANS_EVENT_MEMBER_COL}, SUM({self.BEANS_EVENT_VALUE_COL}) FROM {self.BEANS_EVENT_TABLE}
+                INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.BEANS_EVENT_TABLE}.{self.BEANS_EVENT_ID_COL}
+                WHERE {self.EVENT_GUILD_ID_COL} = ?
+                AND {self.EVENT_TIMESTAMP_COL} > ?
+                AND {self.EVENT_TIMESTAMP_COL} <= ?
+                GROUP BY {self.BEANS_EVENT_MEMBER_COL};
+            """
+            task = (guild_id, start_timestamp, end_timestamp)
+            rows = await self.__query_select(command, task)
+            expected = {
+                row[self.BEANS_EVENT_MEMBER_COL]: row[
+                    f"SUM({self.BEANS_EVENT_VALUE_COL})"
+                ]
+                for row in rows
+            }
+            actual = await self.get_guild_beans(guild_id, season)
+
+            season_mismatches = {}
+            for member_id in expected.keys() | actual.keys():
+                expected_balance = expected.get(member_id, 0)
+                actual_balance = actual.get(member_id, 0)
+                if expected_balance != actual_balance:
+                    season_mismatches[member_id] = (expected_balance, actual_balance)
+
+            if len(season_mismatches) > 0:
+                mismatches[season] = season_mismatches
+
+        return mismatches
+
     async def get_guild_beans_rankings_current(
         self, guild_id: int, season: Season = Season.CURRENT
     ) -> dict[int, int]:
@@ -1986,10 +2389,7 @@ class Database:
         """
         task = (
             guild_id,
-            BeansEventType.SHOP_PURCHASE.value,
-            BeansEventType.USER_TRANSFER.value,
-            BeansEventType.BALANCE_CHANGE.value,
-            BeansEventType.SHOP_BUYBACK.value,
+            *[event_type.value for event_type in self.HIGH_SCORE_EXCLUDED_BEANS_EVENTS],
             start_timestamp,
             end_timestamp,
         )
@@ -2004,80 +2404,99 @@ class Database:
         }
 
     async def get_guild_beans_rankings(
-        self, guild_id: int, season: Season = Season.CURRENT
+        self, guild_id: int, season: Season = Season.CURRENT, limit: int = None
     ) -> dict[int, int]:
-        start_timestamp, end_timestamp = self.__get_season_interval(season)
         command = f"""
-            SELECT {self.BEANS_EVENT_MEMBER_COL}, MAX(rollingSum) as high_score 
-            FROM (
-                SELECT *, SUM({self.BEANS_EVENT_VALUE_COL}) 
-                OVER ( 
-                    PARTITION BY {self.BEANS_EVENT_MEMBER_COL} 
-                    ORDER BY {self.BEANS_EVENT_ID_COL}
-                ) as rollingSum 
-                FROM {self.BEANS_EVENT_TABLE}
-                INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.BEANS_EVENT_TABLE}.{self.BEANS_EVENT_ID_COL}
-                AND {self.EVENT_GUILD_ID_COL} = ?
-                WHERE {self.BEANS_EVENT_TYPE_COL} NOT IN (?, ?, ?, ?)
-                AND {self.EVENT_TIMESTAMP_COL} > ?
-                AND {self.EVENT_TIMESTAMP_COL} <= ?
-            )
-            GROUP BY {self.BEANS_EVENT_MEMBER_COL};
+            SELECT {self.BEANS_HIGH_SCORE_MEMBER_COL}, {self.BEANS_HIGH_SCORE_VALUE_COL} FROM {self.BEANS_HIGH_SCORE_TABLE}
+            WHERE {self.BEANS_HIGH_SCORE_GUILD_ID_COL} = ?
+            AND {self.BEANS_HIGH_SCORE_SEASON_COL} = ?
+            ORDER BY {self.BEANS_HIGH_SCORE_VALUE_COL} DESC
         """
-        task = (
-            guild_id,
-            BeansEventType.SHOP_PURCHASE.value,
-            BeansEventType.USER_TRANSFER.value,
-            BeansEventType.BALANCE_CHANGE.value,
-            BeansEventType.SHOP_BUYBACK.value,
-            start_timestamp,
-            end_timestamp,
-        )
+        task = (guild_id, season.value)
 
-        rows = await self.__query_select(command, task)
+        if limit is not None:
+            command += "LIMIT ?"
+            task = (guild_id, season.value, int(limit))
+
+        rows = await self.__query_select(command + ";", task)
         if not rows or len(rows) < 1:
             return {}
 
-        return {row[self.BEANS_EVENT_MEMBER_COL]: row["high_score"] for row in rows}
+        return {
+            row[self.BEANS_HIGH_SCORE_MEMBER_COL]: row[self.BEANS_HIGH_SCORE_VALUE_COL]
+            for row in rows
+        }
 
     async def get_member_beans_rankings(
         self, guild_id: int, member_id: int, season: Season = Season.CURRENT
     ) -> int:
-        start_timestamp, end_timestamp = self.__get_season_interval(season)
         command = f"""
-            SELECT {self.BEANS_EVENT_MEMBER_COL}, MAX(rollingSum) as high_score 
-            FROM (
-                SELECT *, SUM({self.BEANS_EVENT_VALUE_COL}) 
-                OVER ( 
-                    PARTITION BY {self.BEANS_EVENT_MEMBER_COL} 
-                    ORDER BY {self.BEANS_EVENT_ID_COL}
-                ) as rollingSum 
-                FROM {self.BEANS_EVENT_TABLE}
-                INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.BEANS_EVENT_TABLE}.{self.BEANS_EVENT_ID_COL}
-                AND {self.EVENT_GUILD_ID_COL} = ?
-                WHERE {self.BEANS_EVENT_TYPE_COL} NOT IN (?, ?, ?, ?)
-                AND {self.EVENT_TIMESTAMP_COL} > ?
-                AND {self.EVENT_TIMESTAMP_COL} <= ?
-                AND {self.BEANS_EVENT_MEMBER_COL} = ?
-            )
-            GROUP BY {self.BEANS_EVENT_MEMBER_COL};
+            SELECT {self.BEANS_HIGH_SCORE_VALUE_COL} FROM {self.BEANS_HIGH_SCORE_TABLE}
+            WHERE {self.BEANS_HIGH_SCORE_GUILD_ID_COL} = ?
+            AND {self.BEANS_HIGH_SCORE_MEMBER_COL} = ?
+            AND {self.BEANS_HIGH_SCORE_SEASON_COL} = ?
+            LIMIT 1;
         """
-        task = (
-            guild_id,
-            BeansEventType.SHOP_PURCHASE.value,
-            BeansEventType.USER_TRANSFER.value,
-            BeansEventType.BALANCE_CHANGE.value,
-            BeansEventType.SHOP_BUYBACK.value,
-            start_timestamp,
-            end_timestamp,
-            member_id,
-        )
+        task = (guild_id, member_id, season.value)
 
         rows = await self.__query_select(command, task)
         if not rows or len(rows) < 1:
             return 0
 
-        return rows[0]["high_score"]
+        return rows[0][self.BEANS_HIGH_SCORE_VALUE_COL]
+
+    async def __rebuild_beans_high_scores(
+        self, db: aiosqlite.Connection, guild_id: int = None
+    ):
+        guild_filter = ""
+        guild_task = ()
+        if guild_id is None:
+            await db.execute(f"DELETE FROM {self.BEANS_HIGH_SCORE_TABLE};")
+        else:
+            await db.execute(
+                f"DELETE FROM {self.BEANS_HIGH_SCORE_TABLE} WHERE {self.BEANS_HIGH_SCORE_GUILD_ID_COL} = ?;",
+                (guild_id,),
+            )
+            guild_filter = f"AND {self.EVENT_GUILD_ID_COL} = ?"
+            guild_task = (guild_id,)
+        excluded_types = [
+            event_type.value for event_type in self.HIGH_SCORE_EXCLUDED_BEANS_EVENTS
+        ]
+        list_sanitized = self.__list_sanitizer(excluded_types)
+
+        for season in self.SEASONS:
+            start_timestamp, end_timestamp = self.__get_season_interval(season)
+            command = f"""
+                INSERT INTO {self.BEANS_HIGH_SCORE_TABLE} (
+                {self.BEANS_HIGH_SCORE_GUILD_ID_COL},
+                {self.BEANS_HIGH_SCORE_MEMBER_COL},
+                {self.BEANS_HIGH_SCORE_SEASON_COL},
+                {self.BEANS_HIGH_SCORE_TOTAL_COL},
+                {self.BEANS_HIGH_SCORE_VALUE_COL})
+                SELECT {self.EVENT_GUILD_ID_COL}, {self.BEANS_EVENT_MEMBER_COL}, ?, SUM({self.BEANS_EVENT_VALUE_COL}), MAX(rollingSum)
+                FROM (
+                    SELECT *, SUM({self.BEANS_EVENT_VALUE_COL})
+                    OVER (
+                        PARTITION BY {self.EVENT_GUILD_ID_COL}, {self.BEANS_EVENT_MEMBER_COL}
+                        ORDER BY {self.BEANS_EVENT_ID_COL}
+                    ) as rollingSum
+                    FROM {self.BEANS_EVENT_TABLE}
+                    INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.BEANS_EVENT_TABLE}.{self.BEANS_EVENT_ID_COL}
+                    WHERE {self.BEANS_EVENT_TYPE_COL} NOT IN {list_sanitized}
+                    AND {self.EVENT_TIMESTAMP_COL} > ?
+                    AND {self.EVENT_TIMESTAMP_COL} <= ?
+                    {guild_filter}
+                )
+                GROUP BY {self.EVENT_GUILD_ID_COL}, {self.BEANS_EVENT_MEMBER_COL};
+            """
+            task = (
+                season.value,
+                *excluded_types,
+                start_timestamp,
+                end_timestamp,
+                *guild_task,
+            )
+            await db.execute(command, task)
 
     async def get_lootbox_purchases_by_guild(
         self, guild_id: int, until: int = None, season: Season = Season.CURRENT
@@ -2181,81 +2600,90 @@ class Database:
         }
         return rows
 
+    async def __rebuild_inventory_counts(self, db: aiosqlite.Connection):
+        await db.execute(f"DELETE FROM {self.INVENTORY_COUNT_TABLE};")
+
+        for season in self.SEASONS:
+            start_timestamp, end_timestamp = self.__get_season_interval(season)
+            command = f"""
+                INSERT INTO {self.INVENTORY_COUNT_TABLE} (
+                {self.INVENTORY_COUNT_GUILD_ID_COL},
+                {self.INVENTORY_COUNT_MEMBER_COL},
+                {self.INVENTORY_COUNT_ITEM_TYPE_COL},
+                {self.INVENTORY_COUNT_SEASON_COL},
+                {self.INVENTORY_COUNT_AMOUNT_COL})
+                SELECT {self.EVENT_GUILD_ID_COL}, {self.INVENTORY_EVENT_MEMBER_COL}, {self.INVENTORY_EVENT_ITEM_TYPE_COL}, ?, SUM({self.INVENTORY_EVENT_AMOUNT_COL})
+                FROM {self.INVENTORY_EVENT_TABLE}
+                INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.INVENTORY_EVENT_TABLE}.{self.INVENTORY_EVENT_ID_COL}
+                WHERE {self.EVENT_TIMESTAMP_COL} > ?
+                AND {self.EVENT_TIMESTAMP_COL} <= ?
+                GROUP BY {self.EVENT_GUILD_ID_COL}, {self.INVENTORY_EVENT_MEMBER_COL}, {self.INVENTORY_EVENT_ITEM_TYPE_COL};
+            """
+            task = (season.value, start_timestamp, end_timestamp)
+            await db.execute(command, task)
+
+    def __parse_inventory_counts(
+        self, rows, season: Season, item_types: list[ItemType] = None
+    ) -> dict[int, dict[ItemType, int]]:
+        # permanent items are kept across seasons, so their all time count
+        # takes precedence over the seasonal one
+        seasonal = {}
+        permanent = {}
+        for row in rows:
+            item_value = row[self.INVENTORY_COUNT_ITEM_TYPE_COL]
+            amount = row[self.INVENTORY_COUNT_AMOUNT_COL]
+            if amount <= 0 or item_value not in ItemType:
+                continue
+            item_type = ItemType(item_value)
+            if item_types is not None and item_type not in item_types:
+                continue
+
+            user_id = row[self.INVENTORY_COUNT_MEMBER_COL]
+            row_season = row[self.INVENTORY_COUNT_SEASON_COL]
+            if row_season == season.value:
+                seasonal.setdefault(user_id, {})[item_type] = amount
+            if (
+                row_season == Season.ALL_TIME.value
+                and item_type in self.PERMANENT_ITEMS
+            ):
+                permanent.setdefault(user_id, {})[item_type] = amount
+
+        for user_id, item_counts in permanent.items():
+            seasonal[user_id] = seasonal.get(user_id, {}) | item_counts
+
+        return seasonal
+
     async def get_permanent_item_counts_by_guild(
         self, guild_id: int
     ) -> dict[int, dict[ItemType, int]]:
-        item_types = [item.value for item in self.PERMANENT_ITEMS]
-        list_sanitized = self.__list_sanitizer(item_types)
         command = f"""
-            SELECT {self.INVENTORY_EVENT_ITEM_TYPE_COL}, {self.INVENTORY_EVENT_MEMBER_COL}, SUM({self.INVENTORY_EVENT_AMOUNT_COL}) FROM {self.INVENTORY_EVENT_TABLE} 
-            INNER JOIN {self.EVENT_TABLE} 
-            ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.INVENTORY_EVENT_TABLE}.{self.INVENTORY_EVENT_ID_COL}
-            WHERE {self.EVENT_GUILD_ID_COL} = ?
-            AND {self.INVENTORY_EVENT_ITEM_TYPE_COL} in {list_sanitized}
-            GROUP BY {self.INVENTORY_EVENT_MEMBER_COL}, {self.INVENTORY_EVENT_ITEM_TYPE_COL};
+            SELECT * FROM {self.INVENTORY_COUNT_TABLE}
+            WHERE {self.INVENTORY_COUNT_GUILD_ID_COL} = ?
+            AND {self.INVENTORY_COUNT_SEASON_COL} = ?;
         """
-        task = (guild_id, *item_types)
+        task = (guild_id, Season.ALL_TIME.value)
         rows = await self.__query_select(command, task)
         if not rows or len(rows) < 1:
             return {}
 
-        transformed = {}
-        for row in rows:
-            user_id = row[self.INVENTORY_EVENT_MEMBER_COL]
-            item_type = ItemType(row[self.INVENTORY_EVENT_ITEM_TYPE_COL])
-            amount = row[f"SUM({self.INVENTORY_EVENT_AMOUNT_COL})"]
-            if amount <= 0:
-                continue
-            if user_id not in transformed:
-                transformed[user_id] = {item_type: amount}
-            else:
-                transformed[user_id][item_type] = amount
-
-        return transformed
+        return self.__parse_inventory_counts(
+            rows, Season.ALL_TIME, self.PERMANENT_ITEMS
+        )
 
     async def get_item_counts_by_guild(
         self, guild_id: int, season: Season = Season.CURRENT
     ) -> dict[int, dict[ItemType, int]]:
-        start_timestamp, end_timestamp = self.__get_season_interval(season)
         command = f"""
-            SELECT {self.INVENTORY_EVENT_ITEM_TYPE_COL}, {self.INVENTORY_EVENT_MEMBER_COL}, SUM({self.INVENTORY_EVENT_AMOUNT_COL}) FROM {self.INVENTORY_EVENT_TABLE} 
-            INNER JOIN {self.EVENT_TABLE} 
-            ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.INVENTORY_EVENT_TABLE}.{self.INVENTORY_EVENT_ID_COL}
-            WHERE {self.EVENT_GUILD_ID_COL} = ?
-            AND {self.EVENT_TIMESTAMP_COL} > ?
-            AND {self.EVENT_TIMESTAMP_COL} <= ?
-            GROUP BY {self.INVENTORY_EVENT_MEMBER_COL}, {self.INVENTORY_EVENT_ITEM_TYPE_COL};
+            SELECT * FROM {self.INVENTORY_COUNT_TABLE}
+            WHERE {self.INVENTORY_COUNT_GUILD_ID_COL} = ?
+            AND {self.INVENTORY_COUNT_SEASON_COL} IN (?, ?);
         """
-        task = (guild_id, start_timestamp, end_timestamp)
+        task = (guild_id, season.value, Season.ALL_TIME.value)
         rows = await self.__query_select(command, task)
-
-        permanent_items = await self.get_permanent_item_counts_by_guild(guild_id)
-
         if not rows or len(rows) < 1:
-            return permanent_items
-
-        transformed = {}
-        for row in rows:
-            user_id = row[self.INVENTORY_EVENT_MEMBER_COL]
-            if row[self.INVENTORY_EVENT_ITEM_TYPE_COL] not in ItemType:
-                continue
-            item_type = ItemType(row[self.INVENTORY_EVENT_ITEM_TYPE_COL])
-            amount = row[f"SUM({self.INVENTORY_EVENT_AMOUNT_COL})"]
-            if amount <= 0:
-                continue
-            if user_id not in transformed:
-                transformed[user_id] = {item_type: amount}
-            else:
-                transformed[user_id][item_type] = amount
-
-        for user_id, item_counts in permanent_items.items():
-            if user_id not in transformed:
-                transformed[user_id] = permanent_items[user_id]
-                continue
-            for item_type, count in item_counts.items():
-                transformed[user_id][item_type] = count
+            return {}
 
-        return transformed
+        return self.__parse_inventory_counts(rows, season)
 
     async def get_permanent_item_counts_by_user(
         self, guild_id: int, user_id: int, item_types: list[ItemType] = None
@@ -2268,29 +2696,20 @@ class Database:
                 if item_type in item_types
             ]
 
-        permanent_types = [item.value for item in permanent_items]
-        list_sanitized = self.__list_sanitizer(permanent_types)
         command = f"""
-            SELECT {self.INVENTORY_EVENT_ITEM_TYPE_COL}, SUM({self.INVENTORY_EVENT_AMOUNT_COL}) FROM {self.INVENTORY_EVENT_TABLE} 
-            INNER JOIN {self.EVENT_TABLE} 
-            ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.INVENTORY_EVENT_TABLE}.{self.INVENTORY_EVENT_ID_COL}
-            WHERE {self.INVENTORY_EVENT_MEMBER_COL} = ?
-            AND {self.EVENT_GUILD_ID_COL} = ?
-            AND {self.INVENTORY_EVENT_ITEM_TYPE_COL} IN {list_sanitized}
-            GROUP BY {self.INVENTORY_EVENT_ITEM_TYPE_COL};
+            SELECT * FROM {self.INVENTORY_COUNT_TABLE}
+            WHERE {self.INVENTORY_COUNT_GUILD_ID_COL} = ?
+            AND {self.INVENTORY_COUNT_SEASON_COL} = ?
+            AND {self.INVENTORY_COUNT_MEMBER_COL} = ?;
         """
-        task = (user_id, guild_id, *permanent_types)
+        task = (guild_id, Season.ALL_TIME.value, user_id)
         rows = await self.__query_select(command, task)
         if not rows or len(rows) < 1:
             return {}
 
-        return {
-            ItemType(row[self.INVENTORY_EVENT_ITEM_TYPE_COL]): row[
-                f"SUM({self.INVENTORY_EVENT_AMOUNT_COL})"
-            ]
-            for row in rows
-            if row[f"SUM({self.INVENTORY_EVENT_AMOUNT_COL})"] > 0
-        }
+        return self.__parse_inventory_counts(
+            rows, Season.ALL_TIME, permanent_items
+        ).get(user_id, {})
 
     async def get_item_counts_by_user(
         self,
@@ -2299,49 +2718,18 @@ class Database:
         season: Season = Season.CURRENT,
         item_types: list[ItemType] = None,
     ) -> dict[ItemType, int]:
-        item_types_filter = ""
-
-        start_timestamp, end_timestamp = self.__get_season_interval(season)
-        task = (user_id, guild_id, start_timestamp, end_timestamp)
-
-        if item_types is not None:
-            types = [item.value for item in item_types]
-            list_sanitized = self.__list_sanitizer(types)
-            item_types_filter = (
-                f"AND {self.INVENTORY_EVENT_ITEM_TYPE_COL} IN {list_sanitized}"
-            )
-            task = (user_id, guild_id, start_timestamp, end_timestamp, *types)
-
         command = f"""
-            SELECT {self.INVENTORY_EVENT_ITEM_TYPE_COL}, SUM({self.INVENTORY_EVENT_AMOUNT_COL}) FROM {self.INVENTORY_EVENT_TABLE} 
-            INNER JOIN {self.EVENT_TABLE} 
-            ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.INVENTORY_EVENT_TABLE}.{self.INVENTORY_EVENT_ID_COL}
-            WHERE {self.INVENTORY_EVENT_MEMBER_COL} = ?
-            AND {self.EVENT_GUILD_ID_COL} = ?
-            AND {self.EVENT_TIMESTAMP_COL} > ?
-            AND {self.EVENT_TIMESTAMP_COL} <= ?
-            {item_types_filter}
-            GROUP BY {self.INVENTORY_EVENT_ITEM_TYPE_COL};
+            SELECT * FROM {self.INVENTORY_COUNT_TABLE}
+            WHERE {self.INVENTORY_COUNT_GUILD_ID_COL} = ?
+            AND {self.INVENTORY_COUNT_SEASON_COL} IN (?, ?)
+            AND {self.INVENTORY_COUNT_MEMBER_COL} = ?;
         """
+        task = (guild_id, season.value, Season.ALL_TIME.value, user_id)
         rows = await self.__query_select(command, task)
-
-        permanent_items = await self.get_permanent_item_counts_by_user(
-            guild_id, user_id, item_types
-        )
-
         if not rows or len(rows) < 1:
-            return permanent_items
+            return {}
 
-        transformed = {
-            ItemType(row[self.INVENTORY_EVENT_ITEM_TYPE_COL]): row[
-                f"SUM({self.INVENTORY_EVENT_AMOUNT_COL})"
-            ]
-            for row in rows
-            if row[f"SUM({self.INVENTORY_EVENT_AMOUNT_COL})"] > 0
-            and row[self.INVENTORY_EVENT_ITEM_TYPE_COL] in ItemType
-        }
-        result = transformed | permanent_items
-        return result
+        return self.__parse_inventory_counts(rows, season, item_types).get(user_id, {})
 
     async def get_prediction_by_id(self, prediction_id: int) -> Prediction:
 
@@ -2717,84 +3105,55 @@ class Database:
         garden.plots.append(plot)
         return garden
 
-    async def get_garden_plots(
-        self, garden_id, season: Season = Season.CURRENT
+    def __get_plot_states(
+        self, plots: list[Plot], rows: list[dict[str, Any]]
     ) -> list[Plot]:
-        command = f"""
-            SELECT * FROM {self.GARDEN_TABLE}
-            INNER JOIN {self.PLOT_TABLE} ON {self.PLOT_TABLE}.{self.PLOT_GARDEN_ID} = {self.GARDEN_TABLE}.{self.GARDEN_ID}
-            WHERE {self.GARDEN_ID} = {int(garden_id)};
-        """
-        rows = await self.__query_select(command)
-        if not rows or len(rows) < 1:
-            return []
-
-        plots: list[Plot] = []
-
-        for row in rows:
-            plot = Plot(
-                row[self.PLOT_ID],
-                garden_id,
-                row[self.PLOT_X],
-                row[self.PLOT_Y],
-            )
-            plots.append(plot)
-
-        start_timestamp, end_timestamp = self.__get_season_interval(season)
-        command = f"""
-            SELECT * FROM {self.GARDEN_EVENT_TABLE}
-            INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.GARDEN_EVENT_TABLE}.{self.GARDEN_EVENT_ID_COL}
-            WHERE {self.GARDEN_EVENT_GARDEN_ID_COL} = ?
-            AND {self.EVENT_TIMESTAMP_COL} > ?
-            AND {self.EVENT_TIMESTAMP_COL} <= ?
-            ORDER BY {self.EVENT_TIMESTAMP_COL} DESC;
-        """
-        task = (garden_id, start_timestamp, end_timestamp)
-        rows = await self.__query_select(command, task)
-        if not rows or len(rows) < 1:
-            return plots
-
+        # rows are the garden events of a single garden, newest first
         plot_plants = {}
         plot_water_events = {}
         plot_last_fertilized = {}
         flash_bean_events = []
         plot_notified = {}
-        skip_list = []
+        skip_list = set()
 
         for row in rows:
             plot_id = row[self.GARDEN_EVENT_PLOT_ID_COL]
             type = GardenEventType(row[self.GARDEN_EVENT_TYPE_COL])
             payload = row[self.GARDEN_EVENT_PAYLOAD_COL]
+            event = None
 
             if (
                 type == GardenEventType.HARVEST
                 and payload == PlantType.YELLOW_BEAN.value
                 and plot_id not in plot_last_fertilized
             ):
-                plot_last_fertilized[plot_id] = GardenEvent.from_db_row(row)
+                event = GardenEvent.from_db_row(row)
+                plot_last_fertilized[plot_id] = event
             if (
                 type in [GardenEventType.PLANT, GardenEventType.REMOVE]
                 and payload == PlantType.FLASH_BEAN.value
             ):
-                flash_bean_events.append(GardenEvent.from_db_row(row))
+                event = GardenEvent.from_db_row(row)
+                flash_bean_events.append(event)
 
             if plot_id in skip_list:
                 continue
             match type:
                 case GardenEventType.PLANT:
-                    plot_plants[plot_id] = GardenEvent.from_db_row(row)
-                    skip_list.append(plot_id)
+                    if event is None:
+                        event = GardenEvent.from_db_row(row)
+                    plot_plants[plot_id] = event
+                    skip_list.add(plot_id)
                 case GardenEventType.WATER:
-                    if plot_id not in plot_water_events:
-                        plot_water_events[plot_id] = [GardenEvent.from_db_row(row)]
-                    else:
-                        plot_water_events[plot_id].append(GardenEvent.from_db_row(row))
+                    plot_water_events.setdefault(plot_id, []).append(
+                        GardenEvent.from_db_row(row)
+                    )
                 case GardenEventType.REMOVE | GardenEventType.HARVEST:
-                    skip_list.append(plot_id)
+                    skip_list.add(plot_id)
                 case GardenEventType.NOTIFICATION:
                     plot_notified[plot_id] = True
 
-        result = []
+        now = datetime.datetime.now()
 
         for plot in plots:
             if plot.id in plot_plants:
@@ -2805,7 +3164,6 @@ class Database:
                 plot.notified = plot_notified[plot.id]
 
             modifiers = PlotModifiers()
-            now = datetime.datetime.now()
 
             if plot.id in plot_water_events:
                 modifiers.water_events = plot_water_events[plot.id]
@@ -2815,9 +3173,47 @@ class Database:
             modifiers.flash_bean_events = flash_bean_events
 
             plot.modifiers = modifiers
-            result.append(plot)
 
-        return result
+        return plots
+
+    async def get_garden_plots(
+        self, garden_id, season: Season = Season.CURRENT
+    ) -> list[Plot]:
+        command = f"""
+            SELECT * FROM {self.GARDEN_TABLE}
+            INNER JOIN {self.PLOT_TABLE} ON {self.PLOT_TABLE}.{self.PLOT_GARDEN_ID} = {self.GARDEN_TABLE}.{self.GARDEN_ID}
+            WHERE {self.GARDEN_ID} = {int(garden_id)};
+        """
+        rows = await self.__query_select(command)
+        if not rows or len(rows) < 1:
+            return []
+
+        plots: list[Plot] = []
+
+        for row in rows:
+            plot = Plot(
+                row[self.PLOT_ID],
+                garden_id,
+                row[self.PLOT_X],
+                row[self.PLOT_Y],
+            )
+            plots.append(plot)
+
+        start_timestamp, end_timestamp = self.__get_season_interval(season)
+        command = f"""
+            SELECT * FROM {self.GARDEN_EVENT_TABLE}
+            INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.GARDEN_EVENT_TABLE}.{self.GARDEN_EVENT_ID_COL}
+            WHERE {self.GARDEN_EVENT_GARDEN_ID_COL} = ?
+            AND {self.EVENT_TIMESTAMP_COL} > ?
+            AND {self.EVENT_TIMESTAMP_COL} <= ?
+            ORDER BY {self.EVENT_TIMESTAMP_COL} DESC;
+        """
+        task = (garden_id, start_timestamp, end_timestamp)
+        rows = await self.__query_select(command, task)
+        if not rows or len(rows) < 1:
+            return plots
+
+        return self.__get_plot_states(plots, rows)
 
     async def get_user_seeds(
         self, guild_id: int, user_id: int, season: Season = Season.CURRENT
@@ -2865,34 +3261,62 @@ class Database:
     async def get_guild_gardens(
         self, guild_id: int, season: Season = Season.CURRENT
     ) -> list[UserGarden]:
-
         command = f"""
             SELECT * FROM {self.GARDEN_TABLE}
-            WHERE {self.GARDEN_GUILD_ID} = {int(guild_id)};
+            LEFT JOIN {self.PLOT_TABLE} ON {self.PLOT_TABLE}.{self.PLOT_GARDEN_ID} = {self.GARDEN_TABLE}.{self.GARDEN_ID}
+            WHERE {self.GARDEN_GUILD_ID} = ?
+            ORDER BY {self.GARDEN_ID}, {self.PLOT_ID};
         """
-        rows = await self.__query_select(command)
+        task = (guild_id,)
+        rows = await self.__query_select(command, task)
         if not rows or len(rows) < 1:
             return []
 
-        gardens = []
+        gardens: dict[int, UserGarden] = {}
 
         for row in rows:
             garden_id = row[self.GARDEN_ID]
-            user_id = row[self.GARDEN_USER_ID]
-
-            plots = await self.get_garden_plots(garden_id, season)
-
-            gardens.append(
-                UserGarden(
+            if garden_id not in gardens:
+                gardens[garden_id] = UserGarden(
                     garden_id,
                     guild_id,
-                    user_id,
-                    plots,
+                    row[self.GARDEN_USER_ID],
+                    [],
                     {},
                 )
+            if row[self.PLOT_ID] is None:
+                continue
+            gardens[garden_id].plots.append(
+                Plot(
+                    row[self.PLOT_ID],
+                    garden_id,
+                    row[self.PLOT_X],
+                    row[self.PLOT_Y],
+                )
             )
 
-        return gardens
+        start_timestamp, end_timestamp = self.__get_season_interval(season)
+        command = f"""
+            SELECT * FROM {self.GARDEN_EVENT_TABLE}
+            INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.GARDEN_EVENT_TABLE}.{self.GARDEN_EVENT_ID_COL}
+            WHERE {self.EVENT_GUILD_ID_COL} = ?
+            AND {self.EVENT_TIMESTAMP_COL} > ?
+            AND {self.EVENT_TIMESTAMP_COL} <= ?
+            ORDER BY {self.EVENT_TIMESTAMP_COL} DESC;
+        """
+        task = (guild_id, start_timestamp, end_timestamp)
+        rows = await self.__query_select(command, task)
+
+        garden_rows: dict[int, list[dict[str, Any]]] = {}
+        for row in rows if rows else []:
+            garden_rows.setdefault(row[self.GARDEN_EVENT_GARDEN_ID_COL], []).append(row)
+
+        for garden_id, garden in gardens.items():
+            if garden_id not in garden_rows:
+                continue
+            self.__get_plot_states(garden.plots, garden_rows[garden_id])
+
+        return list(gardens.values())
 
     async def get_guild_level(self, guild_id: int) -> int:
         command = f"""
@@ -3165,12 +3589,13 @@ class Database:
         return int(rows[0][self.ENCOUNTER_THREAD_ID_COL])
 
     async def get_encounter_events_by_encounter_id(
-        self, encounter_id: int
+        self, encounter_id: int, after_event_id: int = 0
     ) -> list[EncounterEvent]:
         command = f"""
             SELECT * FROM {self.ENCOUNTER_EVENT_TABLE}
             INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.ENCOUNTER_EVENT_TABLE}.{self.ENCOUNTER_EVENT_ID_COL}
             WHERE {self.ENCOUNTER_EVENT_ENCOUNTER_ID_COL} = {int(encounter_id)}
+            AND {self.EVENT_ID_COL} > {int(after_event_id)}
             ORDER BY {self.EVENT_ID_COL} DESC;
         """
         rows = await self.__query_select(command)
@@ -3180,12 +3605,13 @@ class Database:
         return [EncounterEvent.from_db_row(row) for row in rows]
 
     async def get_combat_events_by_encounter_id(
-        self, encounter_id: int
+        self, encounter_id: int, after_event_id: int = 0
     ) -> list[CombatEvent]:
         command = f"""
             SELECT * FROM {self.COMBAT_EVENT_TABLE}
             INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.COMBAT_EVENT_TABLE}.{self.COMBAT_EVENT_ID_COL}
             WHERE {self.COMBAT_EVENT_ENCOUNTER_ID_COL} = {int(encounter_id)}
+            AND {self.EVENT_ID_COL} > {int(after_event_id)}
             ORDER BY {self.EVENT_ID_COL} DESC;
         """
         rows = await self.__query_select(command)
@@ -3194,7 +3620,9 @@ class Database:
 
         return [CombatEvent.from_db_row(row) for row in rows]
 
-    async def log_user_gear_modifiers(self, gear_id: int, gear: Gear):
+    def __get_user_gear_modifier_rows(
+        self, gear_id: int, gear: Gear
+    ) -> tuple[str, list[Any]]:
         command = f"""
             INSERT INTO {self.USER_GEAR_MODIFIER_TABLE} (
             {self.USER_GEAR_MODIFIER_GEAR_ID_COL},
@@ -3202,33 +3630,33 @@ class Database:
             {self.USER_GEAR_MODIFIER_VALUE_COL})
             VALUES (?, ?, ?);
         """
+        tasks = [
+            (gear_id, modifier.value, value)
+            for modifier, value in gear.modifiers.items()
+        ]
 
-        for modifier, value in gear.modifiers.items():
-            task = (
-                gear_id,
-                modifier.value,
-                value,
-            )
-            await self.__query_insert(command, task)
+        return command, tasks
 
-    async def log_user_gear_skills(self, gear_id: int, gear: Gear):
+    def __get_user_gear_skill_rows(
+        self, gear_id: int, gear: Gear
+    ) -> tuple[str, list[Any]]:
         command = f"""
             INSERT INTO {self.USER_GEAR_SKILL_TABLE} (
             {self.USER_GEAR_SKILL_GEAR_ID_COL},
             {self.USER_GEAR_SKILL_TYPE_COL})
             VALUES (?, ?);
         """
+        tasks = [(gear_id, skill_type.value) for skill_type in gear.skills]
 
-        for skill_type in gear.skills:
-            task = (
-                gear_id,
-                skill_type.value,
-            )
-            await self.__query_insert(command, task)
+        return command, tasks
 
-    async def log_user_drop(
-        self, guild_id: int, member_id: int, drop: Droppable, generator_version: str
-    ):
+    async def __execute_user_drops(
+        self,
+        guild_id: int,
+        member_id: int,
+        drops: list[Droppable],
+        generator_version: str,
+    ) -> list[int]:
         command = f"""
             INSERT INTO {self.USER_GEAR_TABLE} (
             {self.USER_GEAR_GUILD_ID_COL},
@@ -3242,47 +3670,70 @@ class Database:
             {self.USER_GEAR_IS_LOCKED_COL})
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);
         """
-        task = (
-            guild_id,
-            member_id,
-            drop.base.base_type.value,
-            drop.type.value,
-            drop.level,
-            drop.rarity.value,
-            generator_version,
-            0,
-            0,
-        )
+        tasks = [
+            (
+                guild_id,
+                member_id,
+                drop.base.base_type.value,
+                drop.type.value,
+                drop.level,
+                drop.rarity.value,
+                generator_version,
+                0,
+                0,
+            )
+            for drop in drops
+        ]
 
-        insert_id = await self.__query_insert(command, task)
+        async with self.pool.writer() as db:
+            drop_ids = await self.__insert_many(db, command, tasks)
 
-        if drop.base.base_type == Base.GEAR:
-            gear: Gear = drop
-            await self.log_user_gear_modifiers(insert_id, gear)
-            await self.log_user_gear_skills(insert_id, gear)
+            modifier_tasks = []
+            skill_tasks = []
+            for drop_id, drop in zip(drop_ids, drops, strict=True):
+                if drop.base.base_type != Base.GEAR:
+                    continue
+                modifier_command, tasks = self.__get_user_gear_modifier_rows(
+                    drop_id, drop
+                )
+                modifier_tasks.extend(tasks)
+                skill_command, tasks = self.__get_user_gear_skill_rows(drop_id, drop)
+                skill_tasks.extend(tasks)
 
-        return insert_id
+            if len(modifier_tasks) > 0:
+                await self.__insert_many(db, modifier_command, modifier_tasks)
+            if len(skill_tasks) > 0:
+                await self.__insert_many(db, skill_command, skill_tasks)
 
-    async def get_skill_by_id(self, skill_id: int) -> Skill:
-        if skill_id is None:
-            return None
+        return list(drop_ids)
 
-        command = f""" 
-            SELECT * FROM {self.USER_GEAR_TABLE} 
-            WHERE {self.USER_GEAR_ID_COL} = {int(skill_id)}
-            ;
-        """
-        rows = await self.__query_select(command)
-        if not rows:
-            return None
+    async def log_user_drops(
+        self,
+        guild_id: int,
+        member_id: int,
+        drops: list[Droppable],
+        generator_version: str,
+    ) -> list[int]:
+        return await self.retry_policy.run(
+            self.__execute_user_drops, guild_id, member_id, drops, generator_version
+        )
 
-        id = rows[0][self.USER_GEAR_ID_COL]
-        skill_type = SkillType(rows[0][self.USER_GEAR_TYPE_COL])
+    async def log_user_drop(
+        self, guild_id: int, member_id: int, drop: Droppable, generator_version: str
+    ):
+        drop_ids = await self.log_user_drops(
+            guild_id, member_id, [drop], generator_version
+        )
+        return drop_ids[0]
+
+    def __parse_skill_row(self, row: dict[str, Any]) -> Skill:
+        id = row[self.USER_GEAR_ID_COL]
+        skill_type = SkillType(row[self.USER_GEAR_TYPE_COL])
         base_class = globals()[skill_type]
         base_skill: BaseSkill = base_class()  # noqa: F405
-        rarity = Rarity(rows[0][self.USER_GEAR_RARITY_COL])
-        level = rows[0][self.USER_GEAR_LEVEL_COL]
-        locked = int(rows[0][self.USER_GEAR_IS_LOCKED_COL]) == 1
+        rarity = Rarity(row[self.USER_GEAR_RARITY_COL])
+        level = row[self.USER_GEAR_LEVEL_COL]
+        locked = int(row[self.USER_GEAR_IS_LOCKED_COL]) == 1
 
         return Skill(
             base_skill=base_skill,
@@ -3292,22 +3743,22 @@ class Database:
             id=id,
         )
 
-    async def get_gear_by_id(self, gear_id: int) -> Gear:
-        if gear_id is None:
+    async def get_skill_by_id(self, skill_id: int) -> Skill:
+        if skill_id is None:
             return None
 
         command = f""" 
             SELECT * FROM {self.USER_GEAR_TABLE} 
-            LEFT JOIN {self.USER_GEAR_MODIFIER_TABLE} ON {self.USER_GEAR_MODIFIER_GEAR_ID_COL} = {self.USER_GEAR_ID_COL}
-            LEFT JOIN {self.USER_GEAR_SKILL_TABLE} ON {self.USER_GEAR_SKILL_GEAR_ID_COL} = {self.USER_GEAR_ID_COL}
-            WHERE {self.USER_GEAR_ID_COL} = {int(gear_id)}
-            AND {self.USER_GEAR_IS_SCRAPPED_COL} = 0
+            WHERE {self.USER_GEAR_ID_COL} = {int(skill_id)}
             ;
         """
         rows = await self.__query_select(command)
         if not rows:
             return None
 
+        return self.__parse_skill_row(rows[0])
+
+    def __parse_gear_rows(self, rows: list[dict[str, Any]]) -> Gear:
         id = rows[0][self.USER_GEAR_ID_COL]
         name = rows[0][self.USER_GEAR_NAME_COL]
         gear_base_type = GearBaseType(rows[0][self.USER_GEAR_TYPE_COL])
@@ -3345,6 +3796,50 @@ class Database:
             id=id,
         )
 
+    async def get_gear_by_id(self, gear_id: int) -> Gear:
+        if gear_id is None:
+            return None
+
+        command = f""" 
+            SELECT * FROM {self.USER_GEAR_TABLE} 
+            LEFT JOIN {self.USER_GEAR_MODIFIER_TABLE} ON {self.USER_GEAR_MODIFIER_GEAR_ID_COL} = {self.USER_GEAR_ID_COL}
+            LEFT JOIN {self.USER_GEAR_SKILL_TABLE} ON {self.USER_GEAR_SKILL_GEAR_ID_COL} = {self.USER_GEAR_ID_COL}
+            WHERE {self.USER_GEAR_ID_COL} = {int(gear_id)}
+            AND {self.USER_GEAR_IS_SCRAPPED_COL} = 0
+            ;
+        """
+        rows = await self.__query_select(command)
+        if not rows:
+            return None
+
+        return self.__parse_gear_rows(rows)
+
+    async def get_gear_by_ids(self, gear_ids: list[int]) -> dict[int, Gear]:
+        gear_ids = list({int(gear_id) for gear_id in gear_ids if gear_id is not None})
+        if len(gear_ids) == 0:
+            return {}
+
+        list_sanitized = self.__list_sanitizer(gear_ids)
+        command = f""" 
+            SELECT * FROM {self.USER_GEAR_TABLE} 
+            LEFT JOIN {self.USER_GEAR_MODIFIER_TABLE} ON {self.USER_GEAR_MODIFIER_GEAR_ID_COL} = {self.USER_GEAR_ID_COL}
+            LEFT JOIN {self.USER_GEAR_SKILL_TABLE} ON {self.USER_GEAR_SKILL_GEAR_ID_COL} = {self.USER_GEAR_ID_COL}
+            WHERE {self.USER_GEAR_ID_COL} IN {list_sanitized}
+            AND {self.USER_GEAR_IS_SCRAPPED_COL} = 0
+            ;
+        """
+        rows = await self.__query_select(command, gear_ids)
+        if not rows:
+            return {}
+
+        gear_rows: dict[int, list[dict[str, Any]]] = {}
+        for row in rows:
+            gear_rows.setdefault(row[self.USER_GEAR_ID_COL], []).append(row)
+
+        return {
+            gear_id: self.__parse_gear_rows(rows) for gear_id, rows in gear_rows.items()
+        }
+
     async def delete_gear_by_ids(self, gear_ids: list[int]):
         if gear_ids is None or len(gear_ids) == 0:
             return
@@ -3386,33 +3881,59 @@ class Database:
 
         return insert_id
 
+    async def create_user_equipment_by_members(
+        self, guild_id: int, member_ids: list[int]
+    ):
+        if len(member_ids) == 0:
+            return
+
+        values = ", ".join(["(?, ?)"] * len(member_ids))
+        command = f"""
+            INSERT OR IGNORE INTO {self.USER_EQUIPMENT_TABLE}
+            ({self.USER_EQUIPMENT_GUILD_ID_COL}, {self.USER_EQUIPMENT_MEMBER_ID_COL}) 
+            VALUES {values};
+        """
+        task = [value for member_id in member_ids for value in (guild_id, member_id)]
+
+        await self.__query_insert(command, task)
+
     async def get_user_equipped_skills(
         self, guild_id: int, member_id: int
     ) -> dict[int, Skill]:
+        equipped_skills = await self.get_user_equipped_skills_by_members(
+            guild_id, [member_id]
+        )
+        return equipped_skills[member_id]
+
+    async def get_user_equipped_skills_by_members(
+        self, guild_id: int, member_ids: list[int]
+    ) -> dict[int, dict[int, Skill]]:
+        equipped_skills = {}
+        for member_id in member_ids:
+            equipped_skills[member_id] = {index: None for index in range(4)}
+
+        if len(member_ids) == 0:
+            return equipped_skills
+
+        list_sanitized = self.__list_sanitizer(member_ids)
         command = f""" 
             SELECT * FROM {self.USER_EQUIPPED_SKILLS_TABLE} 
+            INNER JOIN {self.USER_GEAR_TABLE} ON {self.USER_GEAR_ID_COL} = {self.USER_EQUIPPED_SKILLS_SKILL_ID_COL}
             WHERE {self.USER_EQUIPPED_SKILLS_GUILD_ID_COL} = ?
-            AND {self.USER_EQUIPPED_SKILLS_MEMBER_ID_COL} = ?
+            AND {self.USER_EQUIPPED_SKILLS_MEMBER_ID_COL} IN {list_sanitized}
             ;
         """
-
-        skills = {}
-        for index in range(4):
-            skills[index] = None
-
-        task = (guild_id, member_id)
+        task = (guild_id, *member_ids)
         rows = await self.__query_select(command, task)
         if not rows:
-            return skills
+            return equipped_skills
 
         for row in rows:
-            skill_id = row[self.USER_EQUIPPED_SKILLS_SKILL_ID_COL]
+            member_id = row[self.USER_EQUIPPED_SKILLS_MEMBER_ID_COL]
             slot = row[self.USER_EQUIPPED_SKILLS_SLOT_COL]
-            skill = await self.get_skill_by_id(skill_id)
-            if skill is not None:
-                skills[slot] = skill
+            equipped_skills[member_id][slot] = self.__parse_skill_row(row)
 
-        return skills
+        return equipped_skills
 
     async def get_user_equipment_slot(
         self, guild_id: int, member_id: int, gear_slot: EquipmentSlot
@@ -3483,24 +4004,9 @@ class Database:
 
         return equipped
 
-    async def get_user_equipment(
-        self, guild_id: int, member_id: int
+    def __parse_user_equipment_row(
+        self, row: dict[str, Any], gear: dict[int, Gear]
     ) -> CharacterEquipment:
-        await self.create_user_equipment(guild_id, member_id)
-
-        command = f""" 
-            SELECT * FROM {self.USER_EQUIPMENT_TABLE} 
-            WHERE {self.USER_EQUIPMENT_GUILD_ID_COL} = ?
-            AND {self.USER_EQUIPMENT_MEMBER_ID_COL} = ?
-            LIMIT 1;
-        """
-
-        task = (guild_id, member_id)
-        rows = await self.__query_select(command, task)
-        if not rows:
-            return None
-        row = rows[0]
-
         weapon = None
         weapon_id = row[self.USER_EQUIPMENT_WEAPON_ID_COL]
         if weapon_id is not None and weapon_id < 0:
@@ -3511,28 +4017,61 @@ class Database:
                     weapon = DefaultWand()
 
         if weapon is None:
-            weapon = await self.get_gear_by_id(weapon_id)
-
-        head_gear = await self.get_gear_by_id(row[self.USER_EQUIPMENT_HEADGEAR_ID_COL])
-        body_gear = await self.get_gear_by_id(row[self.USER_EQUIPMENT_BODYGEAR_ID_COL])
-        leg_gear = await self.get_gear_by_id(row[self.USER_EQUIPMENT_LEGGEAR_ID_COL])
-        accessory_1 = await self.get_gear_by_id(
-            row[self.USER_EQUIPMENT_ACCESSORY_1_ID_COL]
-        )
-        accessory_2 = await self.get_gear_by_id(
-            row[self.USER_EQUIPMENT_ACCESSORY_2_ID_COL]
-        )
+            weapon = gear.get(weapon_id)
 
         return CharacterEquipment(
-            member_id=member_id,
+            member_id=row[self.USER_EQUIPMENT_MEMBER_ID_COL],
             weapon=weapon,
-            head_gear=head_gear,
-            body_gear=body_gear,
-            leg_gear=leg_gear,
-            accessory_1=accessory_1,
-            accessory_2=accessory_2,
+            head_gear=gear.get(row[self.USER_EQUIPMENT_HEADGEAR_ID_COL]),
+            body_gear=gear.get(row[self.USER_EQUIPMENT_BODYGEAR_ID_COL]),
+            leg_gear=gear.get(row[self.USER_EQUIPMENT_LEGGEAR_ID_COL]),
+            accessory_1=gear.get(row[self.USER_EQUIPMENT_ACCESSORY_1_ID_COL]),
+            accessory_2=gear.get(row[self.USER_EQUIPMENT_ACCESSORY_2_ID_COL]),
         )
 
+    async def get_user_equipment(
+        self, guild_id: int, member_id: int
+    ) -> CharacterEquipment:
+        equipment = await self.get_user_equipment_by_members(guild_id, [member_id])
+        return equipment.get(member_id)
+
+    async def get_user_equipment_by_members(
+        self, guild_id: int, member_ids: list[int]
+    ) -> dict[int, CharacterEquipment]:
+        if len(member_ids) == 0:
+            return {}
+
+        await self.create_user_equipment_by_members(guild_id, member_ids)
+
+        list_sanitized = self.__list_sanitizer(member_ids)
+        command = f""" 
+            SELECT * FROM {self.USER_EQUIPMENT_TABLE} 
+            WHERE {self.USER_EQUIPMENT_GUILD_ID_COL} = ?
+            AND {self.USER_EQUIPMENT_MEMBER_ID_COL} IN {list_sanitized};
+        """
+        task = (guild_id, *member_ids)
+        rows = await self.__query_select(command, task)
+        if not rows:
+            return {}
+
+        gear_columns = [
+            self.USER_EQUIPMENT_WEAPON_ID_COL,
+            self.USER_EQUIPMENT_HEADGEAR_ID_COL,
+            self.USER_EQUIPMENT_BODYGEAR_ID_COL,
+            self.USER_EQUIPMENT_LEGGEAR_ID_COL,
+            self.USER_EQUIPMENT_ACCESSORY_1_ID_COL,
+            self.USER_EQUIPMENT_ACCESSORY_2_ID_COL,
+        ]
+        gear_ids = [row[column] for row in rows for column in gear_columns]
+        gear = await self.get_gear_by_ids(gear_ids)
+
+        return {
+            row[self.USER_EQUIPMENT_MEMBER_ID_COL]: self.__parse_user_equipment_row(
+                row, gear
+            )
+            for row in rows
+        }
+
     async def update_user_equipment(
         self, guild_id: int, member_id: int, gear: Gear, acc_slot_2: bool = False
     ):
@@ -3646,32 +4185,9 @@ class Database:
 
         return armory
 
-    async def get_user_skill_stacks_used(
-        self, guild_id: int, member_id: int
+    def __count_user_skill_stacks_used(
+        self, rows: list[dict[str, Any]], current_encounter_id: int
     ) -> dict[int, int]:
-        command = f"""
-            SELECT * FROM {self.COMBAT_EVENT_TABLE}
-            INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.COMBAT_EVENT_TABLE}.{self.COMBAT_EVENT_ID_COL}
-            LEFT JOIN {self.USER_GEAR_TABLE} ON {self.COMBAT_EVENT_SKILL_ID} = {self.USER_GEAR_ID_COL}
-            LEFT JOIN {self.USER_EQUIPPED_SKILLS_TABLE} ON {self.COMBAT_EVENT_SKILL_ID} = {self.USER_EQUIPPED_SKILLS_SKILL_ID_COL}
-            WHERE {self.EVENT_GUILD_ID_COL} = ?
-            AND {self.COMBAT_EVENT_MEMBER_ID} = ?
-            ORDER BY {self.EVENT_ID_COL} DESC;
-        """
-        task = (guild_id, member_id)
-        rows = await self.__query_select(command, task)
-        if not rows:
-            return {}
-
-        active_encounters = await self.get_encounter_participants(guild_id)
-
-        current_encounter_id = None
-
-        for encounter_id, members in active_encounters.items():
-            if member_id in members:
-                current_encounter_id = encounter_id
-                break
-
         stacks_used = {}
         previous_skill = None
         for row in rows:
@@ -3713,6 +4229,56 @@ class Database:
 
         return stacks_used
 
+    async def get_user_skill_stacks_used(
+        self, guild_id: int, member_id: int
+    ) -> dict[int, int]:
+        stacks_used = await self.get_user_skill_stacks_used_by_members(
+            guild_id, [member_id]
+        )
+        return stacks_used[member_id]
+
+    async def get_user_skill_stacks_used_by_members(
+        self, guild_id: int, member_ids: list[int]
+    ) -> dict[int, dict[int, int]]:
+        stacks_used = {member_id: {} for member_id in member_ids}
+        if len(member_ids) == 0:
+            return stacks_used
+
+        list_sanitized = self.__list_sanitizer(member_ids)
+        command = f"""
+            SELECT * FROM {self.COMBAT_EVENT_TABLE}
+            INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.COMBAT_EVENT_TABLE}.{self.COMBAT_EVENT_ID_COL}
+            LEFT JOIN {self.USER_GEAR_TABLE} ON {self.COMBAT_EVENT_SKILL_ID} = {self.USER_GEAR_ID_COL}
+            LEFT JOIN {self.USER_EQUIPPED_SKILLS_TABLE} ON {self.COMBAT_EVENT_SKILL_ID} = {self.USER_EQUIPPED_SKILLS_SKILL_ID_COL}
+            WHERE {self.EVENT_GUILD_ID_COL} = ?
+            AND {self.COMBAT_EVENT_MEMBER_ID} IN {list_sanitized}
+            ORDER BY {self.EVENT_ID_COL} DESC;
+        """
+        task = (guild_id, *member_ids)
+        rows = await self.__query_select(command, task)
+        if not rows:
+            return stacks_used
+
+        member_rows: dict[int, list[dict[str, Any]]] = {}
+        for row in rows:
+            member_rows.setdefault(row[self.COMBAT_EVENT_MEMBER_ID], []).append(row)
+
+        active_encounters = await self.get_encounter_participants(guild_id)
+
+        for member_id, rows in member_rows.items():
+            current_encounter_id = None
+
+            for encounter_id, members in active_encounters.items():
+                if member_id in members:
+                    current_encounter_id = encounter_id
+                    break
+
+            stacks_used[member_id] = self.__count_user_skill_stacks_used(
+                rows, current_encounter_id
+            )
+
+        return stacks_used
+
     async def get_opponent_skill_stacks_used(
         self, encounter_id: int
     ) -> dict[SkillType, int]:
@@ -3867,13 +4433,15 @@ class Database:
     async def get_status_effects_by_encounter(
         self,
         encounter_id: int,
+        after_event_id: int = 0,
     ) -> dict[int, list[StatusEffectEvent]]:
         command = f"""
             SELECT * FROM {self.STATUS_EFFECT_EVENT_TABLE} 
             INNER JOIN {self.EVENT_TABLE} 
             ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.STATUS_EFFECT_EVENT_TABLE}.{self.STATUS_EFFECT_EVENT_ID_COL}
             WHERE {self.STATUS_EFFECT_EVENT_ENCOUNTER_ID_COL} = {int(encounter_id)}
-            ;
+            AND {self.EVENT_ID_COL} > {int(after_event_id)}
+            ORDER BY {self.EVENT_ID_COL};
         """
 
         rows = await self.__query_select(command)
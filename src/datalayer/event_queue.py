@@ -0,0 +1,137 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from control.logger import BotLogger
+from events.bot_event import BotEvent
+
+
+class EventQueue:
+
+    DEFAULT_MAX_SIZE = 1000
+    DEFAULT_BATCH_SIZE = 100
+    DEFAULT_FLUSH_INTERVAL = 0.005
+
+    def __init__(
+        self,
+        logger: BotLogger,
+        flush: Callable[[list[BotEvent]], Awaitable[list[int]]],
+        max_size: int = DEFAULT_MAX_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        self.logger = logger
+        self.flush = flush
+        self.max_size = max(1, max_size)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        self.queue: asyncio.Queue[tuple[BotEvent, asyncio.Future]] = None
+        self.worker: asyncio.Task = None
+        self.is_closing = False
+
+        self.flush_count = 0
+        self.event_count = 0
+        self.failure_count = 0
+
+    def start(self) -> None:
+        if self.worker is not None:
+            return
+        self.is_closing = False
+        self.queue = asyncio.Queue(maxsize=self.max_size)
+        self.worker = asyncio.create_task(self.__run())
+
+    async def close(self) -> None:
+        if self.worker is None:
+            return
+        self.is_closing = True
+
+        # the sentinel queues up behind every pending event, so they get flushed first
+        await self.queue.put(None)
+        await self.worker
+
+        self.worker = None
+        self.queue = None
+
+    async def submit(self, event: BotEvent) -> asyncio.Future:
+        if self.is_closing:
+            raise RuntimeError("Event queue is closed.")
+        if self.worker is None:
+            self.start()
+
+        future = asyncio.get_running_loop().create_future()
+        # blocks while the queue is full so producers can't outrun the writer
+        await self.queue.put((event, future))
+        return future
+
+    async def log(self, event: BotEvent) -> int:
+        future = await self.submit(event)
+        return await future
+
+    def get_pending_count(self) -> int:
+        if self.queue is None:
+            return 0
+        return self.queue.qsize()
+
+    async def __collect(self) -> tuple[list[tuple[BotEvent, asyncio.Future]], bool]:
+        batch = []
+        item = await self.queue.get()
+        if item is None:
+            return batch, True
+        batch.append(item)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+
+        while len(batch) < self.batch_size:
+            if self.queue.empty():
+                timeout = deadline - loop.time()
+                # a lone event is written right away, only bursts wait for stragglers
+                if timeout <= 0 or len(batch) == 1:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout)
+                except TimeoutError:
+                    break
+            else:
+                item = self.queue.get_nowait()
+
+            if item is None:
+                return batch, True
+            batch.append(item)
+
+        return batch, False
+
+    async def __flush_batch(self, batch: list[tuple[BotEvent, asyncio.Future]]):
+        events = [event for event, _ in batch]
+        try:
+            event_ids = await self.flush(events)
+        except Exception as e:
+            if len(batch) > 1:
+                # retry one by one so a single bad event doesn't take the others down
+                for item in batch:
+                    await self.__flush_batch([item])
+                return
+
+            self.failure_count += 1
+            self.logger.error(
+                "DB",
+                f"Failed to write {events[0].type.value} event: {e}",
+            )
+            _, future = batch[0]
+            if not future.done():
+                future.set_exception(e)
+            return
+
+        self.flush_count += 1
+        self.event_count += len(batch)
+        for (_, future), event_id in zip(batch, event_ids, strict=True):
+            if not future.done():
+                future.set_result(event_id)
+
+    async def __run(self):
+        while True:
+            batch, stop = await self.__collect()
+            if len(batch) > 0:
+                await self.__flush_batch(batch)
+            if stop:
+                return
@@ -0,0 +1,72 @@
+from collections.abc import Awaitable, Callable
+
+import aiosqlite
+from control.logger import BotLogger
+
+
+class Migration:
+
+    def __init__(
+        self,
+        version: int,
+        name: str,
+        statements: list[str],
+        callback: Callable[[aiosqlite.Connection], Awaitable[None]] = None,
+    ):
+        self.version = version
+        self.name = name
+        self.statements = statements
+        self.callback = callback
+
+
+class MigrationRunner:
+
+    def __init__(self, logger: BotLogger, migrations: list[Migration]):
+        self.logger = logger
+        self.migrations = sorted(migrations, key=lambda x: x.version)
+
+        versions = [migration.version for migration in self.migrations]
+        if len(versions) != len(set(versions)):
+            raise ValueError("Migration versions must be unique.")
+
+    async def get_schema_version(self, db: aiosqlite.Connection) -> int:
+        async with db.execute("PRAGMA user_version;") as cursor:
+            row = await cursor.fetchone()
+            return int(row[0])
+
+    def get_latest_version(self) -> int:
+        if len(self.migrations) == 0:
+            return 0
+        return self.migrations[-1].version
+
+    async def run(self, db: aiosqlite.Connection) -> int:
+        current_version = await self.get_schema_version(db)
+
+        for migration in self.migrations:
+            if migration.version <= current_version:
+                continue
+
+            # each migration and its version bump are applied atomically
+            await db.execute("BEGIN;")
+            try:
+                for statement in migration.statements:
+                    await db.execute(statement)
+                if migration.callback is not None:
+                    await migration.callback(db)
+                await db.execute(f"PRAGMA user_version = {int(migration.version)};")
+            except Exception:
+                await db.rollback()
+                self.logger.error(
+                    "DB",
+                    f"Migration {migration.version} ({migration.name}) failed, schema stays at version {current_version}.",
+                )
+                raise
+            await db.commit()
+
+            current_version = migration.version
+            self.logger.log(
+                "DB",
+                f"Applied migration {migration.version} ({migration.name}).",
+            )
+
+        return current_version
@@ -1,56 +1,103 @@
 import collections
 import datetime
-import itertools
 
 
-class PoliceListNode:
+class SlidingWindow:
 
-    def __init__(self, author_id: int):
-        self.author_id = author_id
-        self.spam_message_queue = collections.deque(maxlen=50)
-        self.timeout_message_queue = collections.deque(maxlen=50)
-        self.timeout_flag = False
+    HISTORY_LENGTH = 50
 
-    def __threshold_check(
-        self, queue: collections.deque, interval: int, limit: int, offset: int = 0
-    ) -> bool:
-        if len(queue) < (limit + offset):
-            return False
-
-        min_time = datetime.datetime.max
-        max_time = datetime.datetime.min
+    def __init__(self):
+        self.history: collections.deque[float] = collections.deque(
+            maxlen=self.HISTORY_LENGTH
+        )
+        self.interval = None
+        self.limit = None
+        self.__reset()
+
+    def __reset(self) -> None:
+        self.count = 0
+        self.streak = 0
+        self.triggered = False
+        # monotonic queues of (index, timestamp), front holds the window min/max
+        self.min_queue: collections.deque[tuple[int, float]] = collections.deque()
+        self.max_queue: collections.deque[tuple[int, float]] = collections.deque()
+
+    def __push(self, timestamp: float) -> None:
+        index = self.count
+        self.count += 1
+
+        while len(self.min_queue) > 0 and self.min_queue[-1][1] >= timestamp:
+            self.min_queue.pop()
+        self.min_queue.append((index, timestamp))
+
+        while len(self.max_queue) > 0 and self.max_queue[-1][1] <= timestamp:
+            self.max_queue.pop()
+        self.max_queue.append((index, timestamp))
+
+        window_start = index - self.limit + 1
+        while self.min_queue[0][0] < window_start:
+            self.min_queue.popleft()
+        while self.max_queue[0][0] < window_start:
+            self.max_queue.popleft()
+
+        self.triggered = (
+            self.count >= self.limit
+            and self.max_queue[0][1] - self.min_queue[0][1] < self.interval
+        )
+        self.streak = self.streak + 1 if self.triggered else 0
+
+    def configure(self, interval: int, limit: int) -> None:
+        limit = max(1, limit)
+        if interval == self.interval and limit == self.limit:
+            return
+
+        # settings changed, rebuild the window from the retained messages
+        self.interval = interval
+        self.limit = limit
+        self.__reset()
+        for timestamp in self.history:
+            self.__push(timestamp)
+
+    def append(self, timestamp: float) -> None:
+        self.history.append(timestamp)
+        if self.limit is not None:
+            self.__push(timestamp)
 
-        slice_start = len(queue) - (limit + offset)
-        slice_end = len(queue) - offset
+    def clear(self) -> None:
+        self.history.clear()
+        self.__reset()
 
-        slice_result = list(itertools.islice(queue, slice_start, slice_end))
 
-        for timestamp in slice_result:
-            min_time = min([min_time, timestamp.replace(tzinfo=None)])
-            max_time = max([max_time, timestamp.replace(tzinfo=None)])
+class PoliceListNode:
 
-        difference = max_time - min_time
-        return difference.total_seconds() < interval
+    def __init__(self, author_id: int):
+        self.author_id = author_id
+        self.spam_window = SlidingWindow()
+        self.timeout_window = SlidingWindow()
+        self.timeout_flag = False
+        self.last_seen = datetime.datetime.now().timestamp()
 
     def track_spam_message(self, message_timestamp: datetime.datetime) -> None:
-        self.spam_message_queue.append(message_timestamp)
+        self.last_seen = message_timestamp.timestamp()
+        self.spam_window.append(self.last_seen)
 
     def track_timeout_message(self, message_timestamp: datetime.datetime) -> None:
-        self.timeout_message_queue.append(message_timestamp)
+        self.last_seen = message_timestamp.timestamp()
+        self.timeout_window.append(self.last_seen)
 
-    def spam_check(self, interval: int, limit: int, offset: int = 0) -> bool:
-        return self.__threshold_check(self.spam_message_queue, interval, limit, offset)
+    def spam_check(self, interval: int, limit: int) -> bool:
+        self.spam_window.configure(interval, limit)
+        return self.spam_window.triggered
 
     def check_spam_score_increase(self, interval: int, limit: int) -> bool:
         # only returns true for every limit'th message the user was spamming in a row
-        offset = 0
-        while self.spam_check(interval, limit, offset):
-            offset += 1
-
-        return offset == 1 or (offset - 1) % limit == 0
+        self.spam_window.configure(interval, limit)
+        streak = self.spam_window.streak
+        return streak > 0 and (streak - 1) % self.spam_window.limit == 0
 
     def timeout_check(self, interval: int, limit: int) -> bool:
-        return self.__threshold_check(self.timeout_message_queue, interval, limit, 0)
+        self.timeout_window.configure(interval, limit)
+        return self.timeout_window.triggered
 
     def is_in_timeout(self) -> datetime.datetime:
         return self.timeout_flag
@@ -60,13 +107,19 @@ class PoliceListNode:
 
     def release(self) -> None:
         self.timeout_flag = False
-        self.timeout_message_queue.clear()
+        self.timeout_window.clear()
 
 
 class PoliceList:
 
-    def __init__(self):
-        self.users: dict[int, PoliceListNode] = {}
+    IDLE_TIMEOUT = 60 * 60
+
+    def __init__(self, idle_timeout: int = IDLE_TIMEOUT):
+        # ordered by last activity, idle users are evicted from the front
+        self.users: collections.OrderedDict[int, PoliceListNode] = (
+            collections.OrderedDict()
+        )
+        self.idle_timeout = idle_timeout
 
     def add_user(self, author_id: int) -> None:
         self.users[author_id] = PoliceListNode(author_id)
@@ -75,11 +128,30 @@ class PoliceList:
         self, user_id: int, message_timestamp: datetime.datetime
     ) -> None:
         self.users[user_id].track_spam_message(message_timestamp)
+        self.users.move_to_end(user_id)
 
     def track_timeout_message(
         self, user_id: int, message_timestamp: datetime.datetime
     ) -> None:
         self.users[user_id].track_timeout_message(message_timestamp)
+        self.users.move_to_end(user_id)
+
+    def evict_idle_users(self, timestamp: datetime.datetime) -> int:
+        cutoff = timestamp.timestamp() - self.idle_timeout
+        evicted = 0
+
+        for _ in range(len(self.users)):
+            author_id, user_node = next(iter(self.users.items()))
+            if user_node.last_seen >= cutoff:
+                break
+            if user_node.is_in_timeout():
+                # the timeout task still holds this node and releases it later
+                self.users.move_to_end(author_id)
+                continue
+            del self.users[author_id]
+            evicted += 1
+
+        return evicted
 
     def remove_user(self, author_id: int) -> None:
         del self.users[author_id]
@@ -1590,7 +1590,7 @@ class PrestigeBean(Item):
             emoji="🅱️",
             cost=cost,
             value=1,
-            trigger=ItemTrigger.DAILY,
+            trigger=[ItemTrigger.DAILY],
             hide_in_shop=True,
             permanent=True,
         )
@@ -0,0 +1,61 @@
+import copy
+
+from datalayer.types import ItemTrigger
+
+import items
+from items.item import Item
+from items.types import ItemType
+
+
+class ItemCatalog:
+
+    ITEM_CLASSES: dict[ItemType, type[Item]] = {
+        item_type: getattr(items, item_type.value) for item_type in ItemType
+    }
+
+    def __init__(self, prices: dict[ItemType, int | None], version: int = 0):
+        self.prices = dict(prices)
+        self.version = version
+
+        self.items: dict[ItemType, Item] = {
+            item_type: item_class(self.prices.get(item_type))
+            for item_type, item_class in self.ITEM_CLASSES.items()
+        }
+
+        self.catalog_items: tuple[Item, ...] = tuple(
+            sorted(
+                (item for item in self.items.values() if not item.secret),
+                key=lambda x: (x.permanent, x.shop_category.value, x.cost),
+            )
+        )
+        self.shop_items: tuple[Item, ...] = tuple(
+            item for item in self.items.values() if not item.hide_in_shop
+        )
+
+        trigger_index: dict[ItemTrigger, set[ItemType]] = {}
+        for item_type, item in self.items.items():
+            if item.trigger is None:
+                continue
+            for trigger in item.trigger:
+                trigger_index.setdefault(trigger, set()).add(item_type)
+
+        self.trigger_index: dict[ItemTrigger, frozenset[ItemType]] = {
+            trigger: frozenset(item_types)
+            for trigger, item_types in trigger_index.items()
+        }
+
+    def get_item(self, item_type: ItemType) -> Item:
+        # callers are free to modify the returned item, the catalog entry stays intact
+        return copy.copy(self.items[item_type])
+
+    def get_catalog_items(self) -> list[Item]:
+        return [copy.copy(item) for item in self.catalog_items]
+
+    def get_shop_items(self) -> list[Item]:
+        return [copy.copy(item) for item in self.shop_items]
+
+    def get_triggered_types(self, trigger: ItemTrigger) -> frozenset[ItemType]:
+        return self.trigger_index.get(trigger, frozenset())
+
+    def is_activated(self, item_type: ItemType, trigger: ItemTrigger) -> bool:
+        return item_type in self.get_triggered_types(trigger)
@@ -0,0 +1,569 @@
+import argparse
+import time
+
+import combat.enemies as enemies
+import combat.skills.skills as skill_bases
+import numpy as np
+from combat.actors import Opponent
+from combat.combat_formulas import CombatFormulas, DamageReduction, SkillRoll
+from combat.enemies.enemy import Enemy
+from combat.enemies.types import EnemyType
+from combat.equipment import CharacterEquipment
+from combat.gear.gear import Gear, GearBase
+from combat.gear.types import (
+    Base,
+    CharacterAttribute,
+    EquipmentSlot,
+    GearBaseType,
+    GearModifierType,
+    Rarity,
+)
+from combat.skills.skill import Skill
+from combat.skills.types import SkillEffect
+from config import Config
+from control.combat.combat_gear_manager import CombatGearManager
+
+
+class SimulatedSkill:
+
+    def __init__(
+        self,
+        skill: Skill,
+        skill_roll: SkillRoll,
+        damage_reduction: DamageReduction,
+    ):
+        self.skill = skill
+        self.skill_roll = skill_roll
+        self.damage_reduction = damage_reduction
+
+        self.cooldown = skill.base_skill.cooldown
+        self.initial_cooldown = skill.base_skill.initial_cooldown
+        self.aoe = skill.base_skill.aoe
+        self.expected_damage = skill.base_skill.base_value * skill_roll.attack_count
+
+
+class CombatSimulation:
+
+    def __init__(
+        self,
+        enemy: Enemy,
+        level: int,
+        party_size: int,
+        gear_rarity: Rarity,
+        gear_score: float,
+        wins: np.ndarray,
+        rounds: np.ndarray,
+        duration: float,
+    ):
+        self.enemy = enemy
+        self.level = level
+        self.party_size = party_size
+        self.gear_rarity = gear_rarity
+        self.gear_score = gear_score
+        self.wins = wins
+        self.rounds = rounds
+        self.duration = duration
+
+    def get_trial_count(self) -> int:
+        return len(self.wins)
+
+    def get_win_rate(self) -> float:
+        return float(self.wins.mean())
+
+    def get_average_rounds(self) -> float:
+        if not self.wins.any():
+            return float("nan")
+        return float(self.rounds[self.wins].mean())
+
+
+class CombatSimulator:
+
+    MAX_ROUNDS = 30
+    ENEMY_CLASSES: dict[EnemyType, type[Enemy]] = {
+        enemy_type: getattr(enemies, enemy_type.value) for enemy_type in EnemyType
+    }
+    ARMOR_SLOTS = [
+        EquipmentSlot.HEAD,
+        EquipmentSlot.BODY,
+        EquipmentSlot.LEGS,
+        EquipmentSlot.ACCESSORY,
+    ]
+
+    def __init__(self, seed: int = None):
+        self.rng = np.random.default_rng(seed)
+        self.base_index = CombatGearManager.BASE_INDEX
+
+        self.enemies: dict[EnemyType, Enemy] = {
+            enemy_type: enemy_class()
+            for enemy_type, enemy_class in self.ENEMY_CLASSES.items()
+        }
+        # later boss phases only appear through a phase change, never as a spawn
+        self.phase_types = set()
+        for enemy in self.enemies.values():
+            if enemy.phases is not None:
+                self.phase_types.update(enemy.phases)
+
+    def get_enemy_types(self, level: int) -> list[EnemyType]:
+        return [
+            enemy_type
+            for enemy_type, enemy in self.enemies.items()
+            if enemy_type not in self.phase_types
+            and enemy.min_level <= level <= enemy.max_level
+        ]
+
+    def get_gear_bases(self, level: int) -> dict[EquipmentSlot, list[GearBase]]:
+        slot_bases: dict[EquipmentSlot, list[GearBase]] = {}
+        for entry in self.base_index.get_entries_by_lvl(level, exclude_skills=True):
+            base: GearBase = entry.base_class()
+            slot_bases.setdefault(base.slot, []).append(base)
+
+        # the most common drop per slot stands in for a typical character
+        for bases in slot_bases.values():
+            bases.sort(key=lambda x: x.weight, reverse=True)
+        return slot_bases
+
+    def get_expected_modifiers(
+        self, base: GearBase, level: int, rarity: Rarity
+    ) -> dict[GearModifierType, float]:
+        modifiers = {}
+        allowed_modifiers = base.get_allowed_modifiers()
+        modifier_count = CombatGearManager.MODIFIER_COUNT[rarity]
+
+        # random modifiers are weighted by the chance of being picked at all
+        pick_chance = 0
+        if len(allowed_modifiers) > 0:
+            pick_chance = min(1, modifier_count / len(allowed_modifiers))
+
+        for modifier_type in allowed_modifiers + base.modifiers:
+            min_roll, max_roll = CombatGearManager.calculate_modifier_boundaries(
+                base, level, modifier_type
+            )
+            value = (min_roll + max_roll) / 2
+            if modifier_type in base.modifiers:
+                if modifier_type in CombatGearManager.INT_MODIFIERS:
+                    value = int(value)
+            else:
+                value *= pick_chance
+            modifiers[modifier_type] = modifiers.get(modifier_type, 0) + value
+
+        return modifiers
+
+    def create_gear(self, base: GearBase, level: int, rarity: Rarity) -> Gear:
+        return Gear(
+            name="",
+            base=base,
+            rarity=rarity,
+            level=level,
+            modifiers=self.get_expected_modifiers(base, level, rarity),
+            skills=list(base.skills),
+            enchantments=[],
+        )
+
+    def create_equipment(
+        self, level: int, rarity: Rarity, weapon_type: GearBaseType = None
+    ) -> CharacterEquipment:
+        slot_bases = self.get_gear_bases(level)
+
+        weapon_base = slot_bases[EquipmentSlot.WEAPON][0]
+        if weapon_type is not None:
+            weapon_base = self.base_index.entries[weapon_type].base_class()
+
+        gear: dict[EquipmentSlot, list[Gear]] = {}
+        for slot in self.ARMOR_SLOTS:
+            bases = slot_bases.get(slot, [])
+            gear[slot] = [self.create_gear(base, level, rarity) for base in bases[:2]]
+
+        accessories = gear[EquipmentSlot.ACCESSORY] + [None, None]
+
+        return CharacterEquipment(
+            member_id=None,
+            weapon=self.create_gear(weapon_base, level, rarity),
+            head_gear=next(iter(gear[EquipmentSlot.HEAD]), None),
+            body_gear=next(iter(gear[EquipmentSlot.BODY]), None),
+            leg_gear=next(iter(gear[EquipmentSlot.LEGS]), None),
+            accessory_1=accessories[0],
+            accessory_2=accessories[1],
+        )
+
+    def get_gear_score(self, equipment: CharacterEquipment) -> float:
+        gear_scores = [
+            gear.level
+            * CombatGearManager.GEAR_SCORE_ITEM_LEVEL_WEIGHT
+            * CombatGearManager.GEAR_SCORE_RARITY_WEIGHTS[gear.rarity]
+            for gear in equipment.gear
+            if gear.base.base_type == Base.GEAR and gear.rarity != Rarity.DEFAULT
+        ]
+        if len(gear_scores) == 0:
+            return 0
+        return sum(gear_scores) / len(gear_scores)
+
+    def get_character_skills(
+        self, equipment: CharacterEquipment, enemy: Enemy, party_size: int
+    ) -> list[SimulatedSkill]:
+        weapon = equipment.weapon
+        skills = [
+            Skill(
+                base_skill=getattr(skill_bases, skill_type.value)(),
+                rarity=weapon.rarity,
+                level=weapon.level,
+            )
+            for skill_type in weapon.skills
+        ]
+        if len(skills) == 0:
+            return []
+
+        base_dmg_type = skills[0].base_skill.skill_effect
+
+        simulated_skills = []
+        for skill in skills:
+            if skill.base_skill.skill_effect == SkillEffect.HEALING:
+                continue
+            skill_roll = CombatFormulas.get_character_skill_roll(
+                equipment, base_dmg_type, skill, party_size
+            )
+            damage_reduction = CombatFormulas.get_opponent_damage_reduction(
+                enemy, skill.base_skill.skill_effect
+            )
+            simulated_skills.append(SimulatedSkill(skill, skill_roll, damage_reduction))
+
+        # greedy rotation, always the strongest attack that is off cooldown
+        return sorted(simulated_skills, key=lambda x: x.expected_damage, reverse=True)
+
+    def get_opponent_skills(
+        self,
+        enemy: Enemy,
+        level: int,
+        equipment: CharacterEquipment,
+        party_size: int,
+    ) -> list[SimulatedSkill]:
+        skills = [
+            Skill(
+                base_skill=getattr(skill_bases, skill_type.value)(),
+                rarity=Rarity.NORMAL,
+                level=1,
+            )
+            for skill_type in enemy.skill_types
+        ]
+        opponent = Opponent(
+            id=-1,
+            enemy=enemy,
+            level=level,
+            max_hp=0,
+            skills=skills,
+            skill_cooldowns={},
+            skill_stacks_used={},
+            status_effects=[],
+            defeated=False,
+        )
+
+        simulated_skills = []
+        for skill in opponent.skills:
+            skill_roll = CombatFormulas.get_opponent_skill_roll(
+                opponent, skill, party_size
+            )
+            if skill.base_skill.aoe:
+                skill_roll.attack_count = 1
+            damage_reduction = CombatFormulas.get_character_damage_reduction(
+                equipment, skill.base_skill.skill_effect
+            )
+            simulated_skills.append(SimulatedSkill(skill, skill_roll, damage_reduction))
+
+        return sorted(
+            simulated_skills,
+            key=lambda x: x.skill.base_skill.base_value,
+            reverse=True,
+        )
+
+    def is_available(
+        self, skill: SimulatedSkill, used_turns: np.ndarray, turns: np.ndarray
+    ) -> np.ndarray:
+        # mirrors CombatActorManager.get_skill_cooldowns and CharacterSkill.on_cooldown
+        never_used = used_turns < 0
+        if skill.cooldown is None:
+            return np.ones(len(turns), dtype=bool)
+
+        last_used = np.maximum(0, turns - used_turns - 1)
+        available = ~never_used & (last_used >= skill.cooldown)
+
+        if skill.initial_cooldown is not None and skill.initial_cooldown > 0:
+            available |= never_used & (turns >= skill.initial_cooldown)
+        else:
+            available |= never_used
+        return available
+
+    def roll_damage(self, skill: SimulatedSkill, count: int) -> np.ndarray:
+        skill_roll = skill.skill_roll
+        weapon_rolls = self.rng.integers(
+            int(skill_roll.weapon_min_roll),
+            int(skill_roll.weapon_max_roll),
+            size=count,
+            endpoint=True,
+        )
+        critical_modifier = np.where(
+            self.rng.random(count) < skill_roll.crit_rate,
+            skill_roll.critical_modifier,
+            1,
+        )
+
+        values = np.trunc(
+            weapon_rolls
+            * skill_roll.skill_base
+            * skill_roll.modifier
+            * critical_modifier
+        )
+        scaled_values = np.where(
+            values > 0,
+            np.maximum(1, np.trunc(values * skill_roll.encounter_scaling)),
+            0,
+        )
+        return np.trunc(
+            np.maximum(
+                0,
+                scaled_values * skill.damage_reduction.modifier
+                - skill.damage_reduction.flat_reduction,
+            )
+        )
+
+    def character_turn(
+        self,
+        skills: list[SimulatedSkill],
+        acting: np.ndarray,
+        used_turns: np.ndarray,
+        turns: np.ndarray,
+        enemy_hp: np.ndarray,
+    ):
+        chosen = np.full(len(turns), -1)
+        for index, skill in enumerate(skills):
+            available = acting & (chosen < 0)
+            available &= self.is_available(skill, used_turns[:, index], turns)
+            chosen[available] = index
+
+        for index, skill in enumerate(skills):
+            rows = np.flatnonzero(chosen == index)
+            if len(rows) == 0:
+                continue
+            hits = skill.skill_roll.attack_count
+            damage = self.roll_damage(skill, len(rows) * hits)
+            enemy_hp[rows] -= damage.reshape(len(rows), hits).sum(axis=1)
+            used_turns[rows, index] = turns[rows]
+
+    def opponent_turn(
+        self,
+        enemy: Enemy,
+        skills: list[SimulatedSkill],
+        acting: np.ndarray,
+        used_turns: np.ndarray,
+        turns: np.ndarray,
+        character_hp: np.ndarray,
+    ):
+        actions = np.zeros(len(turns), dtype=int)
+        selected = []
+        for index, skill in enumerate(skills):
+            use = acting & (actions < enemy.actions_per_turn)
+            use &= self.is_available(skill, used_turns[:, index], turns)
+            actions += use
+            selected.append(use)
+
+        party_size = character_hp.shape[1]
+        for index, skill in enumerate(skills):
+            use = selected[index]
+            if not use.any():
+                continue
+            used_turns[use, index] = turns[use]
+
+            if skill.aoe:
+                for target in range(party_size):
+                    rows = np.flatnonzero(use & (character_hp[:, target] > 0))
+                    damage = self.roll_damage(skill, len(rows))
+                    character_hp[rows, target] = np.maximum(
+                        0, character_hp[rows, target] - damage
+                    )
+                continue
+
+            for _ in range(skill.skill_roll.attack_count):
+                alive = character_hp > 0
+                rows = np.flatnonzero(use & alive.any(axis=1))
+                if len(rows) == 0:
+                    break
+                target_rolls = self.rng.random((len(rows), party_size))
+                target_rolls[~alive[rows]] = -1
+                targets = target_rolls.argmax(axis=1)
+                damage = self.roll_damage(skill, len(rows))
+                character_hp[rows, targets] = np.maximum(
+                    0, character_hp[rows, targets] - damage
+                )
+
+    def simulate(
+        self,
+        enemy_type: EnemyType,
+        level: int,
+        party_size: int,
+        equipment: CharacterEquipment,
+        trials: int,
+    ) -> CombatSimulation:
+        start = time.perf_counter()
+        enemy = self.enemies[enemy_type]
+
+        character_skills = self.get_character_skills(equipment, enemy, party_size)
+        opponent_skills = self.get_opponent_skills(enemy, level, equipment, party_size)
+
+        enemy_hp = CombatFormulas.get_enemy_health(enemy, level) * self.rng.uniform(
+            0.95, 1.05, size=trials
+        )
+        character_hp = np.full(
+            (trials, party_size),
+            float(equipment.attributes[CharacterAttribute.MAX_HEALTH]),
+        )
+
+        # every END_TURN event advances the cooldown clock of all actors
+        turns = np.zeros(trials, dtype=int)
+        character_used = np.full((party_size, trials, len(character_skills)), -1)
+        opponent_used = np.full((trials, len(opponent_skills)), -1)
+
+        active = np.ones(trials, dtype=bool)
+        wins = np.zeros(trials, dtype=bool)
+        rounds = np.zeros(trials, dtype=int)
+
+        character_initiative = (
+            Config.CHARACTER_BASE_INITIATIVE
+            + equipment.gear_modifiers[GearModifierType.DEXTERITY]
+        )
+        # Encounter sorts the opponent first on equal initiative
+        actors = [None] + list(range(party_size))
+        if character_initiative > enemy.initiative:
+            actors = list(range(party_size)) + [None]
+
+        for round_number in range(1, self.MAX_ROUNDS + 1):
+            for actor in actors:
+                if actor is None:
+                    acting = active.copy()
+                    self.opponent_turn(
+                        enemy,
+                        opponent_skills,
+                        acting,
+                        opponent_used,
+                        turns,
+                        character_hp,
+                    )
+                    turns[acting] += 1
+                    active &= (character_hp > 0).any(axis=1)
+                    continue
+
+                acting = active & (character_hp[:, actor] > 0)
+                self.character_turn(
+                    character_skills, acting, character_used[actor], turns, enemy_hp
+                )
+                turns[acting] += 1
+
+                defeated = active & (enemy_hp <= 0)
+                wins |= defeated
+                rounds[defeated] = round_number
+                active &= ~defeated
+
+            if not active.any():
+                break
+
+        return CombatSimulation(
+            enemy=enemy,
+            level=level,
+            party_size=party_size,
+            gear_rarity=equipment.weapon.rarity,
+            gear_score=self.get_gear_score(equipment),
+            wins=wins,
+            rounds=rounds,
+            duration=time.perf_counter() - start,
+        )
+
+    def get_report(
+        self,
+        simulations: list[CombatSimulation],
+        party_sizes: list[int],
+    ) -> str:
+        rows: dict[tuple[str, int, str, float], dict[int, CombatSimulation]] = {}
+        for simulation in simulations:
+            key = (
+                simulation.enemy.name,
+                simulation.level,
+                simulation.gear_rarity.value,
+                simulation.gear_score,
+            )
+            rows.setdefault(key, {})[simulation.party_size] = simulation
+
+        header = f"{'enemy':<24} {'lvl':>3} {'gear':<10} {'gs':>6}"
+        for party_size in party_sizes:
+            header += f" | {f'{party_size}p win':>8} {'ttk':>5}"
+        lines = [header, "-" * len(header)]
+
+        for (name, level, rarity, gear_score), party_results in rows.items():
+            line = f"{name[:24]:<24} {level:>3} {rarity:<10} {gear_score:>6.1f}"
+            for party_size in party_sizes:
+                if party_size not in party_results:
+                    line += f" | {'-':>8} {'-':>5}"
+                    continue
+                simulation = party_results[party_size]
+                line += (
+                    f" | {simulation.get_win_rate():>8.1%} "
+                    f"{simulation.get_average_rounds():>5.1f}"
+                )
+            lines.append(line)
+
+        return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Simulate combat encounters to balance enemies against gear."
+    )
+    parser.add_argument("--levels", type=int, nargs="+", default=list(range(1, 7)))
+    parser.add_argument("--party-sizes", type=int, nargs="+", default=[1, 2, 3, 4])
+    parser.add_argument(
+        "--rarities",
+        type=Rarity,
+        nargs="+",
+        default=[Rarity.NORMAL, Rarity.MAGIC, Rarity.RARE, Rarity.LEGENDARY],
+    )
+    parser.add_argument(
+        "--enemies", type=EnemyType, nargs="+", default=None, help="enemy class names"
+    )
+    parser.add_argument(
+        "--weapon", type=GearBaseType, default=None, help="weapon base class name"
+    )
+    parser.add_argument("--trials", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    simulator = CombatSimulator(args.seed)
+    simulations = []
+    start = time.perf_counter()
+
+    for level in args.levels:
+        enemy_types = args.enemies
+        if enemy_types is None:
+            enemy_types = simulator.get_enemy_types(level)
+
+        for rarity in args.rarities:
+            equipment = simulator.create_equipment(level, rarity, args.weapon)
+            for enemy_type in enemy_types:
+                enemy = simulator.enemies[enemy_type]
+                for party_size in args.party_sizes:
+                    if party_size > enemy.max_players:
+                        continue
+                    simulations.append(
+                        simulator.simulate(
+                            enemy_type, level, party_size, equipment, args.trials
+                        )
+                    )
+
+    duration = time.perf_counter() - start
+    encounters = sum(simulation.get_trial_count() for simulation in simulations)
+
+    print(simulator.get_report(simulations, args.party_sizes))
+    print()
+    print(
+        f"{encounters} encounters in {duration:.2f}s "
+        f"({encounters / max(duration, 1e-9):.0f}/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
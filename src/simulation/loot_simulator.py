@@ -0,0 +1,292 @@
+import argparse
+import time
+
+import numpy as np
+from combat.gear.droppable import DroppableBase
+from combat.gear.droppable_index import DroppableTable
+from combat.gear.types import Base, Rarity
+from control.combat.combat_gear_manager import CombatGearManager
+
+
+class LootSimulation:
+
+    def __init__(
+        self,
+        item_level: int,
+        bases: list[DroppableBase],
+        base_indices: np.ndarray,
+        rarities: np.ndarray,
+        modifier_values: np.ndarray,
+        gear_scores: np.ndarray,
+        duration: float,
+    ):
+        self.item_level = item_level
+        self.bases = bases
+        self.base_indices = base_indices
+        self.rarities = rarities
+        self.modifier_values = modifier_values
+        self.gear_scores = gear_scores
+        self.duration = duration
+
+    def get_drop_count(self) -> int:
+        return len(self.base_indices)
+
+    def get_skill_mask(self) -> np.ndarray:
+        dropped = self.base_indices >= 0
+        is_skill = np.zeros(self.get_drop_count(), dtype=bool)
+        skill_ids = [
+            index
+            for index, base in enumerate(self.bases)
+            if base.base_type == Base.SKILL
+        ]
+        is_skill[dropped] = np.isin(self.base_indices[dropped], skill_ids)
+        return is_skill
+
+
+class LootSimulator:
+
+    RARITIES = list(CombatGearManager.RARITY_WEIGHTS.keys())
+    MODIFIER_TYPES = list(CombatGearManager.MODIFIER_BASE.keys())
+
+    def __init__(self, seed: int = None):
+        self.rng = np.random.default_rng(seed)
+        self.base_index = CombatGearManager.BASE_INDEX
+
+        # one reference instance per base, only used to read static attributes
+        self.bases: list[DroppableBase] = []
+        self.base_ids: dict[type[DroppableBase], int] = {}
+        for entry in self.base_index.entries.values():
+            self.base_ids[entry.base_class] = len(self.bases)
+            self.bases.append(entry.base_class())
+
+        self.table_cache: dict[int, tuple[np.ndarray, np.ndarray, float]] = {}
+
+    def __get_table_arrays(
+        self, table: DroppableTable
+    ) -> tuple[np.ndarray, np.ndarray, float]:
+        key = id(table)
+        if key not in self.table_cache:
+            base_ids = np.array(
+                [self.base_ids[entry.base_class] for entry in table.entries]
+            )
+            self.table_cache[key] = (
+                base_ids,
+                np.array(table.cum_weights),
+                table.total,
+            )
+        return self.table_cache[key]
+
+    def get_rarity_chances(self, item_level: int) -> np.ndarray:
+        weights = []
+        for rarity, weight in CombatGearManager.RARITY_WEIGHTS.items():
+            weight += item_level * CombatGearManager.RARITY_SCALING[rarity]
+            weight = max(0, weight)
+
+            if CombatGearManager.MIN_RARITY_LVL[rarity] > item_level:
+                weight = 0
+
+            weights.append(weight)
+
+        weights = np.array(weights, dtype=float)
+        return weights / weights.sum()
+
+    def roll_bases(self, item_level: int, count: int) -> np.ndarray:
+        min_level = max(1, int(item_level * CombatGearManager.ITEM_LEVEL_MIN_DROP))
+        drop_levels = self.rng.integers(min_level, item_level + 1, size=count)
+
+        base_indices = np.full(count, -1, dtype=np.int64)
+        for drop_level in np.unique(drop_levels):
+            table = self.base_index.get_table(int(drop_level))
+            if table is None:
+                continue
+
+            rows = np.flatnonzero(drop_levels == drop_level)
+            base_ids, cum_weights, total = self.__get_table_arrays(table)
+            picks = np.searchsorted(
+                cum_weights, self.rng.random(len(rows)) * total, side="right"
+            )
+            base_indices[rows] = base_ids[np.minimum(picks, len(base_ids) - 1)]
+
+        return base_indices
+
+    def roll_rarities(self, item_level: int, count: int) -> np.ndarray:
+        rarities = self.rng.choice(
+            len(self.RARITIES), size=count, p=self.get_rarity_chances(item_level)
+        )
+        # generate_specific_drop downgrades uniques while no base has any
+        unique = self.RARITIES.index(Rarity.UNIQUE)
+        rarities[rarities == unique] = self.RARITIES.index(Rarity.RARE)
+        return rarities
+
+    def roll_modifiers(
+        self, item_level: int, base_indices: np.ndarray, rarities: np.ndarray
+    ) -> np.ndarray:
+        values = np.full(
+            (len(base_indices), len(self.MODIFIER_TYPES)), np.nan, dtype=np.float32
+        )
+        modifier_counts = np.array(
+            [CombatGearManager.MODIFIER_COUNT[rarity] for rarity in self.RARITIES]
+        )[rarities]
+
+        for base_id in np.unique(base_indices):
+            if base_id < 0:
+                continue
+            base = self.bases[base_id]
+            if base.base_type != Base.GEAR:
+                continue
+
+            rows = np.flatnonzero(base_indices == base_id)
+            allowed = base.get_allowed_modifiers()
+
+            # random.sample without replacement, one random permutation per drop
+            order = np.argsort(self.rng.random((len(rows), len(allowed))), axis=1)
+            picked = np.zeros((len(rows), len(allowed)), dtype=bool)
+            counts = np.minimum(modifier_counts[rows], len(allowed))
+            ranks = np.arange(len(allowed))
+            np.put_along_axis(picked, order, ranks < counts[:, None], axis=1)
+
+            for column, modifier_type in enumerate(self.MODIFIER_TYPES):
+                present = np.zeros(len(rows), dtype=bool)
+                if modifier_type in allowed:
+                    present |= picked[:, allowed.index(modifier_type)]
+                if modifier_type in base.modifiers:
+                    present[:] = True
+                if not present.any():
+                    continue
+
+                min_roll, max_roll = CombatGearManager.calculate_modifier_boundaries(
+                    base, item_level, modifier_type
+                )
+                rolls = self.rng.uniform(min_roll, max_roll, size=present.sum())
+                if modifier_type in CombatGearManager.INT_MODIFIERS:
+                    rolls = np.trunc(rolls)
+                values[rows[present], column] = rolls
+
+        return values
+
+    def get_gear_scores(self, item_level: int, rarities: np.ndarray) -> np.ndarray:
+        rarity_weights = np.array(
+            [
+                CombatGearManager.GEAR_SCORE_RARITY_WEIGHTS[rarity]
+                for rarity in self.RARITIES
+            ]
+        )
+        return (
+            item_level
+            * CombatGearManager.GEAR_SCORE_ITEM_LEVEL_WEIGHT
+            * rarity_weights[rarities]
+        )
+
+    def simulate(self, item_level: int, count: int) -> LootSimulation:
+        start = time.perf_counter()
+
+        base_indices = self.roll_bases(item_level, count)
+        rarities = self.roll_rarities(item_level, count)
+        modifier_values = self.roll_modifiers(item_level, base_indices, rarities)
+        gear_scores = self.get_gear_scores(item_level, rarities)
+
+        return LootSimulation(
+            item_level=item_level,
+            bases=self.bases,
+            base_indices=base_indices,
+            rarities=rarities,
+            modifier_values=modifier_values,
+            gear_scores=gear_scores,
+            duration=time.perf_counter() - start,
+        )
+
+    def get_report(self, simulation: LootSimulation, top_bases: int = 10) -> str:
+        count = simulation.get_drop_count()
+        lines = [
+            f"Item level {simulation.item_level}: {count} drops "
+            f"in {simulation.duration:.2f}s"
+        ]
+
+        dropped = simulation.base_indices >= 0
+        is_skill = simulation.get_skill_mask()
+        lines.append(
+            f"  empty {np.mean(~dropped):.2%}, skills {np.mean(is_skill):.2%}, "
+            f"gear {np.mean(dropped & ~is_skill):.2%}"
+        )
+
+        rarity_counts = np.bincount(simulation.rarities, minlength=len(self.RARITIES))
+        lines.append(
+            "  rarity: "
+            + ", ".join(
+                f"{rarity.value} {amount / count:.2%}"
+                for rarity, amount in zip(self.RARITIES, rarity_counts, strict=True)
+                if amount > 0
+            )
+        )
+
+        base_counts = np.bincount(
+            simulation.base_indices[dropped], minlength=len(simulation.bases)
+        )
+        lines.append("  top bases:")
+        for index in np.argsort(base_counts)[::-1][:top_bases]:
+            if base_counts[index] == 0:
+                break
+            base = simulation.bases[index]
+            name = base.name if base.name else base.type.value
+            lines.append(f"    {name:<30} {base_counts[index] / count:.2%}")
+
+        lines.append(
+            f"  {'modifier':<20} {'rolled':>8} {'mean':>9} "
+            f"{'p5':>9} {'p50':>9} {'p95':>9}"
+        )
+        for column, modifier_type in enumerate(self.MODIFIER_TYPES):
+            values = simulation.modifier_values[:, column]
+            values = values[~np.isnan(values)]
+            if len(values) == 0:
+                continue
+            p5, p50, p95 = np.percentile(values, [5, 50, 95])
+            lines.append(
+                f"  {modifier_type.value:<20} {len(values) / count:>8.2%} "
+                f"{values.mean():>9.2f} {p5:>9.2f} {p50:>9.2f} {p95:>9.2f}"
+            )
+
+        return "\n".join(lines)
+
+    def get_gear_score_histogram(
+        self, simulations: list[LootSimulation], bins: int = 10, width: int = 40
+    ) -> str:
+        gear_scores = np.concatenate(
+            [
+                simulation.gear_scores[
+                    (simulation.base_indices >= 0) & ~simulation.get_skill_mask()
+                ]
+                for simulation in simulations
+            ]
+        )
+        counts, edges = np.histogram(gear_scores, bins=bins)
+        scale = width / max(1, counts.max())
+
+        lines = ["Gear score histogram:"]
+        for amount, low, high in zip(counts, edges[:-1], edges[1:], strict=True):
+            lines.append(
+                f"  {low:>7.1f} - {high:>7.1f} {amount:>9} " + "#" * int(amount * scale)
+            )
+        return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate combat loot drops.")
+    parser.add_argument("--levels", type=int, nargs="+", default=list(range(1, 13)))
+    parser.add_argument("--drops", type=int, default=1000000)
+    parser.add_argument("--bins", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    simulator = LootSimulator(args.seed)
+    simulations = []
+    for item_level in args.levels:
+        simulation = simulator.simulate(item_level, args.drops)
+        simulations.append(simulation)
+        print(simulator.get_report(simulation))
+        print()
+
+    print(simulator.get_gear_score_histogram(simulations, bins=args.bins))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,153 +1,196 @@
+import asyncio
 import io
 import os
 import random
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 from bot import CrunchyBot
 from datalayer.quote import Quote
 from PIL import Image, ImageDraw, ImageFont
 
 
+class QuoteBackground:
+
+    def __init__(self, image: Image.Image, dark: bool):
+        self.image = image
+        if dark:
+            self.color_text = "black"
+            self.color_stroke = "white"
+        else:
+            self.color_text = "white"
+            self.color_stroke = "black"
+
+
 class ImageGenerator:
 
+    IMAGES_DARK_PATH = "./img/quote/dark/"
+    IMAGES_LIGHT_PATH = "./img/quote/light/"
+    FONTS_PATH = "./fonts/"
+
     def __init__(self, bot: CrunchyBot):
         self.bot = bot
 
-        images_dark_path = "./img/quote/dark/"
-        images_light_path = "./img/quote/light/"
-        self.fonts_path = "./fonts/"
-
-        images_dark = [
-            os.path.join(images_dark_path, f)
-            for f in os.listdir(images_dark_path)
-            if os.path.isfile(os.path.join(images_dark_path, f))
-        ]
-        images_light = [
-            os.path.join(images_light_path, f)
-            for f in os.listdir(images_light_path)
-            if os.path.isfile(os.path.join(images_light_path, f))
+        self.backgrounds = [
+            self.__load_background(path, dark=True)
+            for path in self.__list_files(self.IMAGES_DARK_PATH)
+        ] + [
+            self.__load_background(path, dark=False)
+            for path in self.__list_files(self.IMAGES_LIGHT_PATH)
         ]
-        self.images = images_dark + images_light
-        self.image = None
 
-        self.fonts = [
-            os.path.join(self.fonts_path, f)
-            for f in os.listdir(self.fonts_path)
-            if os.path.isfile(os.path.join(self.fonts_path, f))
+        self.font_data: dict[str, bytes] = {}
+        for font_path in self.__list_files(self.FONTS_PATH):
+            with open(font_path, "rb") as file:
+                self.font_data[font_path] = file.read()
+        self.fonts = list(self.font_data.keys())
+        self.font_cache: dict[tuple[str, int], ImageFont.FreeTypeFont] = {}
+
+        # fonts and backgrounds are shared between renders, a single worker
+        # keeps them off the event loop without concurrent access to freetype
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ImageGenerator"
+        )
+
+    @staticmethod
+    def __list_files(path: str) -> list[str]:
+        return [
+            os.path.join(path, f)
+            for f in sorted(os.listdir(path))
+            if os.path.isfile(os.path.join(path, f))
         ]
-        self.font_path = None
-        self.font_size = None
-        self.font = None
-        self.anchor = None
-        self.position = None
-        self.align = None
-        self.color_text = None
-        self.color_stroke = None
 
-    def randomize(self):
-        image_path = self.images[random.randrange(len(self.images))]
+    @staticmethod
+    def __load_background(path: str, dark: bool) -> QuoteBackground:
+        with Image.open(path) as image:
+            image.load()
+            return QuoteBackground(image.copy(), dark)
+
+    def get_font(self, font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+        key = (font_path, font_size)
+        if key not in self.font_cache:
+            self.font_cache[key] = ImageFont.truetype(
+                io.BytesIO(self.font_data[font_path]), font_size
+            )
+        return self.font_cache[key]
+
+    @staticmethod
+    def find_font_size(max_size: int, fits) -> int:
+        # largest size in [1, max_size] that fits, text only grows with the size
+        low = 1
+        high = max_size
+        while low < high:
+            size = (low + high + 1) // 2
+            if fits(size):
+                low = size
+            else:
+                high = size - 1
+        return low
 
-        self.image = Image.open(image_path)
+    async def from_quote(self, quote: Quote) -> io.BytesIO:
+        text = self.parse_text(quote)
 
-        if "dark" in image_path:
-            self.color_text = "black"
-            self.color_stroke = "white"
-        else:
-            self.color_text = "white"
-            self.color_stroke = "black"
+        author = self.bot.get_guild(quote.guild_id).get_member(quote.member_id)
+        author_name = quote.member_name if author is None else author.display_name
 
-        self.font_path = self.fonts[random.randrange(len(self.fonts))]
-        self.font_size = self.image.height // 8
-        self.font = ImageFont.truetype(self.font_path, self.font_size)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self.render, text, f"- {author_name}"
+        )
+
+    def render(self, text: str, author_text: str) -> io.BytesIO:
+        background = random.choice(self.backgrounds)
+        image = background.image.copy()
+        font_path = random.choice(self.fonts)
 
         positions = [
             {
                 "anchor": "ma",
-                "pos": (self.image.width // 2, self.image.height // 2),
+                "pos": (image.width // 2, image.height // 2),
                 "align": "center",
             },
             {
                 "anchor": "la",
-                "pos": (self.image.width // 10, self.image.height // 10),
+                "pos": (image.width // 10, image.height // 10),
                 "align": "left",
             },
             # {
             #     'anchor': 'ra',
-            #     'pos': (self.image.width - (self.image.width//10),self.image.height//10),
+            #     'pos': (image.width - (image.width//10),image.height//10),
             #     'align': 'right'
             # }
         ]
 
         position_dict = random.choice(positions)
-        self.anchor = position_dict["anchor"]
-        self.position = position_dict["pos"]
-        self.align = position_dict["align"]
-
-    def from_quote(self, quote: Quote) -> io.BytesIO:
-        self.randomize()
-        text = self.parse_text(quote)
-        guild_id = quote.guild_id
-
-        max_text_width = self.image.width - (self.image.width // 10) * 2
-        max_text_height = int(self.image.height * 1 / 3)
-
-        draw = ImageDraw.Draw(self.image)
-
-        while True:
-            text = self.wrap_text(text, self.font, max_text_width)
-            self.font_size -= 1
-            self.font = ImageFont.truetype(self.font_path, self.font_size)
-            _, top, _, bottom = draw.textbbox(
-                self.position, text, font=self.font, anchor=self.anchor
-            )
-
-            text_height = abs(top - bottom)
-
-            if text_height < max_text_height or self.font_size <= 1:
-                break
+        anchor = position_dict["anchor"]
+        position = position_dict["pos"]
+        align = position_dict["align"]
+
+        max_text_width = image.width - (image.width // 10) * 2
+        max_text_height = int(image.height * 1 / 3)
+
+        draw = ImageDraw.Draw(image)
+
+        layouts: dict[int, tuple[str, int]] = {}
+
+        def get_text_layout(font_size: int) -> tuple[str, int]:
+            if font_size not in layouts:
+                font = self.get_font(font_path, font_size)
+                wrapped_text = self.wrap_text(text, font, max_text_width)
+                _, top, _, bottom = draw.textbbox(
+                    position, wrapped_text, font=font, anchor=anchor
+                )
+                layouts[font_size] = (wrapped_text, abs(top - bottom))
+            return layouts[font_size]
+
+        font_size = self.find_font_size(
+            image.height // 8 - 1,
+            lambda size: get_text_layout(size)[1] < max_text_height,
+        )
+        wrapped_text, text_height = get_text_layout(font_size)
+        font = self.get_font(font_path, font_size)
 
-        stroke_width = self.font_size // 20
+        stroke_width = font_size // 20
 
-        if self.anchor == "ma":
-            self.position = (
-                self.position[0],
-                self.image.height // 2 - text_height // 2,
+        if anchor == "ma":
+            position = (
+                position[0],
+                image.height // 2 - text_height // 2,
             )
 
         draw.multiline_text(
-            self.position,
-            f"{text}",
-            self.color_text,
-            font=self.font,
-            anchor=self.anchor,
-            align=self.align,
+            position,
+            f"{wrapped_text}",
+            background.color_text,
+            font=font,
+            anchor=anchor,
+            align=align,
             stroke_width=stroke_width,
-            stroke_fill=self.color_stroke,
+            stroke_fill=background.color_stroke,
         )
 
-        author_position = (self.image.width - 15, self.image.height - 15)
-        author = self.bot.get_guild(guild_id).get_member(quote.member_id)
-        author_name = quote.member_name if author is None else author.display_name
-
-        author_text = f"- {author_name}"
+        author_position = (image.width - 15, image.height - 15)
 
-        while self.font.getlength(author_text) > (max_text_width // 2):
-            self.font_size -= 1
-            self.font = ImageFont.truetype(self.font_path, self.font_size)
+        author_font_size = self.find_font_size(
+            font_size,
+            lambda size: self.get_font(font_path, size).getlength(author_text)
+            <= (max_text_width // 2),
+        )
+        author_font = self.get_font(font_path, author_font_size)
 
-        # stroke_width = self.font_size//20
+        # stroke_width = font_size//20
         draw.multiline_text(
             author_position,
             author_text,
-            self.color_text,
-            font=self.font,
+            background.color_text,
+            font=author_font,
             anchor="rd",
             stroke_width=stroke_width,
-            stroke_fill=self.color_stroke,
+            stroke_fill=background.color_stroke,
         )
 
         arr = io.BytesIO()
-        self.image.save(arr, format="PNG")
+        image.save(arr, format="PNG")
         arr.seek(0)
         return arr
 